@@ -8,22 +8,38 @@ https://github.com/roihuvaara/hacs_gree_versati
 from __future__ import annotations
 
 from datetime import timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import CONF_MAC, CONF_NAME, CONF_PORT, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
 
 from .client import GreeVersatiClient
-from .const import CONF_IP, DOMAIN, LOGGER
-from .coordinator import GreeVersatiDataUpdateCoordinator
+from .const import (
+    CONF_COMMAND_JOURNAL_TTL,
+    CONF_IP,
+    CONF_OFFLOAD_CODEC,
+    DEFAULT_COMMAND_JOURNAL_TTL,
+    DEFAULT_OFFLOAD_CODEC,
+    DEFAULT_POLL_INTERVAL,
+    DOMAIN,
+    LOGGER,
+)
+from .coordinator import GreeVersatiDataUpdateCoordinator, snapshot_store
 from .data import GreeVersatiData
+from .protocol import shutdown_codec_executor
+from .services import async_setup_services
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
 
     from .data import GreeVersatiConfigEntry
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
     Platform.CLIMATE,
@@ -33,6 +49,12 @@ PLATFORMS: list[Platform] = [
 ]
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Register the integration-wide services."""
+    async_setup_services(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: GreeVersatiConfigEntry) -> bool:
     """
     Set up the Gree Versati integration from a config entry.
@@ -56,7 +78,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: GreeVersatiConfigEntry)
 
     # Create the client using the stored connection parameters and key.
     client = GreeVersatiClient(
-        ip=ip, port=port, mac=mac, key=key, cipher_type=cipher_type
+        ip=ip,
+        port=port,
+        mac=mac,
+        key=key,
+        cipher_type=cipher_type,
+        journal_ttl=entry.options.get(
+            CONF_COMMAND_JOURNAL_TTL, DEFAULT_COMMAND_JOURNAL_TTL
+        ),
+        offload_codec=entry.options.get(CONF_OFFLOAD_CODEC, DEFAULT_OFFLOAD_CODEC),
     )
 
     try:
@@ -75,6 +105,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: GreeVersatiConfigEntry)
             data={**entry.data, "key": client.key, "cipher_type": client.cipher_type},
         )
 
+    @callback
+    def _persist_connection(changes: dict[str, Any]) -> None:
+        """Store a new address or key; the running client already uses it."""
+        hass.config_entries.async_update_entry(entry, data={**entry.data, **changes})
+
+    client.on_connection_change = _persist_connection
+
     # Create the data container first
     data = GreeVersatiData(
         client=client,
@@ -87,7 +124,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: GreeVersatiConfigEntry)
         hass=hass,
         name=DOMAIN,
         logger=LOGGER,
-        update_interval=timedelta(seconds=30),
+        update_interval=timedelta(seconds=DEFAULT_POLL_INTERVAL),
         config_entry=entry,
     )
     LOGGER.debug(
@@ -99,10 +136,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: GreeVersatiConfigEntry)
     entry.runtime_data = data
     LOGGER.debug("Coordinator linked to config entry and runtime data")
 
-    LOGGER.debug("Performing initial data refresh")
-    # Raises ConfigEntryNotReady on failure, so HA retries automatically
-    await coordinator.async_config_entry_first_refresh()
-    LOGGER.debug("Initial data refresh successful")
+    if await coordinator.async_restore_snapshot():
+        # Entities start from the last-known values; the unit is polled
+        # in the background so a slow or offline device never holds up
+        # startup
+        LOGGER.debug("Refreshing restored snapshot in the background")
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} refresh {entry.entry_id}"
+        )
+    else:
+        LOGGER.debug("Performing initial data refresh")
+        # Raises ConfigEntryNotReady on failure, so HA retries automatically
+        await coordinator.async_config_entry_first_refresh()
+        LOGGER.debug("Initial data refresh successful")
 
     # Forward the config entry setup to platforms
     LOGGER.debug("Setting up platforms")
@@ -119,6 +165,10 @@ async def async_reload_entry(
     hass: HomeAssistant, entry: GreeVersatiConfigEntry
 ) -> None:
     """Reload the config entry after an options update."""
+    # Data-only updates (a new address or key found by the client) apply
+    # live
+    if entry.options == entry.runtime_data.coordinator.options:
+        return
     await hass.config_entries.async_reload(entry.entry_id)
 
 
@@ -126,4 +176,19 @@ async def async_unload_entry(
     hass: HomeAssistant, entry: GreeVersatiConfigEntry
 ) -> bool:
     """Unload a config entry (runtime_data is discarded by HA)."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unloaded = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unloaded and not any(
+        other.state in (ConfigEntryState.LOADED, ConfigEntryState.SETUP_IN_PROGRESS)
+        for other in hass.config_entries.async_entries(DOMAIN)
+        if other.entry_id != entry.entry_id
+    ):
+        # No other unit can hold the shared codec pool; stop its threads
+        shutdown_codec_executor()
+    return unloaded
+
+
+async def async_remove_entry(
+    hass: HomeAssistant, entry: GreeVersatiConfigEntry
+) -> None:
+    """Drop the persisted snapshot of a removed entry."""
+    await snapshot_store(hass, entry.entry_id).async_remove()
@@ -3,21 +3,63 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any
+import contextlib
+import time
+from functools import partial
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from .const import (
+    CONF_IP,
     COOLING_MODES,
     DEVICE_MODE_TO_MOD,
     HEATING_MODES,
     LOGGER,
 )
+from .journal import DEVICE_MODE, CommandJournal
 from .protocol import (
     AwhpDevice,
     AwhpProps,
     DeviceInfo,
+    DeviceMetrics,
+    GreeKeyError,
     GreeProtocolError,
+    GreeTimeoutError,
+    find_device,
     search_devices,
+    shared_codec_executor,
 )
+from .protocol.stalls import watch
+from .protocol.tracing import complete, span
+from .scheduler import PRIORITY_COMMAND, PRIORITY_POLL, RequestScheduler
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+    from .profiling import CycleProfiler
+    from .protocol import CycleTiming
+
+_T = TypeVar("_T")
+
+
+# Settle detection after mode changes: first check after 0.5 s, doubling
+# up to 4 s between checks, giving up after 20 s.
+SETTLE_INITIAL_DELAY = 0.5
+SETTLE_MAX_DELAY = 4.0
+SETTLE_TIMEOUT = 20.0
+
+# Readiness probe after connecting: first check at once, then 0.25 s
+# doubling up to 2 s between checks, giving up after 10 s.
+READY_INITIAL_DELAY = 0.25
+READY_MAX_DELAY = 2.0
+READY_TIMEOUT = 10.0
+
+# Liveness probe timeout: a healthy unit answers well within this, so a
+# dead one is detected without waiting out a full status timeout
+PROBE_TIMEOUT = 2.0
+
+# Consecutive timeouts after which the unit is looked up again by MAC,
+# in case DHCP moved it to a new address
+RELOCATE_AFTER_TIMEOUTS = 3
 
 
 class DeviceNotInitializedError(RuntimeError):
@@ -36,16 +78,108 @@ class NoDevicesDiscoveredError(ConnectionError):
         super().__init__("No devices discovered")
 
 
+def plan_device_mode(
+    *, power: bool | None, mod: int | None, target_mod: int | None
+) -> list[dict[AwhpProps, Any]]:
+    """
+    Plan the minimal command steps from the current to a target mode.
+
+    Each step is pushed as its own ``cmd``. The unit only accepts Mod
+    changes while powered off, so the full sequence is OFF -> MODE -> ON;
+    steps that would not change anything are skipped. An unknown power
+    state (None) is treated as on, so the OFF is never skipped by guess.
+    A target of None means power off with Mod left untouched.
+    """
+    if target_mod is None:
+        return [] if power is False else [{AwhpProps.POWER: False}]
+
+    steps: list[dict[AwhpProps, Any]] = []
+    if mod != target_mod:
+        if power is not False:
+            steps.append({AwhpProps.POWER: False})
+        steps.append({AwhpProps.MODE: target_mod})
+    if steps or power is not True:
+        steps.append({AwhpProps.POWER: True})
+    return steps
+
+
+class ClientTransaction:
+    """
+    Property changes collected for one commit to the device.
+
+    Obtained from GreeVersatiClient.transaction(); nothing is sent until
+    the context exits without an error. ``changes`` holds the expected
+    outcome in coordinator data keys, for optimistic publishing;
+    ``journaled`` is set when the unit was unreachable and the changes
+    were kept for replay instead (see GreeVersatiClient's journal).
+    """
+
+    def __init__(self, client: GreeVersatiClient) -> None:
+        """Initialize an empty transaction."""
+        self._client = client
+        self.device_mode: str | None = None
+        self.writes: dict[AwhpProps, Any] = {}
+        self.changes: dict[str, Any] = {}
+        self.journaled = False
+
+    @property
+    def is_empty(self) -> bool:
+        """Return true if nothing was staged."""
+        return self.device_mode is None and not self.writes
+
+    def _write(self, prop: AwhpProps, value: Any, data_key: str) -> None:
+        self.writes[prop] = value
+        self.changes[data_key] = value
+
+    def set_device_mode(self, mode: str) -> None:
+        """Stage a combined device mode (see DEVICE_MODE_TO_MOD)."""
+        normalized_mode = (mode or "").strip().lower()
+        if normalized_mode not in DEVICE_MODE_TO_MOD:
+            error_msg = f"Unsupported device mode: {mode}"
+            raise ValueError(error_msg)
+        self.device_mode = normalized_mode
+
+        target_mod = DEVICE_MODE_TO_MOD[normalized_mode]
+        self.changes["power"] = target_mod is not None
+        if target_mod is not None:
+            self.changes["mode"] = target_mod
+
+    def set_temperature(self, temperature: float, mode: str | None = None) -> None:
+        """Stage a space heating or cooling setpoint."""
+        if mode is None:
+            mode = self._client.hvac_mode
+        if mode == "heat":
+            self._write(AwhpProps.HEAT_TEMP_SET, int(temperature), "heat_temp_set")
+        elif mode == "cool":
+            self._write(AwhpProps.COOL_TEMP_SET, int(temperature), "cool_temp_set")
+
+    def set_dhw_temperature(self, temperature: float) -> None:
+        """Stage the DHW setpoint."""
+        self._write(
+            AwhpProps.HOT_WATER_TEMP_SET, int(temperature), "hot_water_temp_set"
+        )
+
+    def set_dhw_mode(self, mode: str) -> None:
+        """Stage the DHW boost flag ("performance" or "normal")."""
+        if mode in ("performance", "normal"):
+            self._write(
+                AwhpProps.FAST_HEAT_WATER, mode == "performance", "fast_heat_water"
+            )
+
+
 class GreeVersatiClient:
     """Facade class to manage communication with the device."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913 - connection parameters, all optional
         self,
         ip: str | None = None,
         port: int | None = None,
         mac: str | None = None,
         key: str | None = None,
         cipher_type: str | None = None,
+        journal_ttl: float = 0,
+        *,
+        offload_codec: bool = False,
     ) -> None:
         """
         Initialize the Gree Versati client.
@@ -56,6 +190,10 @@ class GreeVersatiClient:
             mac: The MAC address of the device
             key: The encryption key for the device
             cipher_type: The negotiated cipher scheme ("ecb" or "gcm")
+            journal_ttl: Seconds to hold commands for an unreachable unit
+                and replay them once it answers again (0 disables)
+            offload_codec: Run packet encryption and decoding in a shared
+                worker thread pool instead of on the event loop
 
         """
         self.ip = ip
@@ -63,9 +201,26 @@ class GreeVersatiClient:
         self.mac = mac
         self.key = key
         self.cipher_type = cipher_type
+        self.offload_codec = offload_codec
         self.device: AwhpDevice | None = None
+        # Outlives the device object, which is re-created on initialize
+        self.metrics = DeviceMetrics()
         self._data: dict[str, Any] = {}  # Add cache for device data
-        self._mode_change_lock = asyncio.Lock()
+        # Single in-flight exchange per unit; commands preempt polls
+        self._scheduler = RequestScheduler()
+        self._timeouts = 0
+        self._journal = CommandJournal(journal_ttl) if journal_ttl > 0 else None
+        # Called with changed config entry data (a new address or key)
+        # found while recovering from failures
+        self.on_connection_change: Callable[[dict[str, Any]], None] | None = None
+        # Set by the profile service for the next few polls and commands
+        self.profiler: CycleProfiler | None = None
+
+    def profiled(self, kind: str) -> contextlib.AbstractContextManager[None]:
+        """Return a context profiling a poll or command, if one is due."""
+        if self.profiler is None:
+            return contextlib.nullcontext()
+        return self.profiler.cycle(kind)
 
     async def async_get_data(self) -> dict[str, Any]:
         """Fetch data from the device."""
@@ -75,52 +230,26 @@ class GreeVersatiClient:
 
         try:
             LOGGER.debug("Starting data fetch from device")
-            # Never poll mid mode-change: the unit power-cycles while
-            # switching Mod and would report transitional values
-            async with self._mode_change_lock:
-                raw_data = await self.device.get_all_properties()
-            LOGGER.debug("Raw data from device: %s", raw_data)
-
-            # Add debug logging for each temperature calculation
-            water_out_temp = self.device.t_water_out_pe(raw_data)
-            LOGGER.debug("Water out temp: %s", water_out_temp)
-
-            water_in_temp = self.device.t_water_in_pe(raw_data)
-            LOGGER.debug("Water in temp: %s", water_in_temp)
-
-            hot_water_temp = self.device.hot_water_temp(raw_data)
-            LOGGER.debug("Hot water temp: %s", hot_water_temp)
-
-            opt_water_temp = self.device.t_opt_water(raw_data)
-            LOGGER.debug("Optimal water temp: %s", opt_water_temp)
-
-            self._data = {
-                # Current temperatures using helper methods with raw data
-                "water_out_temp": water_out_temp,
-                "water_in_temp": water_in_temp,
-                "hot_water_temp": hot_water_temp,
-                "opt_water_temp": opt_water_temp,
-                # Target temperatures (these are already in correct format)
-                "heat_temp_set": raw_data.get(AwhpProps.HEAT_TEMP_SET.value),
-                "cool_temp_set": raw_data.get(AwhpProps.COOL_TEMP_SET.value),
-                "hot_water_temp_set": raw_data.get(AwhpProps.HOT_WATER_TEMP_SET.value),
-                # Operation modes and states
-                "power": raw_data.get(AwhpProps.POWER.value),
-                "mode": raw_data.get(AwhpProps.MODE.value),
-                "fast_heat_water": raw_data.get(AwhpProps.FAST_HEAT_WATER.value),
-                # Status indicators
-                "tank_heater_status": raw_data.get(AwhpProps.TANK_HEATER_STATUS.value),
-                "defrosting_status": raw_data.get(
-                    AwhpProps.SYSTEM_DEFROSTING_STATUS.value
-                ),
-                "hp_heater_1_status": raw_data.get(AwhpProps.HP_HEATER_1_STATUS.value),
-                "hp_heater_2_status": raw_data.get(AwhpProps.HP_HEATER_2_STATUS.value),
-                "frost_protection": raw_data.get(
-                    AwhpProps.AUTOMATIC_FROST_PROTECTION.value
-                ),
-                # Device information
-                "versati_series": raw_data.get(AwhpProps.VERSATI_SERIES.value),
-            }
+            # Polls queue behind commands (never mid mode-change: the unit
+            # power-cycles while switching Mod and would report
+            # transitional values), a poll in flight yields to a command,
+            # and a poll requested while one is pending shares its result
+            with self.metrics.timing("poll") as cycle, span("client.poll"):
+                raw_data = await self._async_recovering(
+                    partial(
+                        self._async_run_timed,
+                        cycle,
+                        PRIORITY_POLL,
+                        self.device.get_all_properties,
+                        key="poll",
+                        preemptible=True,
+                    )
+                )
+                started = time.monotonic()
+                with watch("decode"):
+                    self._data = self._decode(raw_data)
+                cycle.add("decode", time.monotonic() - started)
+                complete("client.decode", started)
 
             LOGGER.debug("Processed data: %s", self._data)
             return self._data
@@ -130,6 +259,55 @@ class GreeVersatiClient:
             error_msg = f"Failed to fetch device data: {exc}"
             raise RuntimeError(error_msg) from exc
 
+    def _decode(self, raw_data: dict[str, Any]) -> dict[str, Any]:
+        """Turn raw device properties into the coordinator's data."""
+        if self.device is None:
+            raise DeviceNotInitializedError
+
+        LOGGER.debug("Raw data from device: %s", raw_data)
+
+        # Add debug logging for each temperature calculation
+        water_out_temp = self.device.t_water_out_pe(raw_data)
+        LOGGER.debug("Water out temp: %s", water_out_temp)
+
+        water_in_temp = self.device.t_water_in_pe(raw_data)
+        LOGGER.debug("Water in temp: %s", water_in_temp)
+
+        hot_water_temp = self.device.hot_water_temp(raw_data)
+        LOGGER.debug("Hot water temp: %s", hot_water_temp)
+
+        opt_water_temp = self.device.t_opt_water(raw_data)
+        LOGGER.debug("Optimal water temp: %s", opt_water_temp)
+
+        return {
+            # Current temperatures using helper methods with raw data
+            "water_out_temp": water_out_temp,
+            "water_in_temp": water_in_temp,
+            "hot_water_temp": hot_water_temp,
+            "opt_water_temp": opt_water_temp,
+            # Target temperatures (these are already in correct format)
+            "heat_temp_set": raw_data.get(AwhpProps.HEAT_TEMP_SET.value),
+            "cool_temp_set": raw_data.get(AwhpProps.COOL_TEMP_SET.value),
+            "hot_water_temp_set": raw_data.get(AwhpProps.HOT_WATER_TEMP_SET.value),
+            # Operation modes and states
+            "power": raw_data.get(AwhpProps.POWER.value),
+            "mode": raw_data.get(AwhpProps.MODE.value),
+            "fast_heat_water": raw_data.get(AwhpProps.FAST_HEAT_WATER.value),
+            # Status indicators
+            "tank_heater_status": raw_data.get(AwhpProps.TANK_HEATER_STATUS.value),
+            "defrosting_status": raw_data.get(AwhpProps.SYSTEM_DEFROSTING_STATUS.value),
+            "hp_heater_1_status": raw_data.get(AwhpProps.HP_HEATER_1_STATUS.value),
+            "hp_heater_2_status": raw_data.get(AwhpProps.HP_HEATER_2_STATUS.value),
+            "frost_protection": raw_data.get(
+                AwhpProps.AUTOMATIC_FROST_PROTECTION.value
+            ),
+            # Device information
+            "versati_series": raw_data.get(AwhpProps.VERSATI_SERIES.value),
+            # Seconds since the oldest value arrived; grows when a
+            # status batch was lost and last-known values were kept
+            "data_age": self.device.age(AwhpProps),
+        }
+
     async def initialize(self) -> None:
         """
         Initialize the device connection.
@@ -149,7 +327,11 @@ class GreeVersatiClient:
             )
             device_info = DeviceInfo(self.ip, self.port, self.mac, name=self.mac)
             self.device = AwhpDevice(
-                device_info, key=self.key, cipher_type=self.cipher_type
+                device_info,
+                key=self.key,
+                cipher_type=self.cipher_type,
+                codec_executor=shared_codec_executor() if self.offload_codec else None,
+                metrics=self.metrics,
             )
 
             try:
@@ -167,6 +349,7 @@ class GreeVersatiClient:
             devices = await self.run_discovery()
             if devices:
                 self.device = devices[0]
+                self.device.metrics = self.metrics
             else:
                 raise NoDevicesDiscoveredError
 
@@ -225,87 +408,395 @@ class GreeVersatiClient:
 
     async def set_temperature(
         self, temperature: float, mode: str | None = None
-    ) -> None:
-        """Set the target temperature."""
+    ) -> bool:
+        """Set the target temperature; return False if held for replay."""
         if self.device is None:
             raise DeviceNotInitializedError
 
-        if mode == "heat" or (mode is None and self.hvac_mode == "heat"):
-            self.device.set_property(AwhpProps.HEAT_TEMP_SET, int(temperature))
-        elif mode == "cool" or (mode is None and self.hvac_mode == "cool"):
-            self.device.set_property(AwhpProps.COOL_TEMP_SET, int(temperature))
-
-        await self.device.push_state_update()
+        async with self.transaction() as transaction:
+            transaction.set_temperature(temperature, mode)
+        if transaction.journaled:
+            return False
         await self.async_get_data()
+        return True
 
-    async def set_dhw_temperature(self, temperature: float) -> None:
-        """Set the target DHW temperature."""
+    async def set_dhw_temperature(self, temperature: float) -> bool:
+        """Set the target DHW temperature; return False if held for replay."""
         if self.device is None:
             raise DeviceNotInitializedError
 
-        self.device.set_property(AwhpProps.HOT_WATER_TEMP_SET, int(temperature))
-        await self.device.push_state_update()
+        async with self.transaction() as transaction:
+            transaction.set_dhw_temperature(temperature)
+        if transaction.journaled:
+            return False
         await self.async_get_data()
+        return True
 
-    async def set_hvac_mode(self, mode: str) -> None:
+    async def set_hvac_mode(self, mode: str) -> bool:
         """Set space heating/cooling mode (delegates to set_device_mode)."""
-        await self.set_device_mode(mode)
+        return await self.set_device_mode(mode)
 
-    async def set_dhw_mode(self, mode: str) -> None:
-        """Set the DHW mode."""
+    async def set_dhw_mode(self, mode: str) -> bool:
+        """Set the DHW mode; return False if held for replay."""
         if self.device is None:
             raise DeviceNotInitializedError
 
-        if mode == "performance":
-            self.device.set_property(AwhpProps.FAST_HEAT_WATER, value=True)
-        elif mode == "normal":
-            self.device.set_property(AwhpProps.FAST_HEAT_WATER, value=False)
-
-        await self.device.push_state_update()
+        async with self.transaction() as transaction:
+            transaction.set_dhw_mode(mode)
+        if transaction.journaled:
+            return False
         await self.async_get_data()
+        return True
 
-    async def set_device_mode(self, mode: str) -> None:
+    async def set_device_mode(self, mode: str) -> bool:
         """
-        Set the combined device mode by writing the Mod property.
+        Set the combined device mode (a single-change transaction).
 
-        The six logical modes map directly to device Mod values (see
-        DEVICE_MODE_TO_MOD); hot-water participation is part of Mod, not a
-        separate flag. The device only accepts Mod changes while powered
-        off (the official app enforces the same OFF -> MODE -> ON
-        sequence), so each step is pushed as a separate state update.
+        Returns False if the unit was unreachable and the change is held
+        for replay.
         """
         if self.device is None:
             raise DeviceNotInitializedError
 
-        normalized_mode = (mode or "").strip().lower()
-        if normalized_mode not in DEVICE_MODE_TO_MOD:
-            error_msg = f"Unsupported device mode: {mode}"
-            raise ValueError(error_msg)
-        target_mod = DEVICE_MODE_TO_MOD[normalized_mode]
+        async with self.transaction() as transaction:
+            transaction.set_device_mode(mode)
+        return not transaction.journaled
+
+    @contextlib.asynccontextmanager
+    async def transaction(self) -> AsyncIterator[ClientTransaction]:
+        """
+        Collect property changes and commit them together on exit.
+
+        Usage::
+
+            async with client.transaction() as tx:
+                tx.set_device_mode("heat_hot_water")
+                tx.set_dhw_mode("performance")
+
+        The commit runs as one scheduler job (no poll can interleave) and
+        sends the fewest ``cmd`` packets the unit's sequencing rules
+        allow. If the block raises, nothing is sent.
+        """
+        transaction = ClientTransaction(self)
+        yield transaction
+        await self._async_commit(transaction)
+
+    def _stage(self, prop: AwhpProps, value: Any) -> None:
+        """Stage one write on the device (booleans go by keyword)."""
+        if self.device is None:
+            raise DeviceNotInitializedError
+        if isinstance(value, bool):
+            self.device.set_property(prop, value=value)
+        else:
+            self.device.set_property(prop, value)
+
+    async def _async_read_power_mode(self) -> tuple[bool | None, int | None]:
+        """
+        Read just Pow and Mod from the unit in one small status exchange.
+
+        The cached snapshot may be a full poll interval old; planning from
+        it could send redundant power-off or Mod writes.
+        """
+        if self.device is None:
+            raise DeviceNotInitializedError
+        raw = await self.device.get_properties((AwhpProps.POWER, AwhpProps.MODE))
+        power = raw.get(AwhpProps.POWER.value)
+        return (None if power is None else bool(power)), raw.get(AwhpProps.MODE.value)
+
+    async def async_probe(self) -> float:
+        """
+        Check the unit answers with one single-column status exchange.
+
+        Uses a short timeout and returns the round-trip time; raises
+        GreeTimeoutError when the unit stays silent.
+        """
+        if self.device is None:
+            raise DeviceNotInitializedError
+        rtt = await self._async_recovering(
+            partial(
+                self._scheduler.run,
+                PRIORITY_POLL,
+                partial(self.device.probe, PROBE_TIMEOUT),
+                key="probe",
+            )
+        )
+        LOGGER.debug("Liveness probe answered in %.3fs", rtt)
+        return rtt
+
+    async def _async_recovering(self, factory: Callable[[], Awaitable[_T]]) -> _T:
+        """
+        Run a device read, recovering from a moved unit or a stale key.
+
+        A response under a foreign key renegotiates the key at once;
+        repeated timeouts look the unit up again (see _async_recover).
+        After a successful recovery the read is retried immediately,
+        otherwise the original error propagates as usual.
+        """
+        try:
+            result = await factory()
+        except GreeKeyError:
+            if not await self.async_rebind():
+                raise
+            result = await factory()
+        except GreeTimeoutError:
+            self._timeouts += 1
+            if self._timeouts < RELOCATE_AFTER_TIMEOUTS:
+                raise
+            self._timeouts = 0
+            if not await self._async_recover():
+                raise
+            result = await factory()
+        self._timeouts = 0
+        if self._journal:
+            await self._async_replay_journal()
+        return result
+
+    async def _async_run_timed(
+        self,
+        cycle: CycleTiming,
+        priority: int,
+        factory: Callable[[], Awaitable[_T]],
+        **kwargs: Any,
+    ) -> _T:
+        """Run a scheduler job, charging its queue wait and exchanges to cycle."""
+        queued = time.monotonic()
+
+        async def job() -> _T:
+            nonlocal queued
+            cycle.add("queue_wait", time.monotonic() - queued)
+            complete("client.queue_wait", queued, kind=cycle.kind)
+            self.metrics.cycle = cycle
+            try:
+                return await factory()
+            finally:
+                self.metrics.cycle = None
+                # A preempted job waits in line again
+                queued = time.monotonic()
+
+        return await self._scheduler.run(priority, job, **kwargs)
+
+    async def _async_recover(self) -> bool:
+        """
+        Work out why the unit stopped answering, and fix it if possible.
 
-        async with self._mode_change_lock:
-            current_power = bool(self._data.get("power", False))
-            current_mod = self._data.get("mode")
+        The unit is looked up by MAC. If it answers from a new address
+        (DHCP moved it) the bound device follows it there, keeping the
+        stored key. If it answers scans at its old address but ignores
+        our requests, it was reset or re-paired and a new key is
+        negotiated. Returns whether a retry is worthwhile.
+        """
+        if self.device is None or not self.mac:
+            return False
+        current = self.device.device_info
+        info = await find_device(self.mac, current.ip, current.port)
+        if info is None:
+            LOGGER.debug("Device %s did not answer a scan", self.mac)
+            return False
+        if info.ip == current.ip:
+            LOGGER.info("Device %s ignores requests, renegotiating its key", self.mac)
+            return await self.async_rebind()
+
+        LOGGER.info("Device %s moved from %s to %s", self.mac, self.ip, info.ip)
+        self.ip = current.ip = info.ip
+        self._connection_changed({CONF_IP: info.ip})
+        return True
+
+    async def async_rebind(self) -> bool:
+        """Negotiate a new device key and publish it; return whether it worked."""
+        if self.device is None:
+            return False
+        try:
+            await self._scheduler.run(PRIORITY_COMMAND, self.device.rebind)
+        except GreeProtocolError as exc:
+            LOGGER.warning("Could not renegotiate the key of %s: %s", self.mac, exc)
+            return False
+        self.key = self.device.key
+        self.cipher_type = self.device.cipher_type
+        LOGGER.info("Renegotiated the key of %s", self.mac)
+        self._connection_changed({"key": self.key, "cipher_type": self.cipher_type})
+        return True
+
+    def _connection_changed(self, changes: dict[str, Any]) -> None:
+        """Hand changed connection parameters to whoever persists them."""
+        if self.on_connection_change is not None:
+            self.on_connection_change(changes)
+
+    async def async_wait_until_ready(
+        self,
+        timeout: float = READY_TIMEOUT,  # noqa: ASYNC109 - plain deadline
+    ) -> bool:
+        """
+        Wait until the unit answers status requests with real values.
+
+        Right after binding the unit may answer with every column empty.
+        Only Pow and Mod are polled, with short exponential backoff, so
+        the first full poll is not wasted. Returns whether the unit
+        answered with values within the timeout.
+
+        A unit that never answered at all raises the last error instead,
+        so an offline unit fails fast rather than also costing a full
+        poll's timeout. The reads recover like polls do, so a unit that
+        moved or lost its key while Home Assistant was down is found
+        again here.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = READY_INITIAL_DELAY
+        answered = False
+        last_error: GreeProtocolError | None = None
+
+        while True:
+            try:
+                power, mod = await self._async_recovering(
+                    partial(
+                        self._scheduler.run, PRIORITY_POLL, self._async_read_power_mode
+                    )
+                )
+            except GreeProtocolError as exc:
+                LOGGER.debug("Readiness check failed: %s", exc)
+                last_error = exc
+            else:
+                answered = True
+                if power is not None or mod is not None:
+                    LOGGER.debug("Device ready")
+                    return True
+            if (remaining := deadline - loop.time()) <= 0:
+                break
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, READY_MAX_DELAY)
+
+        if not answered and last_error is not None:
+            raise last_error
+        LOGGER.debug("Device not ready within %ss", timeout)
+        return False
+
+    async def async_wait_for_mode(
+        self,
+        mode: str,
+        timeout: float = SETTLE_TIMEOUT,  # noqa: ASYNC109 - plain deadline
+    ) -> bool:
+        """
+        Wait until the unit reports the given device mode as settled.
 
-            # Turning off: power off only, leave Mod untouched
+        After a mode change the unit power-cycles and reports transitional
+        Pow/Mod values for a while. Only those two columns are polled,
+        with short exponential backoff, until they match the target or
+        the timeout passes. Returns whether the unit settled in time.
+        """
+        if self.device is None:
+            raise DeviceNotInitializedError
+        target_mod = DEVICE_MODE_TO_MOD[mode]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = SETTLE_INITIAL_DELAY
+
+        while (remaining := deadline - loop.time()) > 0:
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, SETTLE_MAX_DELAY)
+            try:
+                power, mod = await self._scheduler.run(
+                    PRIORITY_POLL, self._async_read_power_mode
+                )
+            except GreeProtocolError as exc:
+                LOGGER.debug("Settle check failed: %s", exc)
+                continue
             if target_mod is None:
-                self.device.set_property(AwhpProps.POWER, value=False)
-                await self.device.push_state_update()
-                # Optimistic cache update; the unit reports transitional
-                # values right after a command, so polling now would lie
-                self._data = {**self._data, "power": False}
-                return
-
-            if current_mod != target_mod:
-                # Power off first (own push, so the OFF reaches the device
-                # before the mode change)
-                if current_power:
-                    self.device.set_property(AwhpProps.POWER, value=False)
-                    await self.device.push_state_update()
-
-                self.device.set_property(AwhpProps.MODE, target_mod)
-                await self.device.push_state_update()
-
-            self.device.set_property(AwhpProps.POWER, value=True)
+                settled = power is False
+            else:
+                settled = power is True and mod == target_mod
+            if settled:
+                LOGGER.debug("Device settled in mode %s", mode)
+                return True
+
+        LOGGER.debug("Device did not settle in mode %s within %ss", mode, timeout)
+        return False
+
+    async def _async_commit(self, transaction: ClientTransaction) -> None:
+        """
+        Send a transaction's changes to the device.
+
+        The device only accepts Mod changes while powered off (the
+        official app enforces the same OFF -> MODE -> ON sequence), so a
+        mode change takes up to three separately pushed packets (see
+        plan_device_mode, fed with freshly read Pow/Mod); every other
+        write rides along with the final packet. Without a mode change
+        all writes go out as a single ``cmd``.
+        """
+        if self.device is None:
+            raise DeviceNotInitializedError
+        if transaction.is_empty:
+            return
+
+        try:
+            with (
+                self.profiled("command"),
+                self.metrics.timing("command") as cycle,
+                span("client.command"),
+            ):
+                await self._async_run_timed(
+                    cycle, PRIORITY_COMMAND, partial(self._async_send, transaction)
+                )
+        except GreeTimeoutError:
+            if self._journal is None:
+                raise
+            entries: dict[Any, Any] = dict(transaction.writes)
+            if transaction.device_mode is not None:
+                entries[DEVICE_MODE] = transaction.device_mode
+            self._journal.record(entries, time.monotonic())
+            transaction.journaled = True
+            LOGGER.info(
+                "Device %s unreachable, holding %s for replay", self.mac, entries
+            )
+
+    async def _async_replay_journal(self) -> None:
+        """Send everything the journal holds as one transaction."""
+        if self._journal is None:
+            return
+        entries = self._journal.pending(time.monotonic())
+        if not entries:
+            return
+
+        transaction = ClientTransaction(self)
+        writes = dict(entries)
+        transaction.device_mode = writes.pop(DEVICE_MODE, None)
+        transaction.writes = writes
+        LOGGER.info("Device %s answers again, replaying %s", self.mac, entries)
+        try:
+            with self.metrics.timing("replay") as cycle:
+                await self._async_run_timed(
+                    cycle, PRIORITY_COMMAND, partial(self._async_send, transaction)
+                )
+        except GreeProtocolError as exc:
+            LOGGER.debug("Replay failed, keeping the journal: %s", exc)
+        else:
+            self._journal.discard(entries)
+
+    async def _async_send(self, transaction: ClientTransaction) -> None:
+        """Plan and push a transaction (runs as a scheduler job)."""
+        if self.device is None:
+            raise DeviceNotInitializedError
+
+        steps: list[dict[AwhpProps, Any]] = []
+        if transaction.device_mode is not None:
+            power, mod = await self._async_read_power_mode()
+            steps = plan_device_mode(
+                power=power,
+                mod=mod,
+                target_mod=DEVICE_MODE_TO_MOD[transaction.device_mode],
+            )
+        LOGGER.debug("Planned mode steps: %s", steps)
+
+        # Every other write rides along with the final packet
+        if transaction.writes:
+            if not steps:
+                steps.append({})
+            steps[-1] = {**transaction.writes, **steps[-1]}
+
+        for step in steps:
+            for prop, value in step.items():
+                self._stage(prop, value)
             await self.device.push_state_update()
-            self._data = {**self._data, "power": True, "mode": target_mod}
+
+        # Optimistic cache update; the unit reports transitional
+        # values right after a command, so polling now would lie
+        self._data = {**self._data, **transaction.changes}
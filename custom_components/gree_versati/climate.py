@@ -149,8 +149,9 @@ class GreeVersatiClimate(GreeVersatiEntity, ClimateEntity):
         elif self.hvac_mode == HVACMode.COOL:
             mode = "cool"
 
-        await self._client.set_temperature(temperature, mode=mode)
-        if mode is not None:
+        # A command held for replay (unit unreachable) is not published
+        sent = await self._client.set_temperature(temperature, mode=mode)
+        if sent and mode is not None:
             self.coordinator.async_apply_optimistic(
                 **{f"{mode}_temp_set": int(temperature)}
             )
@@ -172,7 +173,9 @@ class GreeVersatiClimate(GreeVersatiEntity, ClimateEntity):
         else:
             combined = "off"
 
-        await self._client.set_device_mode(combined)
+        if not await self._client.set_device_mode(combined):
+            # Held for replay: the unit is unreachable, nothing to settle
+            return
         # Publish the expected state; the unit reports transitional values
         # right after a mode change, so an immediate poll would lie
         self.coordinator.async_apply_optimistic_device_mode(combined)
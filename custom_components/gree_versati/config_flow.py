@@ -10,6 +10,7 @@ from homeassistant import config_entries
 from homeassistant.const import CONF_MAC, CONF_NAME, CONF_PORT
 from homeassistant.core import callback
 from homeassistant.helpers.selector import (
+    BooleanSelector,
     NumberSelector,
     NumberSelectorConfig,
     NumberSelectorMode,
@@ -17,20 +18,37 @@ from homeassistant.helpers.selector import (
 
 from .client import GreeVersatiClient
 from .const import (
+    COMMAND_JOURNAL_TTL_HIGHEST,
+    CONF_COMMAND_JOURNAL_TTL,
     CONF_COOL_TEMP_MAX,
     CONF_COOL_TEMP_MIN,
     CONF_DHW_TEMP_MAX,
     CONF_DHW_TEMP_MIN,
+    CONF_GRACE_FAILURES,
+    CONF_GRACE_PERIOD,
     CONF_HEAT_TEMP_MAX,
     CONF_HEAT_TEMP_MIN,
     CONF_IP,
+    CONF_OFFLOAD_CODEC,
+    CONF_POLL_INTERVAL_MAX,
+    CONF_POLL_INTERVAL_MIN,
     COOL_TEMP_MAX,
     COOL_TEMP_MIN,
+    DEFAULT_COMMAND_JOURNAL_TTL,
+    DEFAULT_GRACE_FAILURES,
+    DEFAULT_GRACE_PERIOD,
+    DEFAULT_OFFLOAD_CODEC,
+    DEFAULT_POLL_INTERVAL_MAX,
+    DEFAULT_POLL_INTERVAL_MIN,
     DHW_TEMP_MAX,
     DHW_TEMP_MIN,
     DOMAIN,
+    GRACE_FAILURES_HIGHEST,
+    GRACE_PERIOD_HIGHEST,
     HEAT_TEMP_MAX,
     HEAT_TEMP_MIN,
+    POLL_INTERVAL_HIGHEST,
+    POLL_INTERVAL_LOWEST,
 )
 from .naming import sanitize_device_name
 
@@ -53,6 +71,28 @@ def _temperature_selector(low: int, high: int) -> NumberSelector:
     )
 
 
+def _seconds_selector(
+    low: int = POLL_INTERVAL_LOWEST, high: int = POLL_INTERVAL_HIGHEST
+) -> NumberSelector:
+    """Build a seconds number box (poll interval bounds by default)."""
+    return NumberSelector(
+        NumberSelectorConfig(
+            min=low,
+            max=high,
+            step=1,
+            unit_of_measurement="s",
+            mode=NumberSelectorMode.BOX,
+        )
+    )
+
+
+def _count_selector(high: int) -> NumberSelector:
+    """Build a plain counter box from 0 to high."""
+    return NumberSelector(
+        NumberSelectorConfig(min=0, max=high, step=1, mode=NumberSelectorMode.BOX)
+    )
+
+
 class GreeVersatiConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for the Gree Versati integration."""
 
@@ -199,20 +239,29 @@ _LIMIT_RANGES = [
     (CONF_DHW_TEMP_MIN, CONF_DHW_TEMP_MAX, DHW_TEMP_MIN, DHW_TEMP_MAX, "dhw"),
 ]
 
+# (min option, max option, error label) for every range the form validates
+_MIN_MAX_PAIRS = [
+    *((min_key, max_key, label) for min_key, max_key, _, _, label in _LIMIT_RANGES),
+    (CONF_POLL_INTERVAL_MIN, CONF_POLL_INTERVAL_MAX, "poll_interval"),
+]
+
 
 class GreeVersatiOptionsFlow(config_entries.OptionsFlow):
-    """Options flow for tightening the settable temperature ranges."""
+    """Options flow for temperature ranges, polling and the grace window."""
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
-        """Manage the temperature limit options."""
+        """Manage the temperature limit and polling options."""
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            # NumberSelector returns floats; store whole degrees
-            data = {key: int(value) for key, value in user_input.items()}
-            for min_key, max_key, _, _, label in _LIMIT_RANGES:
+            # NumberSelector returns floats; store whole numbers
+            data = {
+                key: value if isinstance(value, bool) else int(value)
+                for key, value in user_input.items()
+            }
+            for min_key, max_key, label in _MIN_MAX_PAIRS:
                 if data[min_key] > data[max_key]:
                     errors["base"] = f"{label}_min_above_max"
                     break
@@ -229,6 +278,36 @@ class GreeVersatiOptionsFlow(config_entries.OptionsFlow):
                 for min_key, max_key, low, high, _ in _LIMIT_RANGES
                 for key, default in ((min_key, low), (max_key, high))
             }
+            | {
+                vol.Required(
+                    key,
+                    default=options.get(key, default),
+                ): _seconds_selector()
+                for key, default in (
+                    (CONF_POLL_INTERVAL_MIN, DEFAULT_POLL_INTERVAL_MIN),
+                    (CONF_POLL_INTERVAL_MAX, DEFAULT_POLL_INTERVAL_MAX),
+                )
+            }
+            | {
+                vol.Required(
+                    CONF_GRACE_FAILURES,
+                    default=options.get(CONF_GRACE_FAILURES, DEFAULT_GRACE_FAILURES),
+                ): _count_selector(GRACE_FAILURES_HIGHEST),
+                vol.Required(
+                    CONF_GRACE_PERIOD,
+                    default=options.get(CONF_GRACE_PERIOD, DEFAULT_GRACE_PERIOD),
+                ): _seconds_selector(0, GRACE_PERIOD_HIGHEST),
+                vol.Required(
+                    CONF_COMMAND_JOURNAL_TTL,
+                    default=options.get(
+                        CONF_COMMAND_JOURNAL_TTL, DEFAULT_COMMAND_JOURNAL_TTL
+                    ),
+                ): _seconds_selector(0, COMMAND_JOURNAL_TTL_HIGHEST),
+                vol.Required(
+                    CONF_OFFLOAD_CODEC,
+                    default=options.get(CONF_OFFLOAD_CODEC, DEFAULT_OFFLOAD_CODEC),
+                ): BooleanSelector(),
+            }
         )
         return self.async_show_form(
             step_id="init",
@@ -52,6 +52,39 @@ CONF_COOL_TEMP_MAX = "cool_temp_max"
 CONF_DHW_TEMP_MIN = "dhw_temp_min"
 CONF_DHW_TEMP_MAX = "dhw_temp_max"
 
+# Polling (seconds). The coordinator adapts its interval to device
+# activity (see polling.AdaptiveInterval) within user-set bounds; the
+# default interval is the baseline for a running unit.
+DEFAULT_POLL_INTERVAL = 30
+CONF_POLL_INTERVAL_MIN = "poll_interval_min"
+CONF_POLL_INTERVAL_MAX = "poll_interval_max"
+DEFAULT_POLL_INTERVAL_MIN = 10
+DEFAULT_POLL_INTERVAL_MAX = 120
+POLL_INTERVAL_LOWEST = 5
+POLL_INTERVAL_HIGHEST = 600
+
+# Grace window: after failed polls the last good data keeps being served
+# (its data_age growing) until either limit is reached, so a flaky link
+# does not flap every entity to unavailable. 0 failures disables it.
+CONF_GRACE_FAILURES = "grace_failures"
+CONF_GRACE_PERIOD = "grace_period"
+DEFAULT_GRACE_FAILURES = 3
+DEFAULT_GRACE_PERIOD = 300
+GRACE_FAILURES_HIGHEST = 20
+GRACE_PERIOD_HIGHEST = 3600
+
+# Command journal (opt-in): commands for an unreachable unit are held
+# this many seconds and replayed once it answers again. 0 disables.
+CONF_COMMAND_JOURNAL_TTL = "command_journal_ttl"
+DEFAULT_COMMAND_JOURNAL_TTL = 0
+COMMAND_JOURNAL_TTL_HIGHEST = 3600
+
+# Run packet crypto and JSON work in a small shared thread pool instead of
+# on the event loop; only worth it on multi-core hosts with slow decoding (see
+# tests/protocol/bench_codec.py). Off by default.
+CONF_OFFLOAD_CODEC = "offload_codec"
+DEFAULT_OFFLOAD_CODEC = False
+
 # Water heater operation modes. Values match HA's water_heater state
 # strings (STATE_OFF / STATE_HEAT_PUMP / STATE_PERFORMANCE).
 # "off": no DHW in the device mode; "heat_pump": normal DHW;
@@ -2,15 +2,48 @@
 
 from __future__ import annotations
 
-import asyncio
+import time
+from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DEVICE_MODE_TO_MOD, LOGGER
+from .const import (
+    CONF_GRACE_FAILURES,
+    CONF_GRACE_PERIOD,
+    CONF_POLL_INTERVAL_MAX,
+    CONF_POLL_INTERVAL_MIN,
+    DEFAULT_GRACE_FAILURES,
+    DEFAULT_GRACE_PERIOD,
+    DEFAULT_POLL_INTERVAL,
+    DEFAULT_POLL_INTERVAL_MAX,
+    DEFAULT_POLL_INTERVAL_MIN,
+    DEVICE_MODE_TO_MOD,
+    DOMAIN,
+    LOGGER,
+)
+from .expectations import PendingExpectations
+from .fleet import get_fleet
+from .polling import AdaptiveInterval, FailureBackoff
+from .protocol.tracing import span
 
 if TYPE_CHECKING:
+    import asyncio
+
     from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+SNAPSHOT_STORAGE_VERSION = 1
+# Write the last-known snapshot at most this often (seconds); HA flushes
+# a pending write on shutdown
+SNAPSHOT_SAVE_INTERVAL = 300
+
+
+def snapshot_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store holding an entry's last-known device snapshot."""
+    return Store(hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.snapshot")
 
 
 class NoRuntimeDataError(UpdateFailed):
@@ -27,6 +60,63 @@ class GreeVersatiDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     config_entry: ConfigEntry
     _first_update_done: bool = False
+    _settle_task: asyncio.Task[None] | None = None
+    _snapshot_due: float = 0.0
+    _last_good_at: float | None = None
+    _last_good_age: float = 0.0
+    _poll_seconds: float | None = None
+    stale: bool = False
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the coordinator."""
+        super().__init__(*args, **kwargs)
+        self._expectations = PendingExpectations()
+        self._store = snapshot_store(self.hass, self.config_entry.entry_id)
+        # Options this coordinator was built with (changes need a reload)
+        self.options = dict(self.config_entry.options)
+        options = self.options
+        self._interval = AdaptiveInterval(
+            base=DEFAULT_POLL_INTERVAL,
+            low=options.get(CONF_POLL_INTERVAL_MIN, DEFAULT_POLL_INTERVAL_MIN),
+            high=options.get(CONF_POLL_INTERVAL_MAX, DEFAULT_POLL_INTERVAL_MAX),
+        )
+        self._backoff = FailureBackoff(base=DEFAULT_POLL_INTERVAL)
+        self._grace_failures = options.get(CONF_GRACE_FAILURES, DEFAULT_GRACE_FAILURES)
+        self._grace_period = options.get(CONF_GRACE_PERIOD, DEFAULT_GRACE_PERIOD)
+        self._fleet = get_fleet(self.hass)
+        self._fleet.join(self.config_entry.entry_id)
+
+    async def async_shutdown(self) -> None:
+        """Cancel any scheduled poll and leave the fleet."""
+        await super().async_shutdown()
+        self._fleet.leave(self.config_entry.entry_id)
+
+    async def async_restore_snapshot(self) -> bool:
+        """
+        Load the last-known snapshot as current data, marked stale.
+
+        Lets entities come up at once with the values from before the
+        restart; the flag clears with the first successful poll.
+        Returns whether a snapshot was found.
+        """
+        stored = await self._store.async_load()
+        if not stored or not stored.get("data"):
+            return False
+        self.data = stored["data"]
+        self.stale = True
+        LOGGER.debug("Restored last-known snapshot: %s", self.data)
+        return True
+
+    def _schedule_snapshot_save(self) -> None:
+        """Persist the latest data, at most once per SNAPSHOT_SAVE_INTERVAL."""
+        now = time.monotonic()
+        if now < self._snapshot_due:
+            return
+        self._snapshot_due = now + SNAPSHOT_SAVE_INTERVAL
+        # Evaluated when the write happens, so it stores the newest data
+        self._store.async_delay_save(
+            lambda: {"data": self.data}, SNAPSHOT_SAVE_INTERVAL
+        )
 
     def async_apply_optimistic(self, **changes: Any) -> None:
         """
@@ -35,10 +125,25 @@ class GreeVersatiDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Publishing the known outcome of a command avoids polling the unit
         while it is still transitioning; async_set_updated_data also
         pushes the next scheduled poll a full interval out, by which time
-        the unit reports settled values.
+        the unit reports settled values. The values are also held against
+        contradicting polls until the unit agrees (see PendingExpectations).
+
+        Only for commands the unit took: one held for replay says nothing
+        about the unit, and must not end the backoff or start a refresh.
         """
+        self._expectations.expect(changes, time.monotonic())
         self.async_set_updated_data({**(self.data or {}), **changes})
 
+        # The unit just took a command, so it is reachable again: poll now
+        # rather than waiting out the backoff
+        if self._backoff.failures:
+            self._backoff.reset()
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self.async_request_refresh(),
+                f"{DOMAIN} recover {self.config_entry.entry_id}",
+            )
+
     def async_apply_optimistic_device_mode(
         self, device_mode: str, **extra: Any
     ) -> None:
@@ -48,6 +153,8 @@ class GreeVersatiDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         The unit power-cycles while changing Mod and briefly reports
         transitional values (e.g. Pow=0), which would flash wrong states
         in the UI — like space heating showing off after a DHW change.
+        A background task then watches for the transition to complete
+        and confirms the real state with one full refresh.
         """
         mod = DEVICE_MODE_TO_MOD[device_mode]
         changes: dict[str, Any] = {"power": mod is not None, **extra}
@@ -55,6 +162,86 @@ class GreeVersatiDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             changes["mode"] = mod
         self.async_apply_optimistic(**changes)
 
+        # A newer mode change supersedes any transition still being watched
+        if self._settle_task is not None:
+            self._settle_task.cancel()
+        self._settle_task = self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_settle(device_mode),
+            f"{DOMAIN} settle {self.config_entry.entry_id}",
+        )
+
+    async def _async_settle(self, device_mode: str) -> None:
+        """Wait for a mode change to settle, then refresh once."""
+        client = self.config_entry.runtime_data.client
+        if not await client.async_wait_for_mode(device_mode):
+            # A refresh now would publish the transitional Pow/Mod the
+            # wait exists to hide; the regular poll picks the unit up
+            LOGGER.debug("Mode %s did not settle, skipping the refresh", device_mode)
+            return
+        await self.async_refresh()
+
+    def _adapt_interval(self, data: dict[str, Any]) -> None:
+        """Set the next poll interval from how active the device is."""
+        # Only a mode change makes the unit transition; a held setpoint
+        # is just waiting for a poll to agree with it
+        transition_pending = (
+            self._settle_task is not None and not self._settle_task.done()
+        )
+        seconds = self._interval.update(data, transition_pending=transition_pending)
+        if seconds != self._poll_seconds:
+            LOGGER.debug("Poll interval now %ss", seconds)
+            self._poll_seconds = seconds
+        # Land on this unit's slot so the fleet's polls stay spread out
+        delay = self._fleet.next_delay(
+            self.config_entry.entry_id, seconds, time.monotonic(), self._interval.low
+        )
+        self.update_interval = timedelta(seconds=delay)
+
+    def _back_off(self) -> None:
+        """Push the next poll out after a failure."""
+        interval = timedelta(seconds=self._backoff.failed())
+        LOGGER.debug(
+            "Poll failed %d time(s) in a row, next attempt in %s",
+            self._backoff.failures,
+            interval,
+        )
+        self.update_interval = interval
+
+    def _within_grace(self, now: float) -> bool:
+        """Return true if the last good data may still stand in for a poll."""
+        return (
+            self.data is not None
+            and self._last_good_at is not None
+            and self._backoff.failures <= self._grace_failures
+            and now - self._last_good_at <= self._grace_period
+        )
+
+    async def _async_poll(self) -> dict[str, Any]:
+        """Read the unit (runs in a fleet-wide poll slot)."""
+        client = self.config_entry.runtime_data.client
+        if not self._first_update_done:
+            # The unit may answer with empty columns right after
+            # binding; probe cheaply until it has real values. The probe
+            # follows a moved or re-keyed unit like a poll would; a unit
+            # that never answered raises here, skipping the full poll
+            await client.async_wait_until_ready()
+            self._first_update_done = True
+
+        if self._backoff.failures:
+            # Recently unreachable: a still-dead unit then costs one
+            # short probe timeout instead of a full poll's
+            await client.async_probe()
+
+        LOGGER.debug("Fetching updated data from device")
+        return await client.async_get_data()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify entities (a span of its own while tracing)."""
+        with span("coordinator.listeners", count=len(self._listeners)):
+            super().async_update_listeners()
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Update data via library."""
         LOGGER.debug("Coordinator update called - polling cycle starting")
@@ -66,24 +253,38 @@ class GreeVersatiDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 LOGGER.error("No runtime data available for coordinator update")
                 raise NoRuntimeDataError  # noqa: TRY301
 
-            LOGGER.debug("Fetching updated data from device")
-            data = await self.config_entry.runtime_data.client.async_get_data()
-
-            # Add a small delay after the first data update
-            if not self._first_update_done:
-                LOGGER.debug("First update - adding delay to allow device to respond")
-                await asyncio.sleep(2.0)
-                # Check if data values are None, if so, fetch again
-                if all(value is None for value in data.values()):
-                    LOGGER.debug(
-                        "Initial data contains all None values, fetching again"
-                    )
-                    data = await self.config_entry.runtime_data.client.async_get_data()
-                self._first_update_done = True
+            client = self.config_entry.runtime_data.client
+            with (
+                client.profiled("poll"),
+                span("coordinator.update", entry=self.config_entry.entry_id),
+            ):
+                data = await self._fleet.run(
+                    self._async_poll, healthy=not self._backoff.failures
+                )
 
             LOGGER.debug("Updated data received: %s", data)
+            data = self._expectations.reconcile(data, time.monotonic())
+            self._backoff.reset()
+            self._adapt_interval(data)
+            self.stale = False
+            self._last_good_at = time.monotonic()
+            self._last_good_age = data.get("data_age") or 0.0
+            self._schedule_snapshot_save()
             return data
         except Exception as exc:
+            self._back_off()
+            now = time.monotonic()
+            if self._within_grace(now):
+                # Keep entities on the last good values rather than
+                # flapping them to unavailable over a flaky link
+                LOGGER.warning(
+                    "Poll failed (%s), keeping last good data (failure %d of %d)",
+                    exc,
+                    self._backoff.failures,
+                    self._grace_failures,
+                )
+                age = self._last_good_age + now - self._last_good_at
+                return {**self.data, "data_age": age}
             LOGGER.error("Error fetching data from device: %s", exc)
             error_msg = f"Communication error: {exc}"
             raise UpdateFailed(error_msg) from exc
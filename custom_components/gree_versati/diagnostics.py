@@ -0,0 +1,64 @@
+"""Diagnostics support for Gree Versati."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+
+from .protocol.stalls import watch_stats
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .data import GreeVersatiConfigEntry
+
+# The binding key lets anyone on the LAN control the unit
+TO_REDACT = {"key"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,
+    entry: GreeVersatiConfigEntry,
+) -> dict[str, Any]:
+    """
+    Return everything needed to debug an entry from one download.
+
+    Besides the entry and both views of the device state (raw properties
+    as the unit reported them, decoded values as entities see them), it
+    carries the wire counters, the recent polls and commands broken down
+    by phase with their status batch sizes, and the recent errors.
+    """
+    client = entry.runtime_data.client
+    coordinator = entry.runtime_data.coordinator
+    device = client.device
+    metrics = client.metrics
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "device": {
+            "ip": client.ip,
+            "port": client.port,
+            "cipher_type": client.cipher_type,
+            "rtt": device.rtt if device else None,
+            "raw_properties": dict(device.raw_properties) if device else None,
+        },
+        "coordinator": {
+            "data": coordinator.data if coordinator else None,
+            "last_update_success": coordinator.last_update_success
+            if coordinator
+            else None,
+            "update_interval": coordinator.update_interval.total_seconds()
+            if coordinator and coordinator.update_interval
+            else None,
+            "stale": coordinator.stale if coordinator else None,
+        },
+        "metrics": metrics.as_dict(),
+        "timings": metrics.history(),
+        "errors": list(metrics.errors),
+        # Integration-wide, None unless the watch_loop action is on
+        "loop_stalls": watch_stats(),
+    }
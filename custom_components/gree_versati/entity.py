@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import (
     CONNECTION_NETWORK_MAC,
@@ -52,6 +54,11 @@ class GreeVersatiEntity(CoordinatorEntity[GreeVersatiDataUpdateCoordinator]):
 
         self._attr_unique_id = coordinator.config_entry.entry_id
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Flag values restored from before a restart until the first poll."""
+        return {"restored": True} if self.coordinator.stale else None
+
     @property
     def device_info(self) -> DeviceInfo | None:
         """Return device information."""
@@ -0,0 +1,53 @@
+"""Reconcile optimistic command outcomes with polled device state."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+# How long a commanded value may be contradicted by polls before the
+# poll wins (the unit settles well within this after any command)
+EXPECTATION_HOLD = 60.0
+
+
+class PendingExpectations:
+    """
+    Expected data values with deadlines, held against contradicting polls.
+
+    Right after a command the unit may report transitional values; a
+    poll that catches one would flip the UI back and invite the user to
+    retry. While an expectation is pending, a contradicting poll value
+    for its key is replaced by the expected one. A key is dropped as
+    soon as a poll agrees with it, or once its deadline passes.
+    """
+
+    def __init__(self, hold: float = EXPECTATION_HOLD) -> None:
+        """Initialize with no pending expectations."""
+        self._hold = hold
+        self._pending: dict[str, tuple[Any, float]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of pending expectations."""
+        return len(self._pending)
+
+    def expect(self, changes: Mapping[str, Any], now: float) -> None:
+        """Record expected values, replacing older ones for the same keys."""
+        deadline = now + self._hold
+        for key, value in changes.items():
+            self._pending[key] = (value, deadline)
+
+    def reconcile(self, polled: dict[str, Any], now: float) -> dict[str, Any]:
+        """Return polled data with still-pending expectations held."""
+        if not self._pending:
+            return polled
+
+        reconciled = dict(polled)
+        for key, (value, deadline) in list(self._pending.items()):
+            # == on purpose: the unit reports 1/0 for expected True/False
+            if polled.get(key) == value or now >= deadline:
+                del self._pending[key]
+            else:
+                reconciled[key] = value
+        return reconciled
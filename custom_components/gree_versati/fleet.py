@@ -0,0 +1,93 @@
+"""Integration-wide poll coordination across all configured units."""
+
+from __future__ import annotations
+
+import math
+import time
+from typing import TYPE_CHECKING, TypeVar
+
+from .const import DOMAIN
+from .protocol.tracing import complete
+from .scheduler import PRIORITY_POLL, PRIORITY_RETRY, RequestScheduler
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from homeassistant.core import HomeAssistant
+
+_T = TypeVar("_T")
+
+# Polls allowed in flight at once across all units; the rest queue
+FLEET_MAX_IN_FLIGHT = 4
+
+
+class PollFleet:
+    """
+    Spread the polls of all units over time and cap them globally.
+
+    Every coordinator joins the fleet and gets an evenly spaced phase
+    within the poll interval, so entries set up together do not poll
+    in lockstep and burst onto the same access point. Polls run through
+    one shared scheduler: at most ``max_in_flight`` at a time, with
+    healthy units ahead of retries for unreachable ones.
+    """
+
+    def __init__(self, max_in_flight: int = FLEET_MAX_IN_FLIGHT) -> None:
+        """Initialize an empty fleet."""
+        self._scheduler = RequestScheduler(max_in_flight)
+        self._members: list[str] = []
+
+    def __contains__(self, member: object) -> bool:
+        """Return true if the unit (config entry id) is in the fleet."""
+        return member in self._members
+
+    def join(self, member: str) -> None:
+        """Add a unit (by config entry id); phases are rebalanced."""
+        if member not in self._members:
+            self._members.append(member)
+
+    def leave(self, member: str) -> None:
+        """Remove a unit; phases are rebalanced."""
+        if member in self._members:
+            self._members.remove(member)
+
+    def next_delay(
+        self, member: str, interval: float, now: float, minimum: float = 0.0
+    ) -> float:
+        """
+        Return the delay until the member's next poll slot.
+
+        Slots repeat every ``interval`` seconds, offset by the member's
+        share of it. The slot picked is at least half an interval and at
+        least ``minimum`` out, so the cadence stays close to ``interval``
+        and never polls faster than allowed. A lone unit, or one already
+        at ``minimum``, polls at plain ``interval``.
+        """
+        if (
+            len(self._members) < 2  # noqa: PLR2004
+            or member not in self._members
+            or interval <= minimum
+        ):
+            return interval
+        offset = interval * self._members.index(member) / len(self._members)
+        earliest = now + max(interval / 2, minimum)
+        slot = math.ceil((earliest - offset) / interval) * interval + offset
+        return slot - now
+
+    async def run(
+        self, factory: Callable[[], Awaitable[_T]], *, healthy: bool = True
+    ) -> _T:
+        """Run one unit's poll when a fleet-wide slot is free."""
+        priority = PRIORITY_POLL if healthy else PRIORITY_RETRY
+        queued = time.monotonic()
+
+        async def poll() -> _T:
+            complete("fleet.wait", queued)
+            return await factory()
+
+        return await self._scheduler.run(priority, poll)
+
+
+def get_fleet(hass: HomeAssistant) -> PollFleet:
+    """Return the integration's fleet, creating it on first use."""
+    return hass.data.setdefault(DOMAIN, PollFleet())
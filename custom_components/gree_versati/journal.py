@@ -0,0 +1,50 @@
+"""Commands held while the unit is unreachable, for replay on reconnect."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Mapping
+
+# Journal key of a combined device mode change (other keys are AwhpProps)
+DEVICE_MODE = "device_mode"
+
+
+class CommandJournal:
+    """
+    Latest desired value per property, kept while the unit is down.
+
+    Recording merges by key, a newer value replacing an older one, so
+    any number of commands issued while offline replay as a single
+    transaction. Each entry expires ``ttl`` seconds after it was
+    recorded: an intent from long ago is not applied out of the blue.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        """Initialize an empty journal."""
+        self._ttl = ttl
+        self._entries: dict[Hashable, tuple[Any, float]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of held entries (expired ones included)."""
+        return len(self._entries)
+
+    def record(self, entries: Mapping[Hashable, Any], now: float) -> None:
+        """Hold desired values, replacing older ones for the same keys."""
+        deadline = now + self._ttl
+        for key, value in entries.items():
+            self._entries[key] = (value, deadline)
+
+    def pending(self, now: float) -> dict[Hashable, Any]:
+        """Drop expired entries; return the rest as key -> value."""
+        self._entries = {
+            key: entry for key, entry in self._entries.items() if entry[1] > now
+        }
+        return {key: value for key, (value, _) in self._entries.items()}
+
+    def discard(self, sent: Mapping[Hashable, Any]) -> None:
+        """Forget replayed entries, unless a newer value was recorded since."""
+        for key, value in sent.items():
+            if key in self._entries and self._entries[key][0] == value:
+                del self._entries[key]
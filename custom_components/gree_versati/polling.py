@@ -0,0 +1,109 @@
+"""Poll interval policy: follow how interesting the device currently is."""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+
+# Any of these running means state changes quickly: poll at the minimum
+ACTIVE_KEYS = (
+    "defrosting_status",
+    "hp_heater_1_status",
+    "hp_heater_2_status",
+    "tank_heater_status",
+)
+TEMPERATURE_KEYS = (
+    "water_out_temp",
+    "water_in_temp",
+    "hot_water_temp",
+    "opt_water_temp",
+)
+# Temperatures moving less than this between polls count as flat (°C)
+FLAT_TEMP_DELTA = 0.2
+# After this many flat polls in a row the interval starts growing by
+# FLAT_GROWTH per poll, up to the maximum
+FLAT_POLLS = 3
+FLAT_GROWTH = 1.5
+# Retry delay for an unreachable unit doubles per failed poll up to this
+# cap (seconds)
+BACKOFF_MAX = 600.0
+
+
+class AdaptiveInterval:
+    """
+    Pick the next poll interval from the latest decoded snapshot.
+
+    - a pending mode transition, defrost or heater stage: ``low``
+    - unit powered off: ``high``
+    - running with flat temperatures: ``base``, growing towards ``high``
+    - otherwise: ``base``
+
+    The result is always within ``[low, high]``.
+    """
+
+    def __init__(self, base: float, low: float, high: float) -> None:
+        """Initialize with the baseline interval and bounds (seconds)."""
+        self._base = base
+        self._low = low
+        self._high = high
+        self._previous: dict[str, Any] | None = None
+        self._flat_polls = 0
+
+    @property
+    def low(self) -> float:
+        """Return the shortest interval ``update`` can return."""
+        return self._low
+
+    def update(self, data: dict[str, Any], *, transition_pending: bool) -> float:
+        """Feed a new snapshot; return the interval until the next poll."""
+        temperatures = {key: data.get(key) for key in TEMPERATURE_KEYS}
+        if self._previous is not None and _is_flat(self._previous, temperatures):
+            self._flat_polls += 1
+        else:
+            self._flat_polls = 0
+        self._previous = temperatures
+
+        if transition_pending or any(data.get(key) for key in ACTIVE_KEYS):
+            interval = self._low
+        elif not data.get("power"):
+            interval = self._high
+        else:
+            growth = max(0, self._flat_polls - FLAT_POLLS + 1)
+            interval = self._base * FLAT_GROWTH**growth
+        return min(max(interval, self._low), self._high)
+
+
+class FailureBackoff:
+    """
+    Spread out polls of an unreachable unit.
+
+    Each failed poll doubles the delay from ``base`` up to ``cap``. The
+    delay is then drawn from its upper half, so entries that fail
+    together stop retrying in lockstep. A good poll resets the count.
+    """
+
+    def __init__(self, base: float, cap: float = BACKOFF_MAX) -> None:
+        """Initialize with no failures."""
+        self._base = base
+        self._cap = cap
+        self.failures = 0
+
+    def failed(self) -> float:
+        """Count a failed poll; return the delay until the next attempt."""
+        self.failures += 1
+        delay = min(self._base * 2**self.failures, self._cap)
+        return random.uniform(delay / 2, delay)  # noqa: S311 - jitter, not crypto
+
+    def reset(self) -> None:
+        """Forget past failures."""
+        self.failures = 0
+
+
+def _is_flat(previous: dict[str, Any], current: dict[str, Any]) -> bool:
+    """Return true if no known temperature moved noticeably."""
+    deltas = [
+        abs(current[key] - previous[key])
+        for key in current
+        if current[key] is not None and previous.get(key) is not None
+    ]
+    return bool(deltas) and max(deltas) < FLAT_TEMP_DELTA
@@ -0,0 +1,153 @@
+"""Profile the next few polls and commands of one unit, on demand."""
+
+from __future__ import annotations
+
+import contextlib
+import cProfile
+import io
+import pstats
+import tracemalloc
+from typing import TYPE_CHECKING, Any
+
+from .const import LOGGER
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from pathlib import Path
+
+PROFILE_CPROFILE = "cprofile"
+PROFILE_TRACEMALLOC = "tracemalloc"
+PROFILE_MODES = (PROFILE_CPROFILE, PROFILE_TRACEMALLOC)
+# Functions listed in the cProfile summary
+TOP_FUNCTIONS = 30
+# Source lines listed per cycle in the tracemalloc summary
+TOP_ALLOCATIONS = 10
+# Frames kept per allocation while tracemalloc runs
+TRACEMALLOC_FRAMES = 10
+
+
+class CycleProfiler:
+    """
+    Profile ``cycles`` polls and commands, then hand over to ``on_done``.
+
+    cProfile mode profiles the event loop thread only while a cycle
+    runs. Other work the loop interleaves at the cycle's awaits is
+    included, so compare several cycles rather than trusting one.
+    tracemalloc mode snapshots memory around each cycle and reports
+    how much it grew and which source lines grew it. Snapshots are
+    slow: expect the profiled cycles to take longer than usual.
+
+    A cycle started inside another one (a command during a poll)
+    counts as part of it. Python 3.12+ allows one active cProfile per
+    interpreter: when another profiler holds it, the profile ends early
+    with what it has and ``failure`` says why.
+    """
+
+    def __init__(
+        self, mode: str, cycles: int, on_done: Callable[[CycleProfiler], None]
+    ) -> None:
+        """Initialize; nothing is profiled until the first cycle."""
+        self.mode = mode
+        self.remaining = cycles
+        self._on_done = on_done
+        self.failure: str | None = None
+        self._depth = 0
+        self._profiled = 0
+        self._profile = cProfile.Profile() if mode == PROFILE_CPROFILE else None
+        self._started_tracemalloc = False
+        self._before: tracemalloc.Snapshot | None = None
+        self._growth: list[dict[str, Any]] = []
+
+    @contextlib.contextmanager
+    def cycle(self, kind: str) -> Iterator[None]:
+        """Profile the body as one cycle (a no-op once all are done)."""
+        if self.remaining <= 0 or (self._depth == 0 and not self._try_enter()):
+            yield
+            return
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self._exit(kind)
+
+    def _try_enter(self) -> bool:
+        try:
+            self._before = self._enter()
+        except ValueError as err:
+            # Another profiler is active (Python 3.12+ allows only one)
+            LOGGER.warning("Profiling stopped after %s cycles: %s", self._profiled, err)
+            self.failure = str(err)
+            self.remaining = 0
+            self._finish()
+            return False
+        return True
+
+    def _enter(self) -> tracemalloc.Snapshot | None:
+        if self._profile is not None:
+            self._profile.enable()
+            return None
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            self._started_tracemalloc = True
+        return _snapshot()
+
+    def _exit(self, kind: str) -> None:
+        if self._profile is not None:
+            self._profile.disable()
+        elif self._before is not None:
+            lines = _snapshot().compare_to(self._before, "lineno")
+            self._before = None
+            self._growth.append(
+                {
+                    "kind": kind,
+                    "growth": sum(stat.size_diff for stat in lines),
+                    "top": [str(stat) for stat in lines[:TOP_ALLOCATIONS]],
+                }
+            )
+        self._profiled += 1
+        self.remaining -= 1
+        if self.remaining == 0:
+            self._finish()
+
+    def _finish(self) -> None:
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+        self._on_done(self)
+
+    def files(self, stem: Path) -> list[Path]:
+        """Return the files write() creates next to ``stem``."""
+        summary = stem.with_name(f"{stem.name}_summary.txt")
+        if self._profile is None:
+            return [summary]
+        return [stem.with_name(f"{stem.name}.pstats"), summary]
+
+    def write(self, stem: Path) -> list[Path]:
+        """Write the results next to ``stem``; return the files (blocking)."""
+        files = self.files(stem)
+        text = io.StringIO()
+        if self.failure is not None:
+            text.write(f"Stopped after {self._profiled} cycles: {self.failure}\n\n")
+        if self._profile is None:
+            for index, cycle in enumerate(self._growth, 1):
+                text.write(f"{index}. {cycle['kind']}: {cycle['growth']:+d} bytes\n")
+                text.writelines(f"    {line}\n" for line in cycle["top"])
+            files[0].write_text(text.getvalue(), encoding="utf-8")
+            return files
+
+        stats_path, summary = files
+        self._profile.dump_stats(stats_path)
+        # pstats refuses a profile that never ran
+        if self._profiled:
+            stats = pstats.Stats(self._profile, stream=text)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP_FUNCTIONS)
+        summary.write_text(text.getvalue(), encoding="utf-8")
+        return files
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    """Take a snapshot without tracemalloc's own allocations."""
+    return tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.Filter(inclusive=False, filename_pattern=tracemalloc.__file__)]
+    )
@@ -6,25 +6,40 @@ keys, property names) — MIT licensed, no code derived from GPL sources.
 """
 
 from .cipher import CIPHER_ECB, CIPHER_GCM, EcbCipher, GcmCipher, create_cipher
-from .device import AwhpDevice, AwhpProps, DeviceInfo
-from .discovery import search_devices
+from .device import (
+    AwhpDevice,
+    AwhpProps,
+    DeviceInfo,
+    shared_codec_executor,
+    shutdown_codec_executor,
+)
+from .discovery import find_device, search_devices
 from .exceptions import (
     GreeBindError,
+    GreeKeyError,
     GreeProtocolError,
     GreeTimeoutError,
 )
+from .metrics import CycleTiming, DeviceMetrics, LatencyHistogram
 
 __all__ = [
     "CIPHER_ECB",
     "CIPHER_GCM",
     "AwhpDevice",
     "AwhpProps",
+    "CycleTiming",
     "DeviceInfo",
+    "DeviceMetrics",
     "EcbCipher",
     "GcmCipher",
     "GreeBindError",
+    "GreeKeyError",
     "GreeProtocolError",
     "GreeTimeoutError",
+    "LatencyHistogram",
     "create_cipher",
+    "find_device",
     "search_devices",
+    "shared_codec_executor",
+    "shutdown_codec_executor",
 ]
@@ -0,0 +1,122 @@
+"""
+Opt-in packet capture: every datagram to and from the units, on disk.
+
+While a ``PacketRecorder`` is installed (``start_capture()``), the
+network layer hands it each datagram it sends or receives, and the
+device layer optionally the cleartext pack inside. The capture is
+JSON lines: a header object, then one compact array per record::
+
+    {"capture": 1, "started_at": 1760000000.0}
+    [0.0012, "out", "192.168.1.20", 7000, "datagram", "<request JSON>"]
+    [0.0431, "in", "192.168.1.20", 7000, "datagram", "<response JSON>"]
+    [0.0433, "in", "192.168.1.20", 7000, "pack", {"t": "dat", ...}]
+
+Times are seconds since the capture started. Bind answers carry the
+device key (encrypted with a well-known key), so treat a capture like
+the key itself. Cleartext packs have it redacted. Replay a capture
+with ``tests/protocol/replay.py``.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+CAPTURE_VERSION = 1
+# Records buffered before they are handed to the writer thread
+FLUSH_RECORDS = 256
+
+_recorder: PacketRecorder | None = None
+
+
+class PacketRecorder:
+    """Append datagrams (and optionally cleartext packs) to a capture file."""
+
+    def __init__(self, path: Path, *, include_packs: bool = False) -> None:
+        """Initialize; the file is created on the first write."""
+        self.path = path
+        self.include_packs = include_packs
+        self._origin = time.monotonic()
+        self._pending = [
+            json.dumps({"capture": CAPTURE_VERSION, "started_at": time.time()})
+        ]
+        self._writer = ThreadPoolExecutor(1, thread_name_prefix="gree_capture")
+        self._closed = False
+
+    def record(
+        self, direction: str, addr: tuple[str, int], kind: str, payload: Any
+    ) -> None:
+        """Add one record: a datagram (as text) or a cleartext pack."""
+        if self._closed:
+            return
+        elapsed = round(time.monotonic() - self._origin, 4)
+        self._pending.append(
+            json.dumps([elapsed, direction, addr[0], addr[1], kind, payload])
+        )
+        if len(self._pending) >= FLUSH_RECORDS:
+            batch, self._pending = self._pending, []
+            self._writer.submit(self._write, batch)
+
+    def _write(self, lines: list[str]) -> None:
+        """Append records to the file (writer thread)."""
+        with self.path.open("a", encoding="utf-8") as file:
+            file.writelines(line + "\n" for line in lines)
+
+    def close(self) -> None:
+        """Write what is left (blocking)."""
+        self._closed = True
+        batch, self._pending = self._pending, []
+        self._writer.submit(self._write, batch)
+        self._writer.shutdown(wait=True)
+
+
+def start_capture(path: Path, *, include_packs: bool = False) -> PacketRecorder:
+    """Start capturing to ``path``; return the running recorder."""
+    global _recorder  # noqa: PLW0603 - the one process-wide recorder
+    if _recorder is None:
+        _recorder = PacketRecorder(path, include_packs=include_packs)
+    return _recorder
+
+
+def stop_capture() -> PacketRecorder | None:
+    """Stop capturing; return the recorder, whose close() must follow."""
+    global _recorder
+    recorder, _recorder = _recorder, None
+    return recorder
+
+
+def capture_active() -> bool:
+    """Return true while datagrams are captured."""
+    return _recorder is not None
+
+
+def record_datagram(direction: str, addr: tuple[str, int], data: bytes) -> None:
+    """Capture one datagram, if capturing."""
+    if _recorder is not None:
+        _recorder.record(direction, addr, "datagram", data.decode(errors="replace"))
+
+
+def record_pack(direction: str, addr: tuple[str, int], pack: dict[str, Any]) -> None:
+    """Capture a cleartext pack, if capturing with packs."""
+    if _recorder is not None and _recorder.include_packs:
+        if "key" in pack:
+            pack = {**pack, "key": "**REDACTED**"}
+        _recorder.record(direction, addr, "pack", pack)
+
+
+def read_capture(path: Path) -> Iterator[tuple[float, str, str, int, str, Any]]:
+    """Yield the records of a capture file (the header is skipped)."""
+    with path.open(encoding="utf-8") as file:
+        header = json.loads(next(file))
+        if header.get("capture") != CAPTURE_VERSION:
+            error_msg = f"{path} is not a version {CAPTURE_VERSION} capture"
+            raise ValueError(error_msg)
+        for line in file:
+            elapsed, direction, ip, port, kind, payload = json.loads(line)
+            yield elapsed, direction, ip, port, kind, payload
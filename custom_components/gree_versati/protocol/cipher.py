@@ -32,6 +32,25 @@ GCM_NONCE = b"\x54\x40\x78\x44\x49\x67\x5a\x51\x6c\x5e\x63\x13"
 GCM_AAD = b"qualcomm-test"
 
 
+class PackKeyError(ValueError):
+    """
+    A pack did not decrypt under the key: bad padding or garbage plaintext.
+
+    Other ValueErrors from decrypt() (bad base64, a truncated payload,
+    malformed JSON) mean the datagram itself was damaged.
+    """
+
+
+def _parse(plain: bytes) -> dict[str, Any]:
+    """Parse decrypted pack bytes; text that is not UTF-8 means a wrong key."""
+    try:
+        text = plain.decode()
+    except UnicodeDecodeError as err:
+        error_msg = "Pack decrypted to garbage"
+        raise PackKeyError(error_msg) from err
+    return json.loads(text)
+
+
 class EcbCipher:
     """AES-128-ECB pack cipher (protocol V1)."""
 
@@ -59,8 +78,12 @@ class EcbCipher:
         decryptor = Cipher(algorithms.AES(self._key), modes.ECB()).decryptor()  # noqa: S305
         data = decryptor.update(base64.b64decode(payload)) + decryptor.finalize()
         unpadder = padding.PKCS7(128).unpadder()
-        plain = unpadder.update(data) + unpadder.finalize()
-        return json.loads(plain.decode())
+        try:
+            plain = unpadder.update(data) + unpadder.finalize()
+        except ValueError as err:
+            error_msg = "Pack has invalid padding"
+            raise PackKeyError(error_msg) from err
+        return _parse(plain)
 
 
 class GcmCipher:
@@ -104,7 +127,7 @@ class GcmCipher:
             ).decryptor()
             decryptor.authenticate_additional_data(GCM_AAD)
             plain = decryptor.update(raw)
-        return json.loads(plain.decode())
+        return _parse(plain)
 
 
 def create_cipher(kind: str, key: str | None = None) -> EcbCipher | GcmCipher:
@@ -0,0 +1,218 @@
+"""
+Standalone collector: poll many units from a pool of worker processes.
+
+For bulk sites with hundreds of units a single event loop is bound by
+the JSON and AES work of every exchange. The collector shards the units
+across worker processes; each runs its own event loop and sockets and
+streams decoded snapshots back to the parent over a queue. Snapshots
+travel as ``(mac, time, values)`` tuples, values ordered as COLUMNS,
+so no property names are repeated per message.
+
+    targets = [CollectorTarget("192.168.1.20", 7000, "f4911e000001", key, "ecb")]
+    with Collector(targets, interval=30) as collector:
+        while True:
+            snapshot = collector.get()
+
+Run ``scripts/collector.py`` for JSON lines on stdout, one per snapshot.
+It loads this package without the integration around it, so neither it
+nor its workers need Home Assistant::
+
+    python scripts/collector.py targets.json --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self
+
+from .device import AwhpDevice, AwhpProps, DeviceInfo
+from .exceptions import GreeProtocolError
+
+if TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
+    from multiprocessing.queues import Queue
+    from multiprocessing.synchronize import Event
+    from types import TracebackType
+
+_LOGGER = logging.getLogger(__name__)
+
+# Order of the values in every snapshot message
+COLUMNS = tuple(prop.value for prop in AwhpProps)
+# Exchanges a worker keeps in flight at once
+WORKER_CONCURRENCY = 32
+
+
+@dataclass(frozen=True)
+class CollectorTarget:
+    """Connection parameters of one bound unit (as stored by the integration)."""
+
+    ip: str
+    port: int
+    mac: str
+    key: str
+    cipher_type: str
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """One poll result: property values by name, or the error that ended it."""
+
+    mac: str
+    received_at: float
+    values: dict[str, Any] | None = None
+    error: str | None = None
+
+
+class Collector:
+    """
+    Poll units every ``interval`` seconds from ``workers`` processes.
+
+    Units are dealt round-robin over the workers, so throughput scales
+    with cores. Workers use the ``spawn`` start method by default:
+    forking a process that runs threads or an event loop is unsafe.
+    """
+
+    def __init__(
+        self,
+        targets: list[CollectorTarget],
+        *,
+        workers: int | None = None,
+        interval: float = 30.0,
+        timeout: float = 10.0,
+        mp_context: BaseContext | None = None,
+    ) -> None:
+        """Initialize a stopped collector."""
+        workers = max(1, min(workers or os.cpu_count() or 1, len(targets) or 1))
+        self._shards = [targets[i::workers] for i in range(workers)]
+        self._interval = interval
+        self._timeout = timeout
+        self._context = mp_context or multiprocessing.get_context("spawn")
+        self._queue: Queue[tuple[Any, ...]] = self._context.Queue()
+        self._stop = self._context.Event()
+        self._processes: list[multiprocessing.process.BaseProcess] = []
+
+    def start(self) -> None:
+        """Start the worker processes."""
+        for index, shard in enumerate(self._shards):
+            process = self._context.Process(
+                target=_worker_main,
+                args=(shard, self._interval, self._timeout, self._queue, self._stop),
+                name=f"gree-collector-{index}",
+                daemon=True,
+            )
+            process.start()
+            self._processes.append(process)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Ask the workers to finish and wait for them."""
+        self._stop.set()
+        deadline = time.monotonic() + timeout
+        for process in self._processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                process.terminate()
+        self._processes.clear()
+
+    def get(self, timeout: float | None = None) -> Snapshot:
+        """Return the next snapshot; raises queue.Empty on timeout."""
+        mac, received_at, values, error = self._queue.get(timeout=timeout)
+        if values is None:
+            return Snapshot(mac, received_at, error=error)
+        return Snapshot(mac, received_at, dict(zip(COLUMNS, values, strict=True)))
+
+    def __enter__(self) -> Self:
+        """Start on entering a with block."""
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop on leaving a with block."""
+        self.stop()
+
+
+def _worker_main(
+    targets: list[CollectorTarget],
+    interval: float,
+    timeout: float,
+    out: Queue[tuple[Any, ...]],
+    stop: Event,
+) -> None:
+    """Worker process entry point: poll one shard until told to stop."""
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_poll_shard(targets, interval, timeout, out, stop))
+
+
+async def _poll_shard(
+    targets: list[CollectorTarget],
+    interval: float,
+    timeout: float,  # noqa: ASYNC109 - per-exchange deadline
+    out: Queue[tuple[Any, ...]],
+    stop: Event,
+) -> None:
+    """Poll every unit of the shard once per interval."""
+    devices = [
+        AwhpDevice(
+            DeviceInfo(target.ip, target.port, target.mac),
+            key=target.key,
+            cipher_type=target.cipher_type,
+            timeout=timeout,
+        )
+        for target in targets
+    ]
+    limit = asyncio.Semaphore(WORKER_CONCURRENCY)
+
+    async def poll(device: AwhpDevice) -> None:
+        async with limit:
+            try:
+                data = await device.get_all_properties()
+            except GreeProtocolError as err:
+                out.put((device.device_info.mac, time.time(), None, str(err)))
+            else:
+                values = tuple(data.get(column) for column in COLUMNS)
+                out.put((device.device_info.mac, time.time(), values, None))
+
+    # A parent killed outright never sets ``stop``; do not outlive it
+    parent = multiprocessing.parent_process()
+    while not stop.is_set() and (parent is None or parent.is_alive()):
+        started = time.monotonic()
+        await asyncio.gather(*(poll(device) for device in devices))
+        await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Poll the units listed in a JSON file and print snapshots as JSON lines."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("targets", type=Path, help="JSON list of unit parameters")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--interval", type=float, default=30.0)
+    args = parser.parse_args(argv)
+
+    targets = [
+        CollectorTarget(**entry) for entry in json.loads(args.targets.read_text())
+    ]
+    with (
+        Collector(targets, workers=args.workers, interval=args.interval) as collector,
+        contextlib.suppress(KeyboardInterrupt),
+    ):
+        while True:
+            sys.stdout.write(json.dumps(asdict(collector.get())) + "\n")
+            sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -8,20 +8,81 @@ and a decimal digit (``...TemLo``), so 45.5 °C arrives as Hi=145, Lo=5.
 
 from __future__ import annotations
 
+import asyncio
 import enum
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any
-
-from .cipher import CIPHER_ECB, CIPHER_GCM, EcbCipher, GcmCipher, create_cipher
-from .exceptions import GreeBindError, GreeProtocolError, GreeTimeoutError
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from cryptography.exceptions import InvalidTag
+
+from .capture import record_pack
+from .cipher import (
+    CIPHER_ECB,
+    CIPHER_GCM,
+    EcbCipher,
+    GcmCipher,
+    PackKeyError,
+    create_cipher,
+)
+from .exceptions import (
+    GreeBindError,
+    GreeKeyError,
+    GreeProtocolError,
+    GreeTimeoutError,
+)
+from .metrics import DeviceMetrics
 from .network import send_receive
+from .stalls import watch
+from .tracing import complete, span
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from concurrent.futures import Executor
+
+_T = TypeVar("_T")
 
 _LOGGER = logging.getLogger(__name__)
 
 # The unit truncates status responses with too many columns; two batches
 # of up to 23 cover the full AwhpProps set reliably.
 STATUS_BATCH_SIZE = 23
+# Weight of the newest sample in the smoothed round-trip time
+RTT_SMOOTHING = 0.25
+# Threads in the pool shared by devices that offload their codec work
+CODEC_WORKERS = 2
+
+_codec_executor: ThreadPoolExecutor | None = None
+
+
+def shared_codec_executor() -> ThreadPoolExecutor:
+    """
+    Return the bounded thread pool for offloaded encrypt/decrypt work.
+
+    Shared by every device that opts in, so many units cannot spawn
+    more than CODEC_WORKERS threads between them.
+    """
+    global _codec_executor  # noqa: PLW0603 - lazily created singleton
+    if _codec_executor is None:
+        _codec_executor = ThreadPoolExecutor(
+            max_workers=CODEC_WORKERS, thread_name_prefix="gree_codec"
+        )
+    return _codec_executor
+
+
+def shutdown_codec_executor() -> None:
+    """
+    Stop the shared codec pool's threads once no device uses it.
+
+    Queued work still runs; the next shared_codec_executor() call starts
+    a fresh pool.
+    """
+    global _codec_executor  # noqa: PLW0603 - lazily created singleton
+    if _codec_executor is not None:
+        _codec_executor.shutdown(wait=False)
+        _codec_executor = None
 
 
 @dataclass
@@ -115,8 +176,18 @@ class AwhpDevice:
     key: str | None = None
     cipher_type: str | None = None
     timeout: float = 10.0
+    # Smoothed round-trip time of answered requests (seconds), None until
+    # the first answer
+    rtt: float | None = None
+    # Where pack encryption, decryption and JSON (de)serialization run:
+    # None keeps them on the event loop (cheapest for a few units), an
+    # executor (see shared_codec_executor) keeps them off it
+    codec_executor: Executor | None = None
+    # Wire counters; pass one in to keep counting across re-created devices
+    metrics: DeviceMetrics = field(default_factory=DeviceMetrics)
     _properties: dict[str, Any] = field(default_factory=dict)
     _dirty: list[str] = field(default_factory=list)
+    _received_at: dict[str, float] = field(default_factory=dict)
 
     @property
     def raw_properties(self) -> dict[str, Any]:
@@ -137,9 +208,15 @@ class AwhpDevice:
         cipher: EcbCipher | GcmCipher,
         *,
         generic: bool = False,
+        timeout: float | None = None,  # noqa: ASYNC109 - plain deadline
     ) -> dict[str, Any]:
         """Send an encrypted pack and return the decrypted response pack."""
-        payload, tag = cipher.encrypt(pack)
+        addr = (self.device_info.ip, self.device_info.port)
+        record_pack("out", addr, pack)
+        started = time.monotonic()
+        payload, tag = await self._run_codec("encrypt", cipher.encrypt, pack)
+        self.metrics.add_phase("encrypt", time.monotonic() - started)
+        complete("device.encrypt", started)
         message: dict[str, Any] = {
             "cid": "app",
             # i=1 marks generic-key encryption, i=0 the device key
@@ -152,10 +229,65 @@ class AwhpDevice:
         if tag is not None:
             message["tag"] = tag
 
-        response = await send_receive(
-            self.device_info.ip, self.device_info.port, message, self.timeout
-        )
-        return self._decrypt_response(response, cipher)
+        self.metrics.requests[pack.get("t", "unknown")] += 1
+        started = time.monotonic()
+        try:
+            response = await send_receive(
+                *addr,
+                message,
+                self.timeout if timeout is None else timeout,
+                self.metrics,
+            )
+        except GreeTimeoutError as err:
+            self.metrics.timeouts += 1
+            self.metrics.record_error("timeout", err)
+            raise
+        finally:
+            self.metrics.add_phase("network", time.monotonic() - started)
+            complete("device.network", started, t=pack.get("t"))
+        self._record_rtt(time.monotonic() - started)
+        started = time.monotonic()
+        try:
+            decrypted = await self._run_codec(
+                "decrypt", self._decrypt_response, response, cipher
+            )
+        except (PackKeyError, InvalidTag) as err:
+            self.metrics.decrypt_failures += 1
+            self.metrics.record_error("decrypt", err)
+            if generic:
+                raise
+            # The unit answered, but not under our key: it was reset or
+            # re-paired elsewhere and negotiated a new one
+            error_msg = f"{self.device_info} rejected the stored key"
+            raise GreeKeyError(error_msg) from err
+        except ValueError as err:
+            # A damaged datagram, not a new key: no reason to rebind
+            self.metrics.decrypt_failures += 1
+            self.metrics.record_error("malformed", err)
+            error_msg = f"Malformed response from {self.device_info}"
+            raise GreeProtocolError(error_msg) from err
+        finally:
+            self.metrics.add_phase("decrypt", time.monotonic() - started)
+            complete("device.decrypt", started)
+        record_pack("in", addr, decrypted)
+        return decrypted
+
+    def _record_rtt(self, sample: float) -> None:
+        """Fold one answered round trip into the estimate and histogram."""
+        self.metrics.rtt.observe(sample)
+        if self.rtt is None:
+            self.rtt = sample
+        else:
+            self.rtt += RTT_SMOOTHING * (sample - self.rtt)
+
+    async def _run_codec(self, step: str, func: Callable[..., _T], *args: Any) -> _T:
+        """Run codec work inline, or in the codec executor if one is set."""
+        if self.codec_executor is None:
+            # On the event loop: watched for stalls
+            with watch(step):
+                return func(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.codec_executor, func, *args)
 
     def _decrypt_response(
         self, message: dict[str, Any], request_cipher: EcbCipher | GcmCipher
@@ -206,24 +338,121 @@ class AwhpDevice:
         error_msg = f"Could not bind to {self.device_info}"
         raise GreeBindError(error_msg) from last_error
 
+    async def rebind(self) -> str:
+        """
+        Drop the stored key and negotiate a new one, return it.
+
+        For units reset or re-paired since the key was stored. The old
+        key and cipher type are kept if the unit does not bind.
+        """
+        stored = (self.key, self.cipher_type)
+        self.key = self.cipher_type = None
+        try:
+            return await self.bind()
+        except GreeProtocolError:
+            self.key, self.cipher_type = stored
+            raise
+
     # ---------------------------------------------------------------- status
 
     async def get_all_properties(self) -> dict[str, Any]:
         """Poll all known properties (batched) and return name -> value."""
+        return await self.get_properties(AwhpProps)
+
+    async def get_properties(self, props: Iterable[AwhpProps]) -> dict[str, Any]:
+        """
+        Poll only the given properties and return name -> value.
+
+        A handful of columns costs a single small status exchange, which
+        is how callers read fresh state without a full poll.
+
+        A batch that times out is retried once, but only if another batch
+        was answered: the unit is up, so the datagram was simply lost.
+        Columns still missing keep their last-known values (see age()).
+        Only when no batch is answered at all does the timeout propagate.
+        """
         await self.bind()
         cipher = self._device_cipher()
-        names = [prop.value for prop in AwhpProps]
+        names = [prop.value for prop in props]
+        batches = [
+            names[start : start + STATUS_BATCH_SIZE]
+            for start in range(0, len(names), STATUS_BATCH_SIZE)
+        ]
+
+        failed: list[list[str]] = []
+        last_error: GreeTimeoutError | None = None
+        for batch in batches:
+            try:
+                await self._read_batch(batch, cipher)
+            except GreeTimeoutError as err:
+                failed.append(batch)
+                last_error = err
 
-        for start in range(0, len(names), STATUS_BATCH_SIZE):
-            batch = names[start : start + STATUS_BATCH_SIZE]
-            pack = {"mac": self.device_info.mac, "t": "status", "cols": batch}
-            response = await self._request(pack, cipher)
-            cols = response.get("cols", [])
-            values = response.get("dat", [])
-            self._properties.update(zip(cols, values, strict=False))
+        if last_error is not None:
+            if len(failed) == len(batches):
+                raise last_error
+            for batch in failed:
+                self.metrics.retransmits += 1
+                try:
+                    await self._read_batch(batch, cipher)
+                except GreeTimeoutError:
+                    _LOGGER.warning(
+                        "Status batch %s from %s timed out twice, keeping "
+                        "last-known values",
+                        batch,
+                        self.device_info,
+                    )
 
         return {name: self._properties.get(name) for name in names}
 
+    async def _read_batch(
+        self,
+        batch: list[str],
+        cipher: EcbCipher | GcmCipher,
+        timeout: float | None = None,  # noqa: ASYNC109 - plain deadline
+    ) -> None:
+        """Read one status batch into the property cache."""
+        pack = {"mac": self.device_info.mac, "t": "status", "cols": batch}
+        self.metrics.add_batch(len(batch))
+        with span("device.status_batch", cols=len(batch)):
+            response = await self._request(pack, cipher, timeout=timeout)
+        cols = response.get("cols", [])
+        self._properties.update(zip(cols, response.get("dat", []), strict=False))
+        now = time.monotonic()
+        self._received_at.update(dict.fromkeys(cols, now))
+
+    def age(self, props: Iterable[AwhpProps]) -> float | None:
+        """
+        Return seconds since the oldest of the given values was received.
+
+        Close to zero after a complete poll; after a partial one it tells
+        how old the kept values are. Columns never received are ignored;
+        None if none was.
+        """
+        received = [
+            self._received_at[prop.value]
+            for prop in props
+            if prop.value in self._received_at
+        ]
+        if not received:
+            return None
+        return time.monotonic() - min(received)
+
+    async def probe(self, timeout: float) -> float:  # noqa: ASYNC109 - plain deadline
+        """
+        Check that the unit answers at all; return the round-trip time.
+
+        One single-column status exchange with its own (short) timeout,
+        far cheaper than discovering an offline unit through a full poll.
+        Raises GreeTimeoutError when the unit stays silent.
+        """
+        await self.bind()
+        started = time.monotonic()
+        await self._read_batch(
+            [AwhpProps.POWER.value], self._device_cipher(), timeout=timeout
+        )
+        return time.monotonic() - started
+
     def get_property(self, prop: AwhpProps) -> Any:
         """Return the last known value of a property."""
         return self._properties.get(prop.value)
@@ -259,7 +488,14 @@ class AwhpDevice:
             "p": values,
         }
         _LOGGER.debug("Pushing state update %s to %s", pack, self.device_info)
-        await self._request(pack, cipher)
+        try:
+            await self._request(pack, cipher)
+        except GreeProtocolError:
+            # Whether the unit applied it is unknown: forget the cached
+            # values so a retry is not skipped as unchanged
+            for name in names:
+                self._properties.pop(name, None)
+            raise
 
     # ------------------------------------------------------ temperature help
 
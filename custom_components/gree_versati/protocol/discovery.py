@@ -63,3 +63,36 @@ async def search_devices(
         _LOGGER.debug("Discovered device: %s", devices[mac])
 
     return list(devices.values())
+
+
+def _normalize_mac(mac: str) -> str:
+    """Return a MAC as bare lowercase hex, whatever its separators."""
+    return "".join(ch for ch in mac.lower() if ch.isalnum())
+
+
+async def find_device(  # noqa: PLR0913 - scan knobs, all defaulted
+    mac: str,
+    last_ip: str | None = None,
+    port: int = DEFAULT_PORT,
+    *,
+    broadcast_address: str = "255.255.255.255",
+    unicast_wait: float = 1.0,
+    broadcast_wait: float = 3.0,
+) -> DeviceInfo | None:
+    """
+    Find one device by MAC, e.g. after DHCP gave it a new address.
+
+    The scan goes to the last known address first (cheap, and tells a
+    silent-but-present unit from a moved one), then to the broadcast
+    address. Returns None when no device with that MAC answered.
+    """
+    wanted = _normalize_mac(mac)
+    attempts = [(broadcast_address, broadcast_wait)]
+    if last_ip:
+        attempts.insert(0, (last_ip, unicast_wait))
+
+    for address, wait_for in attempts:
+        for info in await search_devices(wait_for, port, address):
+            if _normalize_mac(info.mac) == wanted:
+                return info
+    return None
@@ -11,3 +11,7 @@ class GreeTimeoutError(GreeProtocolError):
 
 class GreeBindError(GreeProtocolError):
     """Binding/key negotiation with the device failed."""
+
+
+class GreeKeyError(GreeProtocolError):
+    """The device no longer accepts the stored key (e.g. after a reset)."""
@@ -0,0 +1,172 @@
+"""Per-device wire counters: requests, failures, latency and traffic."""
+
+from __future__ import annotations
+
+import bisect
+import contextlib
+import math
+import time
+from collections import Counter, deque
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Upper bounds of the round-trip time buckets (seconds); one more bucket
+# holds everything slower
+RTT_BUCKETS = (0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0)
+# Polls and commands kept with their phase breakdown, newest last
+TIMING_HISTORY = 50
+# Failed exchanges and cycles kept, newest last
+ERROR_HISTORY = 20
+
+
+class LatencyHistogram:
+    """
+    Round-trip times in fixed buckets: constant memory however long it runs.
+
+    A percentile comes back as the upper bound of the bucket its rank
+    falls in, capped at the slowest sample seen. That is coarse, but it
+    tells a 20 ms link from a 2 s one, which is what it is for.
+    """
+
+    def __init__(self, bounds: tuple[float, ...] = RTT_BUCKETS) -> None:
+        """Initialize an empty histogram."""
+        self._bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Add one sample."""
+        self._counts[bisect.bisect_left(self._bounds, seconds)] += 1
+        self.count += 1
+        self.max = max(self.max, seconds)
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the given percentile (0 < fraction <= 1); None if empty."""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(fraction * self.count))
+        seen = 0
+        for bound, count in zip((*self._bounds, self.max), self._counts, strict=True):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the bucket counts keyed by upper bound ("inf" last)."""
+        labels = [str(bound) for bound in self._bounds] + ["inf"]
+        return dict(zip(labels, self._counts, strict=True))
+
+
+@dataclass
+class CycleTiming:
+    """
+    Where the time of one poll or command went.
+
+    Phases (seconds, summed over the cycle's exchanges): ``queue_wait``
+    behind other jobs of the unit, ``encrypt``, ``network`` (send until
+    the answer arrived), ``decrypt`` and ``decode`` into entity values.
+    """
+
+    kind: str
+    # Wall clock, for lining up with logs
+    started_at: float
+    phases: dict[str, float] = field(default_factory=dict)
+    # Columns per status exchange, in order
+    batches: list[int] = field(default_factory=list)
+    duration: float | None = None
+    error: str | None = None
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Charge time to a phase."""
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+
+@dataclass
+class DeviceMetrics:
+    """
+    What one unit's traffic looked like since setup.
+
+    The protocol layer counts as it goes: every request by pack type,
+    timeouts, batches sent again after a loss, answers that failed to
+    decrypt and datagram bytes both ways. The client adds how long the
+    last complete poll took, queueing included, and keeps the recent
+    polls and commands (see CycleTiming) and errors for diagnostics.
+    """
+
+    requests: Counter[str] = field(default_factory=Counter)
+    timeouts: int = 0
+    retransmits: int = 0
+    decrypt_failures: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    rtt: LatencyHistogram = field(default_factory=LatencyHistogram)
+    # Seconds, None until the first poll completed
+    poll_duration: float | None = None
+    timings: deque[CycleTiming] = field(
+        default_factory=lambda: deque(maxlen=TIMING_HISTORY)
+    )
+    errors: deque[dict[str, Any]] = field(
+        default_factory=lambda: deque(maxlen=ERROR_HISTORY)
+    )
+    # The cycle whose job is running now; exchanges charge their phases to it
+    cycle: CycleTiming | None = None
+
+    @contextlib.contextmanager
+    def timing(self, kind: str) -> Iterator[CycleTiming]:
+        """Time a poll or command; it joins the history when done."""
+        cycle = CycleTiming(kind, time.time())
+        started = time.monotonic()
+        try:
+            yield cycle
+        except Exception as err:
+            cycle.error = _describe(err)
+            self.record_error(kind, err)
+            raise
+        finally:
+            cycle.duration = time.monotonic() - started
+            self.timings.append(cycle)
+        if kind == "poll":
+            self.poll_duration = cycle.duration
+
+    def add_phase(self, phase: str, seconds: float) -> None:
+        """Charge time to the running cycle, if any."""
+        if self.cycle is not None:
+            self.cycle.add(phase, seconds)
+
+    def add_batch(self, columns: int) -> None:
+        """Note a status exchange's size in the running cycle, if any."""
+        if self.cycle is not None:
+            self.cycle.batches.append(columns)
+
+    def record_error(self, kind: str, err: BaseException) -> None:
+        """Keep a failure for the error history."""
+        self.errors.append({"at": time.time(), "kind": kind, "error": _describe(err)})
+
+    def history(self) -> list[dict[str, Any]]:
+        """Return the recent polls and commands, oldest first."""
+        return [asdict(cycle) for cycle in self.timings]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-friendly copy."""
+        return {
+            "requests": dict(self.requests),
+            "timeouts": self.timeouts,
+            "retransmits": self.retransmits,
+            "decrypt_failures": self.decrypt_failures,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "rtt_p50": self.rtt.percentile(0.5),
+            "rtt_p95": self.rtt.percentile(0.95),
+            "rtt_max": self.rtt.max if self.rtt.count else None,
+            "rtt_buckets": self.rtt.as_dict(),
+            "poll_duration": self.poll_duration,
+        }
+
+
+def _describe(err: BaseException) -> str:
+    return f"{type(err).__name__}: {err}"
@@ -11,9 +11,14 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from .capture import record_datagram
 from .exceptions import GreeTimeoutError
+from .stalls import watch
+
+if TYPE_CHECKING:
+    from .metrics import DeviceMetrics
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,28 +26,46 @@ DEFAULT_PORT = 7000
 
 
 class _ExchangeProtocol(asyncio.DatagramProtocol):
-    """Send one datagram and hand every reply to a callback."""
+    """
+    Send one datagram and hand every reply to a callback.
+
+    Without ``target`` the transport must be connected to the peer;
+    with it, the socket is left unconnected and takes replies from
+    any address.
+    """
 
     def __init__(
         self,
         payload: bytes,
         on_datagram: Any,
+        metrics: DeviceMetrics | None = None,
+        target: tuple[str, int] | None = None,
     ) -> None:
         self._payload = payload
         self._on_datagram = on_datagram
+        self._metrics = metrics
+        self._target = target
         self.transport: asyncio.DatagramTransport | None = None
 
     def connection_made(self, transport: asyncio.BaseTransport) -> None:
         self.transport = transport  # type: ignore[assignment]
-        self.transport.sendto(self._payload)
+        self.transport.sendto(self._payload, self._target)
+        peer = self._target or transport.get_extra_info("peername")
+        record_datagram("out", peer, self._payload)
+        if self._metrics is not None:
+            self._metrics.bytes_sent += len(self._payload)
 
     def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
-        try:
-            message = json.loads(data.decode())
-        except (UnicodeDecodeError, json.JSONDecodeError):
-            _LOGGER.debug("Ignoring undecodable datagram from %s", addr)
-            return
-        self._on_datagram(message, addr)
+        with watch("datagram_received"):
+            record_datagram("in", addr, data)
+            if self._metrics is not None:
+                self._metrics.bytes_received += len(data)
+            try:
+                message = json.loads(data.decode())
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                _LOGGER.debug("Ignoring undecodable datagram from %s", addr)
+                return
+            self._on_datagram(message, addr)
 
     def error_received(self, exc: Exception) -> None:
         _LOGGER.debug("UDP error: %s", exc)
@@ -53,8 +76,13 @@ async def send_receive(
     port: int,
     message: dict[str, Any],
     timeout: float = 5.0,  # noqa: ASYNC109 - plain deadline, no cancellation scope
+    metrics: DeviceMetrics | None = None,
 ) -> dict[str, Any]:
-    """Send one request to a device and return its first response."""
+    """
+    Send one request to a device and return its first response.
+
+    With ``metrics``, datagram bytes both ways are added to its counters.
+    """
     loop = asyncio.get_running_loop()
     response: asyncio.Future[dict[str, Any]] = loop.create_future()
 
@@ -64,7 +92,7 @@ async def send_receive(
 
     payload = json.dumps(message).encode()
     transport, _ = await loop.create_datagram_endpoint(
-        lambda: _ExchangeProtocol(payload, on_datagram),
+        lambda: _ExchangeProtocol(payload, on_datagram, metrics),
         remote_addr=(ip, port),
     )
     try:
@@ -90,9 +118,13 @@ async def broadcast_receive(
         responses.append((msg, addr))
 
     payload = json.dumps(message).encode()
+    # Unconnected: a socket connected to the broadcast address would
+    # drop every answer, since answers come from the units' addresses
     transport, _ = await loop.create_datagram_endpoint(
-        lambda: _ExchangeProtocol(payload, on_datagram),
-        remote_addr=(broadcast_address, port),
+        lambda: _ExchangeProtocol(
+            payload, on_datagram, target=(broadcast_address, port)
+        ),
+        local_addr=("0.0.0.0", 0),  # noqa: S104 - answers come from anywhere
         allow_broadcast=True,
     )
     try:
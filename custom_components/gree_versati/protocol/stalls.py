@@ -0,0 +1,130 @@
+"""
+Opt-in detection of protocol steps that hold the event loop too long.
+
+Datagram handling, encryption, decryption and decoding all run
+synchronously on the event loop (unless the codec is offloaded). Each
+such step is wrapped in ``watch()``: a no-op until ``start_watching()``
+installs a monitor. The monitor then times every step, keeps count,
+total and maximum per step, and logs a warning with the call site of
+any step slower than the threshold, at most once a minute per step.
+
+    start_watching(threshold=0.02)
+    with watch("decrypt"):
+        ...
+    watch_stats()  # {"decrypt": {"count": ..., "max": ..., ...}}
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import time
+import traceback
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Warn about a slow step at most this often (seconds), per step
+STALL_LOG_INTERVAL = 60.0
+# Frames of the call site shown in a warning
+STALL_STACK_DEPTH = 6
+
+_monitor: StallMonitor | None = None
+_DISABLED = contextlib.nullcontext()
+
+
+@dataclass
+class StepStats:
+    """Timing of one kind of synchronous step (seconds)."""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    # Runs slower than the threshold
+    stalls: int = 0
+
+
+class StallMonitor:
+    """Time synchronous steps; report the ones slower than ``threshold``."""
+
+    def __init__(self, threshold: float) -> None:
+        """Initialize with no steps seen."""
+        self.threshold = threshold
+        self.steps: dict[str, StepStats] = {}
+        self._logged_at: dict[str, float] = {}
+        self._suppressed: dict[str, int] = {}
+
+    def record(self, name: str, elapsed: float) -> None:
+        """Count one run of a step; warn if it stalled the loop."""
+        stats = self.steps.get(name)
+        if stats is None:
+            stats = self.steps[name] = StepStats()
+        stats.count += 1
+        stats.total += elapsed
+        stats.max = max(stats.max, elapsed)
+        if elapsed < self.threshold:
+            return
+        stats.stalls += 1
+
+        now = time.monotonic()
+        if now - self._logged_at.get(name, -STALL_LOG_INTERVAL) < STALL_LOG_INTERVAL:
+            self._suppressed[name] = self._suppressed.get(name, 0) + 1
+            return
+        self._logged_at[name] = now
+        suppressed = self._suppressed.pop(name, 0)
+        # Drop record(), _watch() and contextlib's __exit__
+        frames = traceback.extract_stack()[:-3][-STALL_STACK_DEPTH:]
+        _LOGGER.warning(
+            "%s held the event loop for %.1f ms (threshold %.1f ms, %d more "
+            "since the last warning); called from %s",
+            name,
+            elapsed * 1000,
+            self.threshold * 1000,
+            suppressed,
+            " <- ".join(
+                f"{frame.name} ({Path(frame.filename).name}:{frame.lineno})"
+                for frame in reversed(frames)
+            ),
+        )
+
+
+def start_watching(threshold: float) -> StallMonitor:
+    """Start timing steps (counters start from zero); return the monitor."""
+    global _monitor  # noqa: PLW0603 - the one process-wide monitor
+    _monitor = StallMonitor(threshold)
+    return _monitor
+
+
+def stop_watching() -> StallMonitor | None:
+    """Stop timing steps; return the monitor with its final counters."""
+    global _monitor
+    monitor, _monitor = _monitor, None
+    return monitor
+
+
+def watch_stats() -> dict[str, dict[str, Any]] | None:
+    """Return the per-step counters, or None while not watching."""
+    if _monitor is None:
+        return None
+    return {name: asdict(stats) for name, stats in _monitor.steps.items()}
+
+
+def watch(name: str) -> contextlib.AbstractContextManager[None]:
+    """Return a context manager timing its body as the named step."""
+    if _monitor is None:
+        return _DISABLED
+    return _watch(_monitor, name)
+
+
+@contextlib.contextmanager
+def _watch(monitor: StallMonitor, name: str) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        monitor.record(name, time.perf_counter() - started)
@@ -0,0 +1,163 @@
+"""
+Opt-in span tracing in the Chrome trace event format.
+
+Instrumented code marks stages with ``span()`` (a context manager) or,
+when the start was taken earlier, ``complete()``. Both are no-ops
+while no tracer runs: one global lookup, nothing allocated. Between
+``start_tracing()`` and ``stop_tracing()`` every span becomes a
+complete ("X") event in a JSON array, one event per line, which Chrome
+(chrome://tracing) and Perfetto (ui.perfetto.dev) load as is. Each
+asyncio task gets its own track, so concurrent polls do not overlap.
+
+    start_tracing(Path("trace.json"))
+    with span("device.status_batch", cols=23):
+        ...
+    stop_tracing().close()  # blocking: run it off the event loop
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+# Events buffered before they are handed to the writer thread
+FLUSH_EVENTS = 512
+
+_tracer: Tracer | None = None
+_DISABLED = contextlib.nullcontext()
+
+
+class Tracer:
+    """Collect spans and append them to a trace file from a writer thread."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize; the file is created on the first write."""
+        self.path = path
+        self._origin = time.monotonic()
+        self._pid = os.getpid()
+        self._pending: list[str] = []
+        self._tracks: dict[int, int] = {}
+        self._writer = ThreadPoolExecutor(1, thread_name_prefix="gree_trace")
+        self._started = False
+        self._closed = False
+
+    def record(self, name: str, started: float, args: dict[str, Any]) -> None:
+        """Add a span from ``started`` (time.monotonic()) until now."""
+        if self._closed:
+            # A span that outlived the trace
+            return
+        ended = time.monotonic()
+        event = {
+            "name": name,
+            "cat": name.partition(".")[0],
+            "ph": "X",
+            "ts": round((started - self._origin) * 1e6, 1),
+            "dur": round((ended - started) * 1e6, 1),
+            "pid": self._pid,
+            "tid": self._track(),
+        }
+        if args:
+            event["args"] = args
+        self._pending.append(json.dumps(event, default=str))
+        if len(self._pending) >= FLUSH_EVENTS:
+            batch, self._pending = self._pending, []
+            self._writer.submit(self._write, batch)
+
+    def _track(self) -> int:
+        """Return the track of the running task (or thread)."""
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        owner = id(task) if task is not None else threading.get_ident()
+        track = self._tracks.get(owner)
+        if track is None:
+            track = self._tracks[owner] = len(self._tracks) + 1
+            label = task.get_name() if task else threading.current_thread().name
+            meta = {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": self._pid,
+                "tid": track,
+                "args": {"name": label},
+            }
+            self._pending.append(json.dumps(meta))
+        return track
+
+    def _write(self, lines: list[str], *, last: bool = False) -> None:
+        """Append events to the file (writer thread)."""
+        with self.path.open("a", encoding="utf-8") as file:
+            if not self._started:
+                file.write("[\n")
+                self._started = True
+            for index, line in enumerate(lines):
+                tail = "\n" if last and index == len(lines) - 1 else ",\n"
+                file.write(line + tail)
+            if last:
+                file.write("]\n")
+
+    def close(self) -> None:
+        """Write what is left and end the array (blocking)."""
+        self._closed = True
+        batch, self._pending = self._pending, []
+        process = {
+            "name": "process_name",
+            "ph": "M",
+            "pid": self._pid,
+            "args": {"name": "gree_versati"},
+        }
+        batch.append(json.dumps(process))
+        self._writer.submit(self._write, batch, last=True)
+        self._writer.shutdown(wait=True)
+
+
+def start_tracing(path: Path) -> Tracer:
+    """Start recording spans to ``path``; return the running tracer."""
+    global _tracer  # noqa: PLW0603 - the one process-wide tracer
+    if _tracer is None:
+        _tracer = Tracer(path)
+    return _tracer
+
+
+def stop_tracing() -> Tracer | None:
+    """Stop recording; return the tracer, whose close() must follow."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def tracing_active() -> bool:
+    """Return true while spans are recorded."""
+    return _tracer is not None
+
+
+def complete(name: str, started: float, **args: Any) -> None:
+    """Record a span that began at ``started`` (time.monotonic())."""
+    if _tracer is not None:
+        _tracer.record(name, started, args)
+
+
+def span(name: str, **args: Any) -> contextlib.AbstractContextManager[None]:
+    """Return a context manager recording its body as a span."""
+    if _tracer is None:
+        return _DISABLED
+    return _span(_tracer, name, args)
+
+
+@contextlib.contextmanager
+def _span(tracer: Tracer, name: str, args: dict[str, Any]) -> Iterator[None]:
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        tracer.record(name, started, args)
@@ -0,0 +1,147 @@
+"""Per-device request scheduling: one exchange in flight, commands first."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+_T = TypeVar("_T")
+
+# Lower value runs first
+PRIORITY_COMMAND = 0
+PRIORITY_POLL = 1
+# Polls of units that have been failing; they yield to healthy ones
+PRIORITY_RETRY = 2
+
+
+@dataclass(eq=False)
+class _Job:
+    """A queued unit of device I/O, ordered by (priority, submission)."""
+
+    priority: int
+    seq: int
+    factory: Callable[[], Awaitable[Any]]
+    future: asyncio.Future[Any]
+    key: str | None = None
+    preemptible: bool = False
+    task: asyncio.Task[None] | None = None
+    # Set once _execute() runs: only then does its cleanup run on cancel
+    started: bool = False
+    preempted: bool = False
+
+    def __lt__(self, other: _Job) -> bool:
+        """Order by priority, then submission (for the heap)."""
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class RequestScheduler:
+    """
+    Run device jobs at most ``max_in_flight`` at a time, by priority.
+
+    The unit handles one exchange at a time reliably, so a client runs
+    everything through one scheduler: a command waits for at most the
+    job in flight, never for a queue of polls. Jobs submitted with a
+    ``key`` are coalesced (a second poll while one is queued or running
+    just shares its result), and a ``preemptible`` job in flight is
+    cancelled and re-queued when a higher priority job arrives, so a
+    poll stuck on a timeout does not delay a user's command.
+    """
+
+    def __init__(self, max_in_flight: int = 1) -> None:
+        """Initialize an idle scheduler."""
+        self._max_in_flight = max_in_flight
+        self._queue: list[_Job] = []
+        self._running: list[_Job] = []
+        self._by_key: dict[str, _Job] = {}
+        self._seq = itertools.count()
+
+    @property
+    def busy(self) -> bool:
+        """Return true while any job runs or waits."""
+        return bool(self._running or self._queue)
+
+    async def run(
+        self,
+        priority: int,
+        factory: Callable[[], Awaitable[_T]],
+        *,
+        key: str | None = None,
+        preemptible: bool = False,
+    ) -> _T:
+        """
+        Run ``factory()`` when its turn comes and return its result.
+
+        Once submitted a job runs to completion even if the caller stops
+        waiting, so a multi-step command is never cut in half.
+        """
+        if key is not None and (existing := self._by_key.get(key)) is not None:
+            return await asyncio.shield(existing.future)
+
+        job = _Job(
+            priority,
+            next(self._seq),
+            factory,
+            asyncio.get_running_loop().create_future(),
+            key,
+            preemptible,
+        )
+        heapq.heappush(self._queue, job)
+        if key is not None:
+            self._by_key[key] = job
+        self._preempt_for(job)
+        self._start_next()
+        return await asyncio.shield(job.future)
+
+    def _preempt_for(self, job: _Job) -> None:
+        """Cancel a lower priority preemptible job in flight, if full."""
+        if len(self._running) < self._max_in_flight:
+            return
+        victim = max(self._running)
+        if not (victim.preemptible and victim.priority > job.priority and victim.task):
+            return
+        if victim.started:
+            # _execute() puts it back in line when the cancel lands
+            victim.preempted = True
+            victim.task.cancel()
+            return
+        # Started in this same tick: cancelled now, its coroutine never
+        # runs (nor its finally), so put it back in line here
+        victim.task.cancel()
+        victim.task = None
+        self._running.remove(victim)
+        heapq.heappush(self._queue, victim)
+
+    def _start_next(self) -> None:
+        """Start queued jobs while there is room."""
+        while self._queue and len(self._running) < self._max_in_flight:
+            job = heapq.heappop(self._queue)
+            self._running.append(job)
+            job.task = asyncio.get_running_loop().create_task(self._execute(job))
+
+    async def _execute(self, job: _Job) -> None:
+        """Run one job and settle its future."""
+        job.started = True
+        try:
+            result = await job.factory()
+        except asyncio.CancelledError:
+            if not job.preempted:
+                job.future.cancel()
+                raise
+            # Back in line; the preempting job is ahead of it
+            job.preempted = job.started = False
+            heapq.heappush(self._queue, job)
+        except Exception as err:  # noqa: BLE001 - handed to the submitter
+            job.future.set_exception(err)
+        else:
+            job.future.set_result(result)
+        finally:
+            self._running.remove(job)
+            if job.future.done() and job.key is not None:
+                self._by_key.pop(job.key, None)
+            self._start_next()
@@ -61,7 +61,9 @@ class GreeVersatiDeviceModeSelect(GreeVersatiEntity, SelectEntity):
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option (device mode)."""
-        await self._client.set_device_mode(option)
+        if not await self._client.set_device_mode(option):
+            # Held for replay: the unit is unreachable, nothing to settle
+            return
         # Publish the expected state; the unit reports transitional values
         # right after a mode change, so an immediate poll would lie
         self.coordinator.async_apply_optimistic_device_mode(option)
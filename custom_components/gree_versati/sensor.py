@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -10,16 +11,24 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.const import EntityCategory, UnitOfTemperature
+from homeassistant.const import (
+    EntityCategory,
+    UnitOfInformation,
+    UnitOfTemperature,
+    UnitOfTime,
+)
 
 from .entity import GreeVersatiEntity
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from .coordinator import GreeVersatiDataUpdateCoordinator
     from .data import GreeVersatiConfigEntry
+    from .protocol import DeviceMetrics
 
 # All I/O goes through the coordinator/client; no parallel entity updates
 PARALLEL_UPDATES = 0
@@ -57,6 +66,88 @@ SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
 )
 
 
+@dataclass(frozen=True, kw_only=True)
+class GreeVersatiMetricDescription(SensorEntityDescription):
+    """A wire counter of the unit's connection, read from client metrics."""
+
+    value_fn: Callable[[DeviceMetrics], float | None]
+    entity_category: EntityCategory | None = EntityCategory.DIAGNOSTIC
+    entity_registry_enabled_default: bool = False
+
+
+def _milliseconds(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+# Off by default: for finding units with bad links and tuning intervals
+METRIC_DESCRIPTIONS: tuple[GreeVersatiMetricDescription, ...] = (
+    GreeVersatiMetricDescription(
+        key="requests",
+        translation_key="requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: sum(metrics.requests.values()),
+    ),
+    GreeVersatiMetricDescription(
+        key="timeouts",
+        translation_key="timeouts",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.timeouts,
+    ),
+    GreeVersatiMetricDescription(
+        key="retransmits",
+        translation_key="retransmits",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.retransmits,
+    ),
+    GreeVersatiMetricDescription(
+        key="decrypt_failures",
+        translation_key="decrypt_failures",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.decrypt_failures,
+    ),
+    GreeVersatiMetricDescription(
+        key="rtt_p50",
+        translation_key="rtt_p50",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        value_fn=lambda metrics: _milliseconds(metrics.rtt.percentile(0.5)),
+    ),
+    GreeVersatiMetricDescription(
+        key="rtt_p95",
+        translation_key="rtt_p95",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        value_fn=lambda metrics: _milliseconds(metrics.rtt.percentile(0.95)),
+    ),
+    GreeVersatiMetricDescription(
+        key="poll_duration",
+        translation_key="poll_duration",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        value_fn=lambda metrics: _milliseconds(metrics.poll_duration),
+    ),
+    GreeVersatiMetricDescription(
+        key="bytes_sent",
+        translation_key="bytes_sent",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        value_fn=lambda metrics: metrics.bytes_sent,
+    ),
+    GreeVersatiMetricDescription(
+        key="bytes_received",
+        translation_key="bytes_received",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        value_fn=lambda metrics: metrics.bytes_received,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: GreeVersatiConfigEntry,
@@ -65,8 +156,16 @@ async def async_setup_entry(
     """Set up the Gree Versati sensor platform."""
     coordinator = entry.runtime_data.coordinator
     async_add_entities(
-        GreeVersatiSensor(coordinator, description)
-        for description in SENSOR_DESCRIPTIONS
+        [
+            *(
+                GreeVersatiSensor(coordinator, description)
+                for description in SENSOR_DESCRIPTIONS
+            ),
+            *(
+                GreeVersatiMetricSensor(coordinator, description)
+                for description in METRIC_DESCRIPTIONS
+            ),
+        ]
     )
 
 
@@ -87,3 +186,36 @@ class GreeVersatiSensor(GreeVersatiEntity, SensorEntity):
     def native_value(self) -> float | None:
         """Return the sensor value from coordinator data."""
         return self.coordinator.data.get(self.entity_description.key)
+
+
+class GreeVersatiMetricSensor(GreeVersatiEntity, SensorEntity):
+    """A wire counter of the unit's connection (diagnostic, off by default)."""
+
+    entity_description: GreeVersatiMetricDescription
+
+    def __init__(
+        self,
+        coordinator: GreeVersatiDataUpdateCoordinator,
+        description: GreeVersatiMetricDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{description.key}"
+
+    @property
+    def available(self) -> bool:
+        """Stay readable while polls fail: that is when the counters move."""
+        return True
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the counter from the client's metrics."""
+        return self.entity_description.value_fn(self._client.metrics)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Break the request count down by pack type."""
+        if self.entity_description.key != "requests":
+            return None
+        return dict(self._client.metrics.requests)
@@ -0,0 +1,209 @@
+"""Admin services for Gree Versati: performance investigation in the field."""
+
+from __future__ import annotations
+
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID, ATTR_MODE
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, LOGGER
+from .profiling import PROFILE_CPROFILE, PROFILE_MODES, CycleProfiler
+from .protocol.capture import capture_active, start_capture, stop_capture
+from .protocol.stalls import start_watching, stop_watching, watch_stats
+from .protocol.tracing import start_tracing, stop_tracing, tracing_active
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.core import ServiceResponse
+
+    from .data import GreeVersatiConfigEntry
+
+SERVICE_TRACE = "trace"
+SERVICE_PROFILE = "profile"
+SERVICE_WATCH_LOOP = "watch_loop"
+SERVICE_CAPTURE = "capture"
+ATTR_DURATION = "duration"
+ATTR_CYCLES = "cycles"
+ATTR_THRESHOLD = "threshold"
+ATTR_INCLUDE_PACKS = "include_packs"
+# Seconds a trace runs unless told otherwise, and at most
+TRACE_DURATION = 60
+TRACE_DURATION_MAX = 3600
+# Polls and commands profiled unless told otherwise, and at most
+PROFILE_CYCLES = 5
+PROFILE_CYCLES_MAX = 100
+# Milliseconds a protocol step may hold the event loop before a warning;
+# 0 stops watching
+WATCH_THRESHOLD = 20
+WATCH_THRESHOLD_MAX = 1000
+# Seconds a packet capture runs unless told otherwise, and at most
+CAPTURE_DURATION = 300
+CAPTURE_DURATION_MAX = 86400
+
+TRACE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=TRACE_DURATION): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=TRACE_DURATION_MAX)
+        ),
+    }
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): str,
+        vol.Optional(ATTR_CYCLES, default=PROFILE_CYCLES): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=PROFILE_CYCLES_MAX)
+        ),
+        vol.Optional(ATTR_MODE, default=PROFILE_CPROFILE): vol.In(PROFILE_MODES),
+    }
+)
+
+WATCH_LOOP_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_THRESHOLD, default=WATCH_THRESHOLD): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=WATCH_THRESHOLD_MAX)
+        ),
+    }
+)
+
+CAPTURE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=CAPTURE_DURATION): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=CAPTURE_DURATION_MAX)
+        ),
+        vol.Optional(ATTR_INCLUDE_PACKS, default=False): bool,
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services (admin users only)."""
+    for service, handler, schema in (
+        (SERVICE_TRACE, _async_trace, TRACE_SCHEMA),
+        (SERVICE_PROFILE, _async_profile, PROFILE_SCHEMA),
+        (SERVICE_WATCH_LOOP, _async_watch_loop, WATCH_LOOP_SCHEMA),
+        (SERVICE_CAPTURE, _async_capture, CAPTURE_SCHEMA),
+    ):
+        async_register_admin_service(
+            hass,
+            DOMAIN,
+            service,
+            partial(handler, hass),
+            schema=schema,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
+
+async def _async_trace(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Record spans of every entry for a while into the config directory."""
+    if tracing_active():
+        raise ServiceValidationError(
+            translation_domain=DOMAIN, translation_key="trace_running"
+        )
+    name = f"{DOMAIN}_trace_{dt_util.now():%Y%m%d-%H%M%S}.json"
+    path = Path(hass.config.path(name))
+    start_tracing(path)
+    LOGGER.info("Tracing for %ss into %s", call.data[ATTR_DURATION], path)
+
+    async def async_finish(_now: datetime) -> None:
+        if (tracer := stop_tracing()) is not None:
+            await hass.async_add_executor_job(tracer.close)
+            LOGGER.info("Trace written to %s", tracer.path)
+
+    async_call_later(hass, call.data[ATTR_DURATION], async_finish)
+    return {"path": str(path)}
+
+
+async def _async_profile(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Profile an entry's next polls and commands into the config directory."""
+    entry: GreeVersatiConfigEntry | None = hass.config_entries.async_get_entry(
+        call.data[ATTR_CONFIG_ENTRY_ID]
+    )
+    if (
+        entry is None
+        or entry.domain != DOMAIN
+        or entry.state is not ConfigEntryState.LOADED
+    ):
+        raise ServiceValidationError(
+            translation_domain=DOMAIN, translation_key="entry_not_loaded"
+        )
+    # One profile at a time across units: cProfile allows a single
+    # active profiler (Python 3.12+), and a tracemalloc profile that
+    # ends stops tracing under any other still running
+    if any(
+        other.runtime_data.client.profiler is not None
+        for other in hass.config_entries.async_entries(DOMAIN)
+        if other.state is ConfigEntryState.LOADED
+    ):
+        raise ServiceValidationError(
+            translation_domain=DOMAIN, translation_key="profile_running"
+        )
+
+    client = entry.runtime_data.client
+    mode = call.data[ATTR_MODE]
+    name = f"{DOMAIN}_{mode}_{dt_util.now():%Y%m%d-%H%M%S}"
+    stem = Path(hass.config.path(name))
+
+    async def async_write(profiler: CycleProfiler) -> None:
+        files = await hass.async_add_executor_job(profiler.write, stem)
+        LOGGER.info("Profile of %s written to %s", entry.title, files)
+
+    @callback
+    def done(profiler: CycleProfiler) -> None:
+        client.profiler = None
+        entry.async_create_background_task(
+            hass, async_write(profiler), f"{DOMAIN} write profile"
+        )
+
+    client.profiler = profiler = CycleProfiler(mode, call.data[ATTR_CYCLES], done)
+    LOGGER.info(
+        "Profiling the next %s polls and commands of %s (%s)",
+        call.data[ATTR_CYCLES],
+        entry.title,
+        mode,
+    )
+    return {"files": [str(path) for path in profiler.files(stem)]}
+
+
+async def _async_watch_loop(_hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Start (or with threshold 0 stop) watching for loop stalls."""
+    stats = watch_stats()
+    threshold = call.data[ATTR_THRESHOLD]
+    if threshold:
+        start_watching(threshold / 1000)
+        LOGGER.info("Watching protocol steps for stalls over %s ms", threshold)
+    else:
+        stop_watching()
+    # Counters restart with every call; return the ones collected so far
+    return {"steps": stats or {}}
+
+
+async def _async_capture(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Capture every datagram for a while into the config directory."""
+    if capture_active():
+        raise ServiceValidationError(
+            translation_domain=DOMAIN, translation_key="capture_running"
+        )
+    name = f"{DOMAIN}_capture_{dt_util.now():%Y%m%d-%H%M%S}.jsonl"
+    path = Path(hass.config.path(name))
+    start_capture(path, include_packs=call.data[ATTR_INCLUDE_PACKS])
+    LOGGER.info("Capturing packets for %ss into %s", call.data[ATTR_DURATION], path)
+
+    async def async_finish(_now: datetime) -> None:
+        if (recorder := stop_capture()) is not None:
+            await hass.async_add_executor_job(recorder.close)
+            LOGGER.info("Packet capture written to %s", recorder.path)
+
+    async_call_later(hass, call.data[ATTR_DURATION], async_finish)
+    return {"path": str(path)}
@@ -110,8 +110,9 @@ class GreeVersatiWaterHeater(GreeVersatiEntity, WaterHeaterEntity):
                 f"range {self.min_temp:.0f}-{self.max_temp:.0f}°C"
             )
             raise ServiceValidationError(msg)
-        await self._client.set_dhw_temperature(temperature)
-        self.coordinator.async_apply_optimistic(hot_water_temp_set=int(temperature))
+        # A command held for replay (unit unreachable) is not published
+        if await self._client.set_dhw_temperature(temperature):
+            self.coordinator.async_apply_optimistic(hot_water_temp_set=int(temperature))
 
     async def async_set_operation_mode(self, operation_mode: str) -> None:
         """Set new target operation mode."""
@@ -134,18 +135,23 @@ class GreeVersatiWaterHeater(GreeVersatiEntity, WaterHeaterEntity):
         else:
             combined = "hot_water"
 
-        await self._client.set_device_mode(combined)
+        # One transaction: the mode change and the FastHtWter boost flag
+        # (never the DHW on/off switch) share one commit and the final packet
+        async with self._client.transaction() as transaction:
+            transaction.set_device_mode(combined)
+            if operation_mode != OPERATION_MODE_OFF:
+                transaction.set_dhw_mode(
+                    "performance"
+                    if operation_mode == OPERATION_MODE_PERFORMANCE
+                    else "normal"
+                )
+        if transaction.journaled:
+            # Held for replay: the unit is unreachable, nothing to settle
+            return
 
-        # FastHtWter is only the boost flag, never the DHW on/off switch
         extra = {}
         if operation_mode != OPERATION_MODE_OFF:
-            dhw_boost = (
-                "performance"
-                if operation_mode == OPERATION_MODE_PERFORMANCE
-                else "normal"
-            )
-            await self._client.set_dhw_mode(dhw_boost)
-            extra["fast_heat_water"] = dhw_boost == "performance"
+            extra["fast_heat_water"] = operation_mode == OPERATION_MODE_PERFORMANCE
 
         # Publish the expected state; the unit reports transitional values
         # right after a mode change, so an immediate poll would lie
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Run the standalone collector without Home Assistant installed.
+
+Importing ``custom_components.gree_versati.protocol`` first runs the
+integration's ``__init__``, which needs Home Assistant. The protocol
+package itself has no such dependency, so this loads it on its own as
+``gree_versati_protocol``. The integration directory cannot simply go
+on the import path: its ``select.py`` would shadow the standard
+library's. Spawned workers re-run this script before they start, so
+they load the package the same way::
+
+    python scripts/collector.py targets.json --workers 4
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+PACKAGE = "gree_versati_protocol"
+PROTOCOL_DIR = (
+    Path(__file__).resolve().parent.parent / "custom_components" / "gree_versati"
+) / "protocol"
+
+if PACKAGE not in sys.modules:
+    spec = importlib.util.spec_from_file_location(
+        PACKAGE,
+        PROTOCOL_DIR / "__init__.py",
+        submodule_search_locations=[str(PROTOCOL_DIR)],
+    )
+    package = importlib.util.module_from_spec(spec)
+    sys.modules[PACKAGE] = package
+    spec.loader.exec_module(package)
+
+from gree_versati_protocol.collector import main  # noqa: E402
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Measure inline vs offloaded codec work for a burst of unit polls.
+
+Every poll of a unit decodes one status response per batch (GCM, the
+full column set). The burst runs all units at once, as after a restart
+or a fleet-wide refresh, while a heartbeat task records how late the
+event loop runs it: that lateness is what the rest of Home Assistant
+sees. Run from the repository root::
+
+    python -m tests.protocol.bench_codec --units 1 10 50 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+
+from custom_components.gree_versati.protocol import (
+    AwhpDevice,
+    AwhpProps,
+    DeviceInfo,
+    shared_codec_executor,
+)
+from custom_components.gree_versati.protocol.cipher import GcmCipher
+from custom_components.gree_versati.protocol.device import (
+    STATUS_BATCH_SIZE,
+)
+
+KEY = "0123456789abcdef"
+HEARTBEAT = 0.005
+
+
+def _responses() -> list[dict]:
+    """Return one encrypted status response per batch of all columns."""
+    cipher = GcmCipher(KEY)
+    columns = [prop.value for prop in AwhpProps]
+    responses = []
+    for start in range(0, len(columns), STATUS_BATCH_SIZE):
+        cols = columns[start : start + STATUS_BATCH_SIZE]
+        pack, tag = cipher.encrypt(
+            {"t": "dat", "mac": "f4911e000001", "cols": cols, "dat": [1] * len(cols)}
+        )
+        responses.append({"t": "pack", "i": 0, "pack": pack, "tag": tag})
+    return responses
+
+
+async def _burst(units: int, *, offload: bool) -> tuple[float, float]:
+    """Decode a poll for every unit at once; return (wall, max loop lag)."""
+    executor = shared_codec_executor() if offload else None
+    devices = [
+        AwhpDevice(
+            DeviceInfo("127.0.0.1", 7000, f"f4911e{index:06x}"),
+            key=KEY,
+            cipher_type="gcm",
+            codec_executor=executor,
+        )
+        for index in range(units)
+    ]
+    responses = _responses()
+    cipher = GcmCipher(KEY)
+    lags: list[float] = []
+    done = asyncio.Event()
+
+    async def heartbeat() -> None:
+        while not done.is_set():
+            expected = time.perf_counter() + HEARTBEAT
+            await asyncio.sleep(HEARTBEAT)
+            lags.append(time.perf_counter() - expected)
+
+    async def poll(device: AwhpDevice) -> None:
+        for response in responses:
+            # Each batch is its own exchange: yield as the socket would
+            await asyncio.sleep(0)
+            await device._run_codec(
+                "decrypt", device._decrypt_response, response, cipher
+            )
+
+    beat = asyncio.create_task(heartbeat())
+    await asyncio.sleep(HEARTBEAT * 2)
+    started = time.perf_counter()
+    await asyncio.gather(*(poll(device) for device in devices))
+    wall = time.perf_counter() - started
+    done.set()
+    await beat
+    return wall, max(lags, default=0.0)
+
+
+async def _main(units: list[int], rounds: int) -> None:
+    sys.stdout.write("units  mode      wall ms  max lag ms\n")
+    for count in units:
+        for offload in (False, True):
+            results = [await _burst(count, offload=offload) for _ in range(rounds)]
+            wall = statistics.median(result[0] for result in results) * 1000
+            lag = statistics.median(result[1] for result in results) * 1000
+            mode = "executor" if offload else "inline"
+            sys.stdout.write(f"{count:5d}  {mode:8s}  {wall:7.1f}  {lag:10.1f}\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--units", type=int, nargs="+", default=[1, 10, 50, 200])
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(_main(args.units, args.rounds))
@@ -0,0 +1,152 @@
+"""
+Measure how collector throughput scales with its worker processes.
+
+``--servers`` child processes each run a share of the emulated units,
+on 127.0.0.1 with a port each; give them enough cores that the units
+are not the bottleneck.
+For each worker count, ``scripts/collector.py`` polls all units with no
+pause between rounds; the snapshots it prints in ``--duration`` seconds,
+after the first, give the throughput. The speedup is relative to the
+first worker count. Expect it to level off at the number of free cores,
+counting the servers. Run from the repository root::
+
+    python -m tests.protocol.bench_collector --units 400 --workers 1 2 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import signal
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from tests.protocol.emulator import FakeVersati
+
+if TYPE_CHECKING:
+    from multiprocessing.queues import Queue
+    from multiprocessing.synchronize import Event
+
+SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "collector.py"
+# Seconds to wait for the servers to bring their units up
+SERVER_START_TIMEOUT = 60
+
+
+def _serve(
+    size: int, first: int, targets: Queue[list[dict[str, Any]]], stop: Event
+) -> None:
+    """Run ``size`` units until ``stop`` is set (child process)."""
+
+    async def main() -> None:
+        units = [
+            FakeVersati(mac=f"f4911e{first + index:06x}", properties={"Pow": 1})
+            for index in range(size)
+        ]
+        found = []
+        for unit in units:
+            ip, port = await unit.start()
+            found.append(
+                {
+                    "ip": ip,
+                    "port": port,
+                    "mac": unit.mac,
+                    "key": unit.device_key,
+                    "cipher_type": unit.cipher_kind,
+                }
+            )
+        targets.put(found)
+        await asyncio.get_running_loop().run_in_executor(None, stop.wait)
+        for unit in units:
+            unit.close()
+
+    asyncio.run(main())
+
+
+async def _measure(targets_file: Path, workers: int, duration: float) -> float:
+    """Run the collector with ``workers`` workers; return snapshots per second."""
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        str(SCRIPT),
+        str(targets_file),
+        "--workers",
+        str(workers),
+        "--interval",
+        "0",
+        stdout=asyncio.subprocess.PIPE,
+    )
+    try:
+        # Start timing once the workers are up and answering
+        await process.stdout.readline()
+        count = 0
+        started = time.perf_counter()
+        deadline = started + duration
+        while (remaining := deadline - time.perf_counter()) > 0:
+            try:
+                await asyncio.wait_for(process.stdout.readline(), remaining)
+            except TimeoutError:
+                break
+            count += 1
+        return count / (time.perf_counter() - started)
+    finally:
+        # Interrupted, the collector stops its workers before it exits
+        process.send_signal(signal.SIGINT)
+        await process.wait()
+
+
+def main() -> None:
+    """Run the collector for each worker count against one set of units."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--units", type=int, default=400)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--servers", type=int, default=2)
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+
+    queue: Queue[list[dict[str, Any]]] = multiprocessing.Queue()
+    stop = multiprocessing.Event()
+    share = -(-args.units // args.servers)
+    servers = [
+        multiprocessing.Process(
+            target=_serve,
+            args=(min(share, args.units - first), first, queue, stop),
+            daemon=True,
+        )
+        for first in range(0, args.units, share)
+    ]
+    for server in servers:
+        server.start()
+    try:
+        targets = [
+            target
+            for _ in servers
+            for target in queue.get(timeout=SERVER_START_TIMEOUT)
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            targets_file = Path(directory) / "targets.json"
+            targets_file.write_text(json.dumps(targets))
+            sys.stdout.write(
+                f"{len(targets)} units, {args.servers} servers, "
+                f"{os.cpu_count()} cores\n workers  snapshots/s  speedup\n"
+            )
+            baseline = None
+            for workers in args.workers:
+                rate = asyncio.run(_measure(targets_file, workers, args.duration))
+                baseline = baseline or rate
+                sys.stdout.write(
+                    f"{workers:8d}  {rate:11.1f}  {rate / baseline:7.2f}\n"
+                )
+                sys.stdout.flush()
+    finally:
+        stop.set()
+        for server in servers:
+            server.join()
+
+
+if __name__ == "__main__":
+    main()
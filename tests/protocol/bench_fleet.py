@@ -0,0 +1,208 @@
+"""
+Load-test the client stack against emulated fleets of growing size.
+
+For each size, a child process runs a ``FakeFleet`` so that the units'
+work does not count against the event loop being measured. This
+process scans for the units and sets up a client for each one. It then
+polls every unit ``--rounds`` times through one ``PollFleet``, the way
+the coordinators would. For each size it reports:
+
+- the units found by the scan
+- polls per second
+- p50 and p99 poll latency, fleet queue wait included
+- p99 of the poll alone
+- event loop utilization: the share of wall time the loop spent
+  running callbacks rather than waiting for sockets
+
+Needs Linux, whose loopback routes all of 127.0.0.0/8. Run from the
+repository root::
+
+    python -m tests.protocol.bench_fleet --units 10 100 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import math
+import multiprocessing
+import resource
+import sys
+import time
+from typing import TYPE_CHECKING, Any
+
+from custom_components.gree_versati.client import GreeVersatiClient
+from custom_components.gree_versati.fleet import FLEET_MAX_IN_FLIGHT, PollFleet
+from custom_components.gree_versati.protocol import search_devices
+from tests.protocol.emulator import FakeFleet
+
+if TYPE_CHECKING:
+    from multiprocessing.queues import Queue
+    from multiprocessing.synchronize import Event
+
+# Clients binding at once while the fleet is set up
+BIND_CONCURRENCY = 50
+# Seconds to wait for the child process to bring its units up
+FLEET_START_TIMEOUT = 60
+
+
+class _LoopMonitor:
+    """
+    Time how long the event loop waits in select().
+
+    Stands in for the loop's selector and forwards everything to it;
+    the rest of the wall time the loop was busy.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._selector = loop._selector  # type: ignore[attr-defined]
+        self.idle = 0.0
+        loop._selector = self  # type: ignore[attr-defined]
+
+    def select(self, timeout: float | None = None) -> Any:
+        started = time.perf_counter()
+        try:
+            return self._selector.select(timeout)
+        finally:
+            self.idle += time.perf_counter() - started
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._selector, name)
+
+    def uninstall(self) -> None:
+        self._loop._selector = self._selector  # type: ignore[attr-defined]
+
+
+def _serve(size: int, seed: int, address: Queue, stop: Event) -> None:
+    """Run a fleet until ``stop`` is set (child process)."""
+
+    async def main() -> None:
+        fleet = FakeFleet(size, seed=seed)
+        address.put(await fleet.start())
+        await asyncio.get_running_loop().run_in_executor(None, stop.wait)
+        fleet.close()
+
+    asyncio.run(main())
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of the samples."""
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+async def _measure(  # noqa: PLR0913 - benchmark knobs
+    size: int,
+    ip: str,
+    port: int,
+    *,
+    rounds: int,
+    in_flight: int,
+    scan_wait: float,
+    offload: bool,
+) -> str:
+    """Scan, bind and poll a running fleet; return the report line."""
+    infos = await search_devices(wait_for=scan_wait, port=port, broadcast_address=ip)
+    clients = [
+        GreeVersatiClient(info.ip, info.port, info.mac, offload_codec=offload)
+        for info in infos
+    ]
+    binding = asyncio.Semaphore(BIND_CONCURRENCY)
+
+    async def initialize(client: GreeVersatiClient) -> None:
+        async with binding:
+            await client.initialize()
+
+    await asyncio.gather(*(initialize(client) for client in clients))
+
+    fleet = PollFleet(in_flight)
+    latencies: list[float] = []
+    services: list[float] = []
+    failures = 0
+
+    async def poll(client: GreeVersatiClient) -> None:
+        nonlocal failures
+        queued = time.perf_counter()
+
+        async def timed() -> None:
+            started = time.perf_counter()
+            await client.async_get_data()
+            services.append(time.perf_counter() - started)
+
+        try:
+            await fleet.run(timed)
+        except RuntimeError:
+            failures += 1
+            return
+        latencies.append(time.perf_counter() - queued)
+
+    monitor = _LoopMonitor(asyncio.get_running_loop())
+    started = time.perf_counter()
+    for _ in range(rounds):
+        await asyncio.gather(*(poll(client) for client in clients))
+    wall = time.perf_counter() - started
+    monitor.uninstall()
+
+    if not latencies:
+        return f"{size:6d}  {len(infos):5d}  every poll failed"
+    return (
+        f"{size:6d}  {len(infos):5d}  {len(latencies) / wall:7.1f}  "
+        f"{_percentile(latencies, 0.5) * 1000:7.1f}  "
+        f"{_percentile(latencies, 0.99) * 1000:8.1f}  "
+        f"{_percentile(services, 0.99) * 1000:8.1f}  "
+        f"{(1 - monitor.idle / wall) * 100:7.1f}  {failures:6d}"
+    )
+
+
+def _run(size: int, args: argparse.Namespace) -> str:
+    """Measure one fleet size against a fresh fleet process."""
+    address: Queue = multiprocessing.Queue()
+    stop = multiprocessing.Event()
+    process = multiprocessing.Process(
+        target=_serve, args=(size, args.seed, address, stop), daemon=True
+    )
+    process.start()
+    try:
+        ip, port = address.get(timeout=FLEET_START_TIMEOUT)
+        return asyncio.run(
+            _measure(
+                size,
+                ip,
+                port,
+                rounds=args.rounds,
+                in_flight=args.in_flight,
+                scan_wait=args.scan_wait,
+                offload=args.offload_codec,
+            )
+        )
+    finally:
+        stop.set()
+        process.join()
+
+
+def main() -> None:
+    """Run the load test for each fleet size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--units", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--in-flight", type=int, default=FLEET_MAX_IN_FLIGHT)
+    parser.add_argument("--scan-wait", type=float, default=2.0)
+    parser.add_argument("--offload-codec", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # A socket per unit, plus one per exchange in flight
+    _, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+    sys.stdout.write(
+        " units  found  polls/s  p50 ms    p99 ms  poll p99  loop %  failed\n"
+    )
+    for size in args.units:
+        sys.stdout.write(_run(size, args) + "\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
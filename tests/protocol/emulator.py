@@ -3,15 +3,18 @@ In-process UDP emulator of a Gree Versati unit for protocol tests.
 
 Implements the observable wire behavior: answers scans with a ``dev``
 pack, binds with a per-device key, serves batched ``status`` requests
-and applies ``cmd`` property writes.
+and applies ``cmd`` property writes. ``FakeFleet`` runs many such units
+at once, each on its own loopback address, for discovery and load tests.
 """
 
 from __future__ import annotations
 
 import asyncio
 import json
+import random
 from typing import Any
 
+from custom_components.gree_versati.protocol import AwhpProps, DeviceInfo
 from custom_components.gree_versati.protocol.cipher import create_cipher
 
 MAX_STATUS_COLS = 23
@@ -33,14 +36,18 @@ class FakeVersati(asyncio.DatagramProtocol):
         self.device_key = device_key
         self.properties: dict[str, Any] = properties if properties is not None else {}
         self.received_cmds: list[dict[str, Any]] = []
+        self.status_requests: list[list[str]] = []
+        # Indexes (into status_requests) of requests to leave unanswered,
+        # as if the datagram was lost
+        self.drop_status_requests: set[int] = set()
         self.max_status_cols_seen = 0
         self.transport: asyncio.DatagramTransport | None = None
 
-    async def start(self) -> tuple[str, int]:
-        """Start listening; returns (ip, port)."""
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> tuple[str, int]:
+        """Start listening (on an ephemeral port by default); returns (ip, port)."""
         loop = asyncio.get_running_loop()
         self.transport, _ = await loop.create_datagram_endpoint(
-            lambda: self, local_addr=("127.0.0.1", 0)
+            lambda: self, local_addr=(host, port)
         )
         ip, port = self.transport.get_extra_info("sockname")[:2]
         return ip, port
@@ -86,6 +93,9 @@ class FakeVersati(asyncio.DatagramProtocol):
             )
         elif kind == "status":
             cols = pack.get("cols", [])
+            self.status_requests.append(cols)
+            if len(self.status_requests) - 1 in self.drop_status_requests:
+                return
             self.max_status_cols_seen = max(self.max_status_cols_seen, len(cols))
             if len(cols) > MAX_STATUS_COLS:
                 # Real units truncate/ignore oversized requests
@@ -150,3 +160,94 @@ class FakeVersati(asyncio.DatagramProtocol):
             message["tag"] = tag
         assert self.transport is not None
         self.transport.sendto(json.dumps(message).encode(), addr)
+
+
+class _ScanRelay(asyncio.DatagramProtocol):
+    """Stands in for the broadcast: hands each scan to every unit."""
+
+    def __init__(self, units: list[FakeVersati], jitter: float) -> None:
+        self.units = units
+        self.jitter = jitter
+        self._rng = random.Random(0)  # noqa: S311 - reproducible, not secret
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        if json.loads(data.decode()).get("t") != "scan":
+            return
+        loop = asyncio.get_running_loop()
+        for unit in self.units:
+            # Each answers from its own address, a little apart, as on a
+            # real LAN; all at once would overflow the scanner's buffer
+            loop.call_later(
+                self._rng.uniform(0, self.jitter), unit.datagram_received, data, addr
+            )
+
+
+class FakeFleet:
+    """
+    Many fake units, each with its own loopback address, MAC and key.
+
+    Units listen on 127.0.x.y (x from 1), all on the same port, as real
+    units all listen on 7000; a scan relay on 127.0.0.1 at that port
+    plays the broadcast address. Needs a loopback that routes all of
+    127.0.0.0/8, as Linux does. Cipher kinds alternate through
+    ``cipher_kinds``; keys and property values are drawn from ``seed``,
+    so a fleet is the same from run to run. Scan answers are spread
+    over ``scan_jitter`` seconds.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        cipher_kinds: tuple[str, ...] = ("ecb", "gcm"),
+        seed: int = 0,
+        scan_jitter: float = 0.1,
+    ) -> None:
+        """Initialize the units (nothing listens until start())."""
+        rng = random.Random(seed)  # noqa: S311 - reproducible, not secret
+        self.units = [
+            FakeVersati(
+                mac=f"f4911e{index:06x}",
+                cipher_kind=cipher_kinds[index % len(cipher_kinds)],
+                device_key=f"{rng.getrandbits(64):016x}",
+                properties={prop.value: rng.randint(0, 60) for prop in AwhpProps},
+            )
+            for index in range(size)
+        ]
+        self.scan_jitter = scan_jitter
+        self.port = 0
+        self._relay: asyncio.DatagramTransport | None = None
+
+    @staticmethod
+    def address(index: int) -> str:
+        """Return the loopback address of the unit at ``index``."""
+        return f"127.0.{1 + index // 254}.{1 + index % 254}"
+
+    async def start(self) -> tuple[str, int]:
+        """Start the relay and every unit; returns the relay's (ip, port)."""
+        loop = asyncio.get_running_loop()
+        self._relay, _ = await loop.create_datagram_endpoint(
+            lambda: _ScanRelay(self.units, self.scan_jitter),
+            local_addr=("127.0.0.1", 0),
+        )
+        ip, self.port = self._relay.get_extra_info("sockname")[:2]
+        await asyncio.gather(
+            *(
+                unit.start(self.address(index), self.port)
+                for index, unit in enumerate(self.units)
+            )
+        )
+        return ip, self.port
+
+    def close(self) -> None:
+        """Stop the relay and every unit."""
+        if self._relay is not None:
+            self._relay.close()
+        for unit in self.units:
+            unit.close()
+
+    def device_infos(self) -> list[DeviceInfo]:
+        """Return what discovery would find, without scanning."""
+        return [
+            DeviceInfo(ip=self.address(index), port=self.port, mac=unit.mac)
+            for index, unit in enumerate(self.units)
+        ]
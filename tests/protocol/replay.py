@@ -0,0 +1,120 @@
+"""
+Replay a packet capture as a unit, at real or accelerated speed.
+
+A capture (see ``protocol/capture.py``) holds each datagram a unit was
+sent and each it answered with. ``load_exchanges()`` pairs them up per
+unit address; ``ReplayVersati`` then listens like ``FakeVersati`` and
+answers the n-th request with the n-th captured response, after the
+captured round trip divided by ``speed``. A request that went
+unanswered in the field is left unanswered again, so timeouts and
+retransmits replay too. The responses are the unit's own encrypted
+datagrams: a device replaying from its bind onwards learns the key from
+the capture, without it ever being written down in cleartext.
+
+    exchanges = load_exchanges(Path("capture.jsonl"))[("192.168.1.20", 7000)]
+    unit = ReplayVersati(exchanges, speed=10)
+    ip, port = await unit.start()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from custom_components.gree_versati.protocol.capture import read_capture
+from tests.protocol.emulator import FakeVersati
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@dataclass
+class Exchange:
+    """One request datagram and what the unit answered."""
+
+    # Seconds since the capture started
+    at: float
+    request: str
+    # None when the unit never answered (the datagram was lost)
+    response: str | None = None
+    rtt: float | None = None
+
+
+def load_exchanges(path: Path) -> dict[tuple[str, int], list[Exchange]]:
+    """
+    Return the exchanges of a capture, in order, per unit address.
+
+    The client waits for each answer before it sends the next request
+    to the same unit, so a response belongs to the latest request sent
+    to its address. Broadcast scans are addressed to no single unit and
+    are left out, as are cleartext pack records.
+    """
+    exchanges: dict[tuple[str, int], list[Exchange]] = {}
+    for elapsed, direction, ip, port, kind, payload in read_capture(path):
+        if kind != "datagram":
+            continue
+        addr = (ip, port)
+        if direction == "out":
+            exchanges.setdefault(addr, []).append(Exchange(elapsed, payload))
+            continue
+        pending = exchanges.get(addr)
+        if pending and pending[-1].response is None:
+            pending[-1].response = payload
+            pending[-1].rtt = elapsed - pending[-1].at
+    return exchanges
+
+
+class ReplayVersati(FakeVersati):
+    """
+    A unit that answers with captured responses, in capture order.
+
+    ``speed`` divides the captured round trips (``None`` answers at
+    once). With ``strict``, a request that differs from the captured
+    one is noted in ``mismatches``; only deterministic requests compare
+    equal, so use it with ECB units.
+    """
+
+    def __init__(
+        self,
+        exchanges: list[Exchange],
+        speed: float | None = 1.0,
+        *,
+        strict: bool = False,
+    ) -> None:
+        """Initialize from the exchanges of one unit."""
+        answered = next((e.response for e in exchanges if e.response), None)
+        mac = json.loads(answered)["cid"] if answered else "f4911e000001"
+        super().__init__(mac=mac)
+        self.exchanges = exchanges
+        self.speed = speed
+        self.strict = strict
+        self.served = 0
+        self.mismatches: list[int] = []
+        # Requests received after the capture ran out
+        self.unexpected = 0
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Answer one request with the next captured response."""
+        if self.served >= len(self.exchanges):
+            self.unexpected += 1
+            return
+        index = self.served
+        exchange = self.exchanges[index]
+        self.served += 1
+        if self.strict and data.decode() != exchange.request:
+            self.mismatches.append(index)
+        if exchange.response is None:
+            return
+        response = exchange.response.encode()
+        if self.speed is None or not exchange.rtt:
+            self._send(response, addr)
+            return
+        asyncio.get_running_loop().call_later(
+            exchange.rtt / self.speed, self._send, response, addr
+        )
+
+    def _send(self, response: bytes, addr: tuple[str, int]) -> None:
+        if self.transport is not None and not self.transport.is_closing():
+            self.transport.sendto(response, addr)
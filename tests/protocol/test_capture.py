@@ -0,0 +1,136 @@
+"""Tests for packet capture and capture replay."""
+
+from __future__ import annotations
+
+import dataclasses
+import time
+
+import pytest
+
+from custom_components.gree_versati.protocol import (
+    AwhpDevice,
+    AwhpProps,
+    DeviceInfo,
+    capture,
+)
+from tests.protocol.emulator import FakeVersati
+from tests.protocol.replay import ReplayVersati, load_exchanges
+
+pytestmark = pytest.mark.usefixtures("socket_enabled")
+
+PROPERTIES = {"Pow": 1, "Mod": 2, "HeWatOutTemSet": 42}
+
+
+@pytest.fixture(autouse=True)
+def _no_leftover_recorder():
+    yield
+    if (recorder := capture.stop_capture()) is not None:
+        recorder.close()
+
+
+def _device_for(mac: str, ip: str, port: int, **kwargs: object) -> AwhpDevice:
+    return AwhpDevice(DeviceInfo(ip=ip, port=port, mac=mac), **kwargs)
+
+
+async def _record_poll(path, unit: FakeVersati, *, include_packs: bool = False):
+    """Bind to and poll ``unit`` while capturing; return the poll result."""
+    ip, port = await unit.start()
+    try:
+        capture.start_capture(path, include_packs=include_packs)
+        device = _device_for(unit.mac, ip, port, timeout=0.3)
+        data = await device.get_all_properties()
+        capture.stop_capture().close()
+    finally:
+        unit.close()
+    return data, (ip, port)
+
+
+def test_nothing_is_recorded_while_off():
+    """Without a recorder the hooks are no-ops."""
+    assert not capture.capture_active()
+    capture.record_datagram("out", ("127.0.0.1", 7000), b"{}")
+    capture.record_pack("in", ("127.0.0.1", 7000), {"t": "dat"})
+
+
+@pytest.mark.asyncio
+async def test_capture_holds_every_datagram(tmp_path):
+    """Each request and answer is one timed record; packs hide the key."""
+    path = tmp_path / "capture.jsonl"
+    unit = FakeVersati(properties=PROPERTIES)
+    _, addr = await _record_poll(path, unit, include_packs=True)
+
+    records = list(capture.read_capture(path))
+    datagrams = [record for record in records if record[4] == "datagram"]
+    packs = [record for record in records if record[4] == "pack"]
+    # A bind and one exchange per status batch
+    exchanges = 1 + len(unit.status_requests)
+    assert [record[1] for record in datagrams] == ["out", "in"] * exchanges
+    assert {tuple(record[2:4]) for record in records} == {addr}
+    assert [record[0] for record in records] == sorted(r[0] for r in records)
+    bindok = next(record[5] for record in packs if record[5]["t"] == "bindok")
+    assert bindok["key"] == "**REDACTED**"
+    assert unit.device_key not in path.read_text()
+
+
+@pytest.mark.asyncio
+async def test_replay_reproduces_the_poll(tmp_path):
+    """A fresh device binds and polls against the capture alone."""
+    path = tmp_path / "capture.jsonl"
+    recorded, addr = await _record_poll(path, FakeVersati(properties=PROPERTIES))
+
+    exchanges = load_exchanges(path)[addr]
+    unit = ReplayVersati(exchanges, speed=None, strict=True)
+    ip, port = await unit.start()
+    try:
+        device = _device_for(unit.mac, ip, port, timeout=0.3)
+        assert await device.get_all_properties() == recorded
+    finally:
+        unit.close()
+    assert device.key == "0123456789abcdef"
+    assert unit.served == len(exchanges)
+    assert unit.mismatches == []
+    assert unit.unexpected == 0
+
+
+@pytest.mark.asyncio
+async def test_replay_loses_what_the_field_lost(tmp_path):
+    """A datagram lost in the capture is lost again, and retried again."""
+    path = tmp_path / "capture.jsonl"
+    unit = FakeVersati(properties=PROPERTIES)
+    unit.drop_status_requests = {1}
+    recorded, addr = await _record_poll(path, unit)
+
+    exchanges = load_exchanges(path)[addr]
+    assert [exchange.response is None for exchange in exchanges].count(True) == 1
+    replay = ReplayVersati(exchanges, speed=None)
+    ip, port = await replay.start()
+    try:
+        device = _device_for(replay.mac, ip, port, timeout=0.3)
+        assert await device.get_all_properties() == recorded
+    finally:
+        replay.close()
+    assert device.metrics.retransmits == 1
+    assert device.metrics.timeouts == 1
+
+
+@pytest.mark.asyncio
+async def test_replay_speed_scales_round_trips(tmp_path):
+    """Answers come after the captured round trip divided by the speed."""
+    path = tmp_path / "capture.jsonl"
+    recorded, addr = await _record_poll(path, FakeVersati(properties=PROPERTIES))
+    # Pretend the field unit took half a second per answer
+    exchanges = [
+        dataclasses.replace(exchange, rtt=0.5)
+        for exchange in load_exchanges(path)[addr]
+    ]
+
+    unit = ReplayVersati(exchanges, speed=10)
+    ip, port = await unit.start()
+    try:
+        device = _device_for(unit.mac, ip, port, timeout=2.0)
+        started = time.monotonic()
+        assert await device.get_properties(AwhpProps) == recorded
+        elapsed = time.monotonic() - started
+    finally:
+        unit.close()
+    assert len(exchanges) * 0.05 <= elapsed < len(exchanges) * 0.5
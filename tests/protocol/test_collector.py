@@ -0,0 +1,112 @@
+"""Collector tests: worker processes polling emulated units."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import signal
+import sys
+from pathlib import Path
+
+import pytest
+
+from custom_components.gree_versati.protocol.collector import (
+    Collector,
+    CollectorTarget,
+)
+from tests.protocol.emulator import FakeVersati
+
+SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "collector.py"
+
+# Workers exercise real UDP sockets on loopback against the emulator
+pytestmark = pytest.mark.usefixtures("socket_enabled")
+
+
+@pytest.mark.asyncio
+async def test_collector_streams_snapshots_from_all_shards():
+    """Every unit is polled by some worker and decoded in the parent."""
+    units = [
+        FakeVersati(mac=f"f4911e00000{i}", properties={"Pow": 1, "Mod": i})
+        for i in range(1, 4)
+    ]
+    targets = []
+    for unit in units:
+        ip, port = await unit.start()
+        targets.append(CollectorTarget(ip, port, unit.mac, unit.device_key, "ecb"))
+
+    loop = asyncio.get_running_loop()
+    collector = Collector(targets, workers=2, interval=0.2, timeout=1.0)
+    collector.start()
+    try:
+        seen: dict[str, int] = {}
+        while len(seen) < len(units):
+            # The emulators live on this loop, so block in a thread
+            snapshot = await loop.run_in_executor(None, collector.get, 30.0)
+            assert snapshot.error is None
+            seen[snapshot.mac] = snapshot.values["Mod"]
+    finally:
+        collector.stop()
+        for unit in units:
+            unit.close()
+
+    assert seen == {"f4911e000001": 1, "f4911e000002": 2, "f4911e000003": 3}
+
+
+@pytest.mark.asyncio
+async def test_collector_reports_silent_units():
+    """A unit that does not answer yields an error snapshot, not silence."""
+    target = CollectorTarget("127.0.0.1", 1, "dead", "0123456789abcdef", "ecb")
+    loop = asyncio.get_running_loop()
+    with Collector([target], interval=0.2, timeout=0.2) as collector:
+        snapshot = await loop.run_in_executor(None, collector.get, 30.0)
+
+    assert snapshot.mac == "dead"
+    assert snapshot.values is None
+    assert "No response" in snapshot.error
+
+
+@pytest.mark.asyncio
+async def test_collector_script_runs_without_home_assistant(tmp_path):
+    """The script and its workers never import the integration package."""
+    unit = FakeVersati(properties={"Pow": 1, "Mod": 4})
+    ip, port = await unit.start()
+    targets = tmp_path / "targets.json"
+    targets.write_text(
+        json.dumps(
+            [
+                {
+                    "ip": ip,
+                    "port": port,
+                    "mac": unit.mac,
+                    "key": unit.device_key,
+                    "cipher_type": "ecb",
+                }
+            ]
+        )
+    )
+    # Shadow Home Assistant with a package that refuses to import
+    (tmp_path / "homeassistant").mkdir()
+    (tmp_path / "homeassistant" / "__init__.py").write_text(
+        "raise ImportError('Home Assistant is not available')\n"
+    )
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        str(SCRIPT),
+        str(targets),
+        "--interval",
+        "0.2",
+        stdout=asyncio.subprocess.PIPE,
+        env={**os.environ, "PYTHONPATH": str(tmp_path)},
+    )
+    try:
+        line = await asyncio.wait_for(process.stdout.readline(), 30)
+    finally:
+        # Interrupted, the script stops its workers before it exits
+        process.send_signal(signal.SIGINT)
+        await asyncio.wait_for(process.wait(), 30)
+        unit.close()
+
+    snapshot = json.loads(line)
+    assert snapshot["mac"] == unit.mac
+    assert snapshot["values"]["Mod"] == 4
@@ -2,18 +2,31 @@
 
 from __future__ import annotations
 
+import base64
+from unittest.mock import AsyncMock, patch
+
 import pytest
+from cryptography.hazmat.primitives import padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 
 from custom_components.gree_versati.protocol import (
     AwhpDevice,
     AwhpProps,
     DeviceInfo,
+    EcbCipher,
     GreeBindError,
+    GreeKeyError,
+    GreeProtocolError,
+    GreeTimeoutError,
+    shared_codec_executor,
+    shutdown_codec_executor,
 )
 from tests.protocol.emulator import MAX_STATUS_COLS, FakeVersati
 
 # These tests exercise real UDP sockets on loopback against the emulator
-pytestmark = pytest.mark.enable_socket
+pytestmark = pytest.mark.usefixtures("socket_enabled")
+
+KEY = "0123456789abcdef"
 
 
 def _device_for(unit: FakeVersati, ip: str, port: int, **kwargs: object) -> AwhpDevice:
@@ -92,6 +105,243 @@ async def test_get_all_properties_batched(cipher_kind):
         unit.close()
 
 
+@pytest.mark.asyncio
+async def test_offloaded_codec_round_trips():
+    """With a codec executor the same exchange decodes off the event loop."""
+    unit = FakeVersati(
+        cipher_kind="gcm", properties={"Pow": 1, "Mod": 4, "HeWatOutTemSet": 42}
+    )
+    ip, port = await unit.start()
+    try:
+        device = _device_for(unit, ip, port, codec_executor=shared_codec_executor())
+        data = await device.get_all_properties()
+
+        assert data["Pow"] == 1
+        assert data["HeWatOutTemSet"] == 42
+    finally:
+        unit.close()
+
+
+def test_codec_pool_restarts_after_shutdown():
+    """A shut-down pool takes no work; the next caller gets a fresh one."""
+    pool = shared_codec_executor()
+    assert pool.submit(sum, [1, 2]).result() == 3
+
+    shutdown_codec_executor()
+
+    with pytest.raises(RuntimeError):
+        pool.submit(sum, [1, 2])
+    assert shared_codec_executor() is not pool
+
+
+@pytest.mark.asyncio
+async def test_exchanges_charge_phases_to_the_running_cycle():
+    """Encrypt, network and decrypt time and batch sizes go to the cycle."""
+    unit = FakeVersati(properties={"Pow": 1})
+    ip, port = await unit.start()
+    try:
+        device = _device_for(unit, ip, port, key=unit.device_key, cipher_type="ecb")
+        with device.metrics.timing("poll") as cycle:
+            device.metrics.cycle = cycle
+            await device.get_all_properties()
+            device.metrics.cycle = None
+
+        assert set(cycle.phases) == {"encrypt", "network", "decrypt"}
+        assert sum(cycle.batches) == len(AwhpProps)
+        assert max(cycle.batches) <= MAX_STATUS_COLS
+        assert device.metrics.history()[0]["batches"] == cycle.batches
+    finally:
+        unit.close()
+
+
+@pytest.mark.asyncio
+async def test_get_properties_reads_only_requested_columns():
+    """A tiny read is one status exchange for just the given columns."""
+    unit = FakeVersati(properties={"Pow": 1, "Mod": 2, "HeWatOutTemSet": 42})
+    ip, port = await unit.start()
+    try:
+        device = _device_for(unit, ip, port)
+        data = await device.get_properties((AwhpProps.POWER, AwhpProps.MODE))
+
+        assert data == {"Pow": 1, "Mod": 2}
+        assert unit.status_requests == [["Pow", "Mod"]]
+        assert device.get_property(AwhpProps.MODE) == 2
+    finally:
+        unit.close()
+
+
+@pytest.mark.asyncio
+async def test_rebind_replaces_a_stale_key():
+    """A unit re-paired elsewhere is usable again after rebind()."""
+    unit = FakeVersati(properties={"Pow": 1})
+    ip, port = await unit.start()
+    try:
+        device = _device_for(unit, ip, port, key="fedcba9876543210", cipher_type="ecb")
+        device.timeout = 0.2
+        # The unit silently drops requests under the old key
+        with pytest.raises(GreeTimeoutError):
+            await device.get_properties([AwhpProps.POWER])
+
+        assert await device.rebind() == unit.device_key
+        assert await device.get_properties([AwhpProps.POWER]) == {"Pow": 1}
+    finally:
+        unit.close()
+
+
+def _ecb_pack(plain: bytes, key: str) -> str:
+    """Encrypt arbitrary bytes the way an ECB unit would."""
+    padder = padding.PKCS7(128).padder()
+    data = padder.update(plain) + padder.finalize()
+    encryptor = Cipher(algorithms.AES(key.encode()), modes.ECB()).encryptor()  # noqa: S305
+    return base64.b64encode(encryptor.update(data) + encryptor.finalize()).decode()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("pack", "error"),
+    [
+        # Under another key: the unit was re-paired
+        (EcbCipher("fedcba9876543210").encrypt({"t": "dat"})[0], GreeKeyError),
+        # Under our key, but not JSON: a damaged answer
+        (_ecb_pack(b'{"t": "dat", "co', KEY), GreeProtocolError),
+        # Cut short in transit
+        (
+            EcbCipher(KEY).encrypt({"t": "dat", "cols": ["Pow"]})[0][:-8],
+            GreeProtocolError,
+        ),
+    ],
+)
+async def test_only_a_foreign_key_reads_as_a_key_error(pack, error):
+    """Damaged answers under the right key do not ask for a rebind."""
+    device = AwhpDevice(
+        DeviceInfo(ip="127.0.0.1", port=7000, mac="aabbcc"),
+        key=KEY,
+        cipher_type="ecb",
+    )
+    answer = {"t": "pack", "i": 0, "pack": pack}
+    with (
+        patch(
+            "custom_components.gree_versati.protocol.device.send_receive",
+            new=AsyncMock(return_value=answer),
+        ),
+        pytest.raises(GreeProtocolError) as err,
+    ):
+        await device.get_properties([AwhpProps.POWER])
+
+    assert type(err.value) is error
+    assert device.metrics.decrypt_failures == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_rebind_keeps_the_stored_key():
+    """Without an answer the old credentials stay in place."""
+    device = AwhpDevice(
+        DeviceInfo(ip="127.0.0.1", port=1, mac="dead"),
+        key="0123456789abcdef",
+        cipher_type="ecb",
+        timeout=0.1,
+    )
+    with pytest.raises(GreeBindError):
+        await device.rebind()
+    assert (device.key, device.cipher_type) == ("0123456789abcdef", "ecb")
+
+
+@pytest.mark.asyncio
+async def test_lost_batch_is_retried_alone():
+    """A lost second batch is re-requested; the first is not polled again."""
+    unit = FakeVersati(properties={"Pow": 1, "FastHtWter": 1})
+    unit.drop_status_requests = {1}
+    ip, port = await unit.start()
+    try:
+        device = _device_for(unit, ip, port, key=unit.device_key, cipher_type="ecb")
+        device.timeout = 0.2
+        data = await device.get_all_properties()
+
+        assert data["Pow"] == 1
+        assert data["FastHtWter"] == 1
+        assert len(unit.status_requests) == 3
+        assert unit.status_requests[2] == unit.status_requests[1]
+        # The loss shows up in the wire counters and error history
+        assert device.metrics.errors[-1]["kind"] == "timeout"
+        assert device.metrics.requests["status"] == 3
+        assert device.metrics.timeouts == 1
+        assert device.metrics.retransmits == 1
+        assert device.metrics.rtt.count == 2
+        assert device.metrics.bytes_sent > device.metrics.bytes_received > 0
+    finally:
+        unit.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_lost_twice_keeps_last_known_values():
+    """Answered columns are fresh, the lost batch keeps aged values."""
+    unit = FakeVersati(properties={"Pow": 1, "FastHtWter": 1})
+    ip, port = await unit.start()
+    try:
+        device = _device_for(unit, ip, port, key=unit.device_key, cipher_type="ecb")
+        device.timeout = 0.2
+        await device.get_all_properties()
+        first_batch, second_batch = unit.status_requests
+        assert "Pow" in first_batch
+        assert "FastHtWter" in second_batch
+
+        unit.properties.update({"Pow": 0, "FastHtWter": 0})
+        unit.drop_status_requests = {3, 4}
+        data = await device.get_all_properties()
+
+        assert data["Pow"] == 0  # fresh
+        assert data["FastHtWter"] == 1  # kept from the earlier poll
+        assert device.age([AwhpProps.POWER]) < device.age(AwhpProps)
+    finally:
+        unit.close()
+
+
+@pytest.mark.asyncio
+async def test_unanswered_poll_raises():
+    """With no batch answered at all the timeout propagates."""
+    device = AwhpDevice(
+        DeviceInfo(ip="127.0.0.1", port=1, mac="dead"),
+        key="0123456789abcdef",
+        cipher_type="ecb",
+        timeout=0.1,
+    )
+    with pytest.raises(GreeTimeoutError):
+        await device.get_all_properties()
+    assert device.age(AwhpProps) is None
+
+
+@pytest.mark.asyncio
+async def test_probe_reads_one_column_and_tracks_rtt():
+    """The liveness probe is a single-column exchange feeding the RTT."""
+    unit = FakeVersati(properties={"Pow": 1, "Mod": 2})
+    ip, port = await unit.start()
+    try:
+        device = _device_for(unit, ip, port, key=unit.device_key, cipher_type="ecb")
+        assert device.rtt is None
+
+        rtt = await device.probe(timeout=1.0)
+
+        assert unit.status_requests == [["Pow"]]
+        assert 0 < rtt < 1.0
+        assert device.rtt is not None
+        assert device.get_property(AwhpProps.POWER) == 1
+    finally:
+        unit.close()
+
+
+@pytest.mark.asyncio
+async def test_probe_of_silent_unit_times_out_quickly():
+    """The probe's own short timeout applies, not the device default."""
+    device = AwhpDevice(
+        DeviceInfo(ip="127.0.0.1", port=1, mac="dead"),
+        key="0123456789abcdef",
+        cipher_type="ecb",
+        timeout=10.0,
+    )
+    with pytest.raises(GreeTimeoutError):
+        await device.probe(timeout=0.1)
+
+
 @pytest.mark.asyncio
 async def test_push_state_update_sends_dirty_props():
     """Staged writes go out as one cmd; booleans become ints on the wire."""
@@ -115,6 +365,29 @@ async def test_push_state_update_sends_dirty_props():
         unit.close()
 
 
+@pytest.mark.asyncio
+async def test_failed_push_does_not_swallow_the_retry():
+    """After an unanswered cmd the same value is sent again, not skipped."""
+    unit = FakeVersati(properties={"Pow": 1})
+    ip, port = await unit.start()
+    try:
+        device = _device_for(unit, ip, port, key=unit.device_key, cipher_type="ecb")
+        unit.close()  # unit goes away
+        device.timeout = 0.1
+        device.set_property(AwhpProps.HEAT_TEMP_SET, 40)
+        with pytest.raises(GreeTimeoutError):
+            await device.push_state_update()
+
+        ip, port = await unit.start()
+        device.device_info.ip, device.device_info.port = ip, port
+        device.set_property(AwhpProps.HEAT_TEMP_SET, 40)
+        await device.push_state_update()
+
+        assert unit.received_cmds[-1]["opt"] == ["HeWatOutTemSet"]
+    finally:
+        unit.close()
+
+
 @pytest.mark.asyncio
 async def test_push_state_update_noop_when_clean():
     """No dirty props means no datagram at all."""
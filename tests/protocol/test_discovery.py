@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
-from custom_components.gree_versati.protocol import search_devices
+from custom_components.gree_versati.protocol import find_device, search_devices
 from tests.protocol.emulator import FakeVersati
 
 # These tests exercise real UDP sockets on loopback against the emulator
-pytestmark = pytest.mark.enable_socket
+pytestmark = pytest.mark.usefixtures("socket_enabled")
 
 
 @pytest.mark.asyncio
@@ -36,3 +38,81 @@ async def test_search_no_devices():
         wait_for=0.2, port=59999, broadcast_address="127.0.0.1"
     )
     assert devices == []
+
+
+@pytest.mark.asyncio
+async def test_find_device_falls_back_to_broadcast():
+    """A unit gone from its last address is found again by MAC."""
+    unit = FakeVersati()
+    ip, port = await unit.start()
+    try:
+        info = await find_device(
+            unit.mac.upper(),
+            last_ip="127.0.0.2",  # nothing answers there
+            port=port,
+            broadcast_address=ip,
+            unicast_wait=0.2,
+            broadcast_wait=0.3,
+        )
+        assert info is not None
+        assert info.ip == ip
+    finally:
+        unit.close()
+
+
+@pytest.mark.asyncio
+async def test_find_device_ignores_other_units():
+    """Only the requested MAC counts."""
+    unit = FakeVersati()
+    ip, port = await unit.start()
+    try:
+        info = await find_device(
+            "aabbccddeeff",
+            last_ip=ip,
+            port=port,
+            broadcast_address=ip,
+            unicast_wait=0.2,
+            broadcast_wait=0.2,
+        )
+        assert info is None
+    finally:
+        unit.close()
+
+
+class _Relay(asyncio.DatagramProtocol):
+    """Plays the broadcast address: hands each scan to the unit."""
+
+    def __init__(self, unit: FakeVersati) -> None:
+        self.unit = unit
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        self.unit.datagram_received(data, addr)
+
+
+@pytest.mark.asyncio
+async def test_find_device_hears_answers_from_other_addresses():
+    """The broadcast scan takes the answer of a unit at its own address."""
+    loop = asyncio.get_running_loop()
+    unit = FakeVersati()
+    relay, _ = await loop.create_datagram_endpoint(
+        lambda: _Relay(unit), local_addr=("127.0.0.1", 0)
+    )
+    port = relay.get_extra_info("sockname")[1]
+    # The unit answers from 127.0.0.2, not the scanned address
+    unit.transport, _ = await loop.create_datagram_endpoint(
+        lambda: unit, local_addr=("127.0.0.2", port)
+    )
+    try:
+        info = await find_device(
+            unit.mac,
+            last_ip="127.0.0.3",  # nothing answers there
+            port=port,
+            broadcast_address="127.0.0.1",
+            unicast_wait=0.2,
+            broadcast_wait=0.3,
+        )
+        assert info is not None
+        assert info.ip == "127.0.0.2"
+    finally:
+        unit.close()
+        relay.close()
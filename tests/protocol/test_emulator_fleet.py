@@ -0,0 +1,72 @@
+"""Tests for the many-unit emulator used by the load test."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.gree_versati.protocol import (
+    AwhpDevice,
+    AwhpProps,
+    DeviceInfo,
+    search_devices,
+)
+from tests.protocol.emulator import FakeFleet
+
+pytestmark = pytest.mark.usefixtures("socket_enabled")
+
+
+@pytest.mark.asyncio
+async def test_scan_finds_every_unit():
+    """One scan finds the whole fleet, each unit at its own address."""
+    # More than one /24 worth of units
+    fleet = FakeFleet(300)
+    ip, port = await fleet.start()
+    try:
+        found = await search_devices(wait_for=0.5, port=port, broadcast_address=ip)
+    finally:
+        fleet.close()
+
+    assert len(found) == 300
+    assert {info.mac: info.ip for info in found} == {
+        info.mac: info.ip for info in fleet.device_infos()
+    }
+    assert {info.port for info in found} == {port}
+
+
+@pytest.mark.asyncio
+async def test_units_have_their_own_key_cipher_and_state():
+    """Units bind with their own key and cipher and report their own values."""
+    fleet = FakeFleet(6)
+    # Each unit on its own port of 127.0.0.1, the only loopback address
+    # Home Assistant's test plugin lets clients connect to
+    addresses = [await unit.start() for unit in fleet.units]
+    try:
+        devices = [
+            AwhpDevice(DeviceInfo(ip, port, unit.mac), timeout=2.0)
+            for (ip, port), unit in zip(addresses, fleet.units, strict=True)
+        ]
+        results = await asyncio.gather(
+            *(device.get_all_properties() for device in devices)
+        )
+    finally:
+        fleet.close()
+
+    assert len({unit.device_key for unit in fleet.units}) == 6
+    for device, unit, result in zip(devices, fleet.units, results, strict=True):
+        assert device.key == unit.device_key
+        assert device.cipher_type == unit.cipher_kind
+        assert result == {prop.value: unit.properties[prop.value] for prop in AwhpProps}
+    assert {device.cipher_type for device in devices} == {"ecb", "gcm"}
+
+
+def test_fleets_are_reproducible():
+    """The same seed gives the same keys and values."""
+    first, second = FakeFleet(3, seed=7), FakeFleet(3, seed=7)
+    assert [unit.device_key for unit in first.units] == [
+        unit.device_key for unit in second.units
+    ]
+    assert [unit.properties for unit in first.units] == [
+        unit.properties for unit in second.units
+    ]
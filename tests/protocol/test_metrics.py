@@ -0,0 +1,44 @@
+"""Tests for the per-device wire counters."""
+
+from __future__ import annotations
+
+from custom_components.gree_versati.protocol import DeviceMetrics, LatencyHistogram
+
+
+def test_empty_histogram_has_no_percentiles():
+    """No samples, no answer."""
+    assert LatencyHistogram().percentile(0.5) is None
+
+
+def test_percentiles_report_bucket_bounds():
+    """A percentile is the upper bound of the bucket its rank falls in."""
+    histogram = LatencyHistogram()
+    for sample in [0.015] * 90 + [0.3] * 9 + [7.5]:
+        histogram.observe(sample)
+
+    assert histogram.percentile(0.5) == 0.02
+    assert histogram.percentile(0.95) == 0.5
+    # The overflow bucket reports the slowest sample seen
+    assert histogram.percentile(1.0) == 7.5
+    assert histogram.as_dict()["inf"] == 1
+
+
+def test_percentile_capped_at_slowest_sample():
+    """A fast link does not read as slow as its bucket bound."""
+    histogram = LatencyHistogram()
+    histogram.observe(0.003)
+
+    assert histogram.percentile(0.5) == 0.003
+
+
+def test_metrics_as_dict_is_plain_data():
+    """The snapshot is JSON-friendly, requests broken down by type."""
+    metrics = DeviceMetrics()
+    metrics.requests["status"] += 2
+    metrics.rtt.observe(0.04)
+
+    snapshot = metrics.as_dict()
+
+    assert snapshot["requests"] == {"status": 2}
+    assert snapshot["rtt_p50"] == 0.04
+    assert snapshot["poll_duration"] is None
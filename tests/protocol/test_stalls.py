@@ -0,0 +1,70 @@
+"""Tests for opt-in event loop stall detection."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.gree_versati.protocol import AwhpDevice, DeviceInfo, stalls
+from tests.protocol.emulator import FakeVersati
+
+pytestmark = pytest.mark.usefixtures("socket_enabled")
+
+
+@pytest.fixture(autouse=True)
+def _stop_watching():
+    yield
+    stalls.stop_watching()
+
+
+def test_unwatched_steps_cost_nothing():
+    """Without a monitor every watch is the same shared no-op."""
+    assert stalls.watch("a") is stalls.watch("b")
+    assert stalls.watch_stats() is None
+
+
+@pytest.mark.asyncio
+async def test_exchange_steps_are_counted():
+    """Datagram handling, encryption and decryption are timed per step."""
+    unit = FakeVersati(properties={"Pow": 1})
+    ip, port = await unit.start()
+    try:
+        device = AwhpDevice(
+            DeviceInfo(ip=ip, port=port, mac=unit.mac),
+            key=unit.device_key,
+            cipher_type="ecb",
+            timeout=2.0,
+        )
+        stalls.start_watching(threshold=1.0)
+        await device.get_all_properties()
+    finally:
+        unit.close()
+
+    stats = stalls.watch_stats()
+    batches = device.metrics.requests["status"]
+    assert stats["encrypt"]["count"] == batches
+    assert stats["decrypt"]["count"] == batches
+    assert stats["datagram_received"]["count"] == batches
+    assert stats["decrypt"]["stalls"] == 0
+    assert 0 < stats["decrypt"]["max"] <= stats["decrypt"]["total"]
+
+
+def test_slow_step_warns_with_call_site_once_per_interval(monkeypatch):
+    """A stall is logged with where it came from; repeats are only counted."""
+    warning = MagicMock()
+    monkeypatch.setattr(stalls._LOGGER, "warning", warning)
+    stalls.start_watching(threshold=0.001)
+
+    def slow_decode() -> None:
+        with stalls.watch("decode"):
+            time.sleep(0.002)
+
+    slow_decode()
+    slow_decode()
+
+    assert stalls.watch_stats()["decode"]["stalls"] == 2
+    warning.assert_called_once()
+    call_site = warning.call_args.args[-1]
+    assert call_site.startswith("slow_decode (test_stalls.py:")
@@ -0,0 +1,71 @@
+"""Tests for opt-in span tracing."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from custom_components.gree_versati.protocol import (
+    AwhpDevice,
+    AwhpProps,
+    DeviceInfo,
+    tracing,
+)
+from tests.protocol.emulator import FakeVersati
+
+pytestmark = pytest.mark.usefixtures("socket_enabled")
+
+
+@pytest.fixture(autouse=True)
+def _no_leftover_tracer():
+    yield
+    if (tracer := tracing.stop_tracing()) is not None:
+        tracer.close()
+
+
+def test_disabled_spans_cost_nothing():
+    """Without a tracer every span is the same shared no-op."""
+    assert not tracing.tracing_active()
+    assert tracing.span("a") is tracing.span("b", cols=3)
+    tracing.complete("c", 0.0)
+
+
+@pytest.mark.asyncio
+async def test_trace_of_a_poll_loads_as_chrome_trace(tmp_path):
+    """A poll leaves batch, crypto and network spans in a valid JSON array."""
+    unit = FakeVersati(properties={"Pow": 1})
+    ip, port = await unit.start()
+    path = tmp_path / "trace.json"
+    try:
+        device = AwhpDevice(
+            DeviceInfo(ip=ip, port=port, mac=unit.mac),
+            key=unit.device_key,
+            cipher_type="ecb",
+            timeout=2.0,
+        )
+        tracing.start_tracing(path)
+        await device.get_all_properties()
+        tracing.stop_tracing().close()
+    finally:
+        unit.close()
+
+    events = json.loads(path.read_text())
+    spans = [event for event in events if event["ph"] == "X"]
+    names = {event["name"] for event in spans}
+    assert names == {
+        "device.status_batch",
+        "device.encrypt",
+        "device.network",
+        "device.decrypt",
+    }
+    batches = [event for event in spans if event["name"] == "device.status_batch"]
+    assert sum(event["args"]["cols"] for event in batches) == len(AwhpProps)
+    # Each exchange nests inside its batch on the same track
+    for network in (event for event in spans if event["name"] == "device.network"):
+        assert any(
+            batch["tid"] == network["tid"]
+            and batch["ts"] <= network["ts"]
+            and network["ts"] + network["dur"] <= batch["ts"] + batch["dur"]
+            for batch in batches
+        )
@@ -28,6 +28,8 @@ def mock_device():
         }
     )
     device.push_state_update = AsyncMock()
+    # Fresh Pow/Mod read before mode changes; unknown state by default
+    device.get_properties = AsyncMock(return_value={})
 
     # Setup temperature helper methods
     device.t_water_out_pe = MagicMock(return_value=45.5)
@@ -492,3 +494,237 @@ class TestGreeVersatiClientComprehensive:
             mock_device.set_property.assert_called_with(
                 AwhpProps.FAST_HEAT_WATER, value=False
             )
+
+    @pytest.mark.asyncio
+    async def test_wait_until_ready_probes_until_values(self, mock_device):
+        """The readiness probe reads Pow/Mod only, backing off until answered."""
+        mock_device.get_properties.side_effect = [
+            {"Pow": None, "Mod": None},
+            {"Pow": None, "Mod": None},
+            {"Pow": 1, "Mod": 4},
+        ]
+        client = GreeVersatiClient()
+        client.device = mock_device
+
+        with patch(
+            "custom_components.gree_versati.client.asyncio.sleep", new=AsyncMock()
+        ) as sleep:
+            assert await client.async_wait_until_ready() is True
+
+        assert mock_device.get_properties.await_count == 3
+        mock_device.get_all_properties.assert_not_awaited()
+        assert [c.args[0] for c in sleep.await_args_list] == [0.25, 0.5]
+
+    @pytest.mark.asyncio
+    async def test_wait_until_ready_gives_up(self, mock_device):
+        """A unit that keeps answering empty is reported as not ready."""
+        mock_device.get_properties.return_value = {"Pow": None, "Mod": None}
+        client = GreeVersatiClient()
+        client.device = mock_device
+
+        assert await client.async_wait_until_ready(timeout=0.05) is False
+
+    @pytest.mark.asyncio
+    async def test_wait_until_ready_fails_fast_without_any_answer(self, mock_device):
+        """A unit that never answers raises instead of reporting not ready."""
+        from custom_components.gree_versati.protocol import GreeTimeoutError
+
+        mock_device.get_properties.side_effect = GreeTimeoutError("gone")
+        client = GreeVersatiClient()
+        client.device = mock_device
+
+        with pytest.raises(GreeTimeoutError):
+            await client.async_wait_until_ready(timeout=0.05)
+        mock_device.get_all_properties.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_wait_until_ready_follows_unit_to_new_address(self, mock_device):
+        """A unit that moved while HA was down is found before the first poll."""
+        from custom_components.gree_versati.protocol import (
+            DeviceInfo,
+            GreeTimeoutError,
+        )
+
+        mock_device.device_info = DeviceInfo("192.168.1.100", 7000, "aabbcc")
+        mock_device.get_properties.side_effect = [GreeTimeoutError("gone")] * 3 + [
+            {"Pow": 1, "Mod": 4}
+        ]
+        client = GreeVersatiClient(ip="192.168.1.100", port=7000, mac="aabbcc")
+        client.device = mock_device
+        client.on_connection_change = MagicMock()
+
+        with (
+            patch(
+                "custom_components.gree_versati.client.find_device",
+                new=AsyncMock(return_value=DeviceInfo("192.168.1.123", 7000, "aabbcc")),
+            ) as find,
+            patch(
+                "custom_components.gree_versati.client.asyncio.sleep", new=AsyncMock()
+            ),
+        ):
+            assert await client.async_wait_until_ready() is True
+
+        find.assert_awaited_once_with("aabbcc", "192.168.1.100", 7000)
+        assert client.ip == "192.168.1.123"
+        client.on_connection_change.assert_called_once_with({"ip": "192.168.1.123"})
+
+    @pytest.mark.asyncio
+    async def test_repeated_timeouts_follow_unit_to_new_address(self, mock_device):
+        """After repeated timeouts the unit is found by MAC and retried there."""
+        from custom_components.gree_versati.protocol import (
+            DeviceInfo,
+            GreeTimeoutError,
+        )
+
+        mock_device.device_info = DeviceInfo("192.168.1.100", 7000, "aabbcc")
+        mock_device.probe = AsyncMock(
+            side_effect=[GreeTimeoutError("gone")] * 3 + [0.02]
+        )
+        client = GreeVersatiClient(ip="192.168.1.100", port=7000, mac="aabbcc")
+        client.device = mock_device
+        client.on_connection_change = MagicMock()
+
+        with patch(
+            "custom_components.gree_versati.client.find_device",
+            new=AsyncMock(return_value=DeviceInfo("192.168.1.123", 7000, "aabbcc")),
+        ) as find:
+            for _ in range(2):
+                with pytest.raises(GreeTimeoutError):
+                    await client.async_probe()
+            find.assert_not_awaited()
+
+            assert await client.async_probe() == 0.02
+
+        find.assert_awaited_once_with("aabbcc", "192.168.1.100", 7000)
+        assert client.ip == "192.168.1.123"
+        assert mock_device.device_info.ip == "192.168.1.123"
+        client.on_connection_change.assert_called_once_with({"ip": "192.168.1.123"})
+
+    @pytest.mark.asyncio
+    async def test_unit_ignoring_requests_at_same_address_is_rebound(self, mock_device):
+        """A unit answering scans but not requests gets a new key negotiated."""
+        from custom_components.gree_versati.protocol import (
+            DeviceInfo,
+            GreeTimeoutError,
+        )
+
+        async def rebind():
+            mock_device.key, mock_device.cipher_type = "newkey", "gcm"
+            return "newkey"
+
+        mock_device.device_info = DeviceInfo("192.168.1.100", 7000, "aabbcc")
+        mock_device.rebind = AsyncMock(side_effect=rebind)
+        mock_device.probe = AsyncMock(
+            side_effect=[GreeTimeoutError("ignored")] * 3 + [0.02]
+        )
+        client = GreeVersatiClient(ip="192.168.1.100", port=7000, mac="aabbcc")
+        client.device = mock_device
+        client.on_connection_change = MagicMock()
+
+        with patch(
+            "custom_components.gree_versati.client.find_device",
+            new=AsyncMock(return_value=DeviceInfo("192.168.1.100", 7000, "aabbcc")),
+        ):
+            for _ in range(2):
+                with pytest.raises(GreeTimeoutError):
+                    await client.async_probe()
+            assert await client.async_probe() == 0.02
+
+        mock_device.rebind.assert_awaited_once()
+        assert (client.key, client.cipher_type) == ("newkey", "gcm")
+        client.on_connection_change.assert_called_once_with(
+            {"key": "newkey", "cipher_type": "gcm"}
+        )
+
+    @pytest.mark.asyncio
+    async def test_foreign_key_response_rebinds_at_once(self, mock_device):
+        """A response under another key renegotiates without waiting."""
+        from custom_components.gree_versati.protocol import GreeKeyError
+
+        mock_device.rebind = AsyncMock(return_value="newkey")
+        mock_device.probe = AsyncMock(side_effect=[GreeKeyError("reset"), 0.02])
+        client = GreeVersatiClient(ip="192.168.1.100", port=7000, mac="aabbcc")
+        client.device = mock_device
+
+        assert await client.async_probe() == 0.02
+        mock_device.rebind.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_journal_holds_commands_until_unit_answers(self, mock_device):
+        """Offline commands merge in the journal and replay as one packet."""
+        from custom_components.gree_versati.protocol import GreeTimeoutError
+
+        pushes: list[dict] = []
+        staged: dict = {}
+        mock_device.set_property = MagicMock(
+            side_effect=lambda prop, *args, **kwargs: staged.__setitem__(
+                prop, args[0] if args else kwargs.get("value")
+            )
+        )
+
+        async def push():
+            if mock_device.offline:
+                raise GreeTimeoutError("down")
+            pushes.append(dict(staged))
+            staged.clear()
+
+        mock_device.offline = True
+        mock_device.push_state_update = AsyncMock(side_effect=push)
+        mock_device.probe = AsyncMock(return_value=0.02)
+        client = GreeVersatiClient(
+            ip="192.168.1.100", port=7000, mac="aabbcc", journal_ttl=300
+        )
+        client.device = mock_device
+
+        assert await client.set_dhw_temperature(50) is False
+        assert await client.set_dhw_temperature(55) is False
+        assert await client.set_dhw_mode("performance") is False
+        # Held, not raised, and no refresh attempted against a dead unit
+        mock_device.get_all_properties.assert_not_awaited()
+        assert pushes == []
+
+        mock_device.offline = False
+        await client.async_probe()
+
+        assert pushes == [
+            {AwhpProps.HOT_WATER_TEMP_SET: 55, AwhpProps.FAST_HEAT_WATER: True}
+        ]
+        # Nothing left to replay
+        await client.async_probe()
+        assert len(pushes) == 1
+        # Once the unit answers, commands are sent and reported as such
+        assert await client.set_dhw_temperature(45) is True
+        assert len(pushes) == 2
+
+    @pytest.mark.asyncio
+    async def test_without_journal_offline_command_raises(self, mock_device):
+        """The journal is opt-in: by default a timeout still propagates."""
+        from custom_components.gree_versati.protocol import GreeTimeoutError
+
+        mock_device.push_state_update = AsyncMock(side_effect=GreeTimeoutError("x"))
+        client = GreeVersatiClient(ip="192.168.1.100", port=7000, mac="aabbcc")
+        client.device = mock_device
+
+        with pytest.raises(GreeTimeoutError):
+            await client.set_dhw_temperature(50)
+        # The failed command is in the timing and error history
+        (cycle,) = client.metrics.timings
+        assert cycle.kind == "command"
+        assert cycle.error == "GreeTimeoutError: x"
+        assert client.metrics.errors[-1]["kind"] == "command"
+
+    @pytest.mark.asyncio
+    async def test_poll_timing_is_recorded_by_phase(self, mock_device):
+        """Each poll lands in the history with queue wait and decode time."""
+        client = GreeVersatiClient(ip="192.168.1.100", port=7000, mac="aabbcc")
+        client.device = mock_device
+
+        await client.async_get_data()
+
+        (cycle,) = client.metrics.timings
+        assert cycle.kind == "poll"
+        assert cycle.error is None
+        assert {"queue_wait", "decode"} <= set(cycle.phases)
+        assert client.metrics.poll_duration == cycle.duration
+        # Nothing is charged to a cycle once it is over
+        assert client.metrics.cycle is None
@@ -325,7 +325,7 @@ class TestGreeVersatiClimate:
 
         # Create a mock client with AsyncMock and wire it via runtime_data
         client = MagicMock()
-        client.set_temperature = AsyncMock()
+        client.set_temperature = AsyncMock(return_value=True)
         runtime_data = MagicMock()
         runtime_data.client = client
         coordinator.config_entry.runtime_data = runtime_data
@@ -352,7 +352,7 @@ class TestGreeVersatiClimate:
 
         # Create a mock client with AsyncMock and wire it via runtime_data
         client = MagicMock()
-        client.set_temperature = AsyncMock()
+        client.set_temperature = AsyncMock(return_value=True)
         runtime_data = MagicMock()
         runtime_data.client = client
         coordinator.config_entry.runtime_data = runtime_data
@@ -375,7 +375,7 @@ class TestGreeVersatiClimate:
 
         # Create a mock client and wire it via runtime_data
         client = MagicMock()
-        client.set_temperature = AsyncMock()
+        client.set_temperature = AsyncMock(return_value=True)
         runtime_data = MagicMock()
         runtime_data.client = client
         coordinator.config_entry.runtime_data = runtime_data
@@ -400,7 +400,7 @@ class TestGreeVersatiClimate:
 
         # Create a mock client and wire it via runtime_data
         client = MagicMock()
-        client.set_device_mode = AsyncMock()
+        client.set_device_mode = AsyncMock(return_value=True)
         runtime_data = MagicMock()
         runtime_data.client = client
         coordinator.config_entry.runtime_data = runtime_data
@@ -417,6 +417,30 @@ class TestGreeVersatiClimate:
         # Expected state is published optimistically instead of polling
         coordinator.async_apply_optimistic_device_mode.assert_called_once_with("heat")
 
+    @pytest.mark.asyncio
+    async def test_held_commands_publish_nothing(self):
+        """Commands held for replay leave the coordinator state alone."""
+        coordinator = MagicMock()
+        coordinator.config_entry.entry_id = "test_entry_id"
+        coordinator.data = {"power": True, "mode": 4, "fast_heat_water": False}
+
+        client = MagicMock()
+        client.set_temperature = AsyncMock(return_value=False)
+        client.set_device_mode = AsyncMock(return_value=False)
+        coordinator.config_entry.runtime_data.client = client
+
+        climate = GreeVersatiClimate(coordinator)
+
+        await climate.async_set_temperature(**{ATTR_TEMPERATURE: 50.0})
+        await climate.async_set_hvac_mode(HVACMode.COOL)
+
+        client.set_temperature.assert_awaited_once_with(50.0, mode="heat")
+        # Mode 4 includes hot water, which the new mode keeps
+        client.set_device_mode.assert_awaited_once_with("cool_hot_water")
+        # No optimistic state, backoff reset, recover refresh or settle
+        coordinator.async_apply_optimistic.assert_not_called()
+        coordinator.async_apply_optimistic_device_mode.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_async_setup_entry(self):
         """Test the async_setup_entry function."""
@@ -6,9 +6,11 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
 
 from custom_components.gree_versati.const import DOMAIN, LOGGER
 from custom_components.gree_versati.coordinator import GreeVersatiDataUpdateCoordinator
+from custom_components.gree_versati.protocol import GreeTimeoutError
 
 
 @pytest.mark.asyncio
@@ -16,6 +18,7 @@ async def test_coordinator_polling(hass: HomeAssistant):
     """Test that the coordinator polls for updates at regular intervals."""
     # Create a mock client with an async_get_data method
     client = MagicMock()
+    client.async_wait_until_ready = AsyncMock(return_value=True)
     client.async_get_data = AsyncMock(
         side_effect=[
             {"water_out_temp": 35.0, "power": True},  # First call
@@ -27,6 +30,7 @@ async def test_coordinator_polling(hass: HomeAssistant):
     # Create a mock config entry with proper state
     config_entry = MagicMock()
     config_entry.state = ConfigEntryState.SETUP_IN_PROGRESS
+    config_entry.options = {}
     config_entry.runtime_data = MagicMock()
     config_entry.runtime_data.client = client
 
@@ -66,49 +70,73 @@ async def test_coordinator_polling(hass: HomeAssistant):
 
 
 @pytest.mark.asyncio
-async def test_coordinator_first_update_retry(hass: HomeAssistant):
-    """Test that the coordinator handles the first update with a delay and retry if needed."""
-    # Create a mock client with an async_get_data method that returns all None values first
+async def test_coordinator_first_update_waits_for_ready(hass: HomeAssistant):
+    """The first refresh probes readiness once, then does a single full poll."""
     client = MagicMock()
+    client.async_wait_until_ready = AsyncMock(return_value=True)
     client.async_get_data = AsyncMock(
         side_effect=[
-            {"water_out_temp": None, "power": None},  # First call returns None values
-            {"water_out_temp": 35.0, "power": True},  # Second call with actual data
+            {"water_out_temp": 35.0, "power": True},
+            {"water_out_temp": 36.0, "power": True},
         ]
     )
 
-    # Create a mock config entry with proper state
     config_entry = MagicMock()
     config_entry.state = ConfigEntryState.SETUP_IN_PROGRESS
+    config_entry.options = {}
     config_entry.runtime_data = MagicMock()
     config_entry.runtime_data.client = client
 
-    # Mock the asyncio.sleep to avoid delays in tests
-    with patch("asyncio.sleep", new=AsyncMock()):
-        # Create the coordinator
-        coordinator = GreeVersatiDataUpdateCoordinator(
-            hass=hass,
-            name=DOMAIN,
-            logger=LOGGER,
-            update_interval=timedelta(seconds=30),
-            config_entry=config_entry,
-        )
+    coordinator = GreeVersatiDataUpdateCoordinator(
+        hass=hass,
+        name=DOMAIN,
+        logger=LOGGER,
+        update_interval=timedelta(seconds=30),
+        config_entry=config_entry,
+    )
+    await coordinator.async_config_entry_first_refresh()
 
-        # Initialize the coordinator with the first refresh
-        await coordinator.async_config_entry_first_refresh()
+    assert coordinator.data == {"water_out_temp": 35.0, "power": True}
+    client.async_wait_until_ready.assert_awaited_once()
+    assert client.async_get_data.await_count == 1
 
-        # Verify the data is populated correctly after the retry
-        assert coordinator.data == {"water_out_temp": 35.0, "power": True}
+    # Later polls skip the probe
+    await coordinator.async_refresh()
+    client.async_wait_until_ready.assert_awaited_once()
+    assert client.async_get_data.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_first_update_fails_fast_for_an_offline_unit(hass: HomeAssistant):
+    """A readiness probe nobody answered skips the full poll."""
+    client = MagicMock()
+    client.async_wait_until_ready = AsyncMock(side_effect=GreeTimeoutError("gone"))
+    client.async_get_data = AsyncMock()
+
+    config_entry = MagicMock()
+    config_entry.state = ConfigEntryState.SETUP_IN_PROGRESS
+    config_entry.options = {}
+    config_entry.runtime_data = MagicMock()
+    config_entry.runtime_data.client = client
+
+    coordinator = GreeVersatiDataUpdateCoordinator(
+        hass=hass,
+        name=DOMAIN,
+        logger=LOGGER,
+        update_interval=timedelta(seconds=30),
+        config_entry=config_entry,
+    )
+    with pytest.raises(ConfigEntryNotReady):
+        await coordinator.async_config_entry_first_refresh()
 
-        # Verify our client's async_get_data was called twice - once for the initial
-        # request (which returned None values) and once for the retry
-        assert client.async_get_data.call_count == 2
+    client.async_get_data.assert_not_awaited()
 
 
 @pytest.mark.asyncio
 async def test_apply_optimistic_device_mode(hass: HomeAssistant):
     """Optimistic publish overlays expected mode state without polling."""
     client = MagicMock()
+    client.async_wait_until_ready = AsyncMock(return_value=True)
     # Device currently in heat + hot water
     client.async_get_data = AsyncMock(
         return_value={"power": True, "mode": 4, "hot_water_temp": 50.0}
@@ -116,8 +144,13 @@ async def test_apply_optimistic_device_mode(hass: HomeAssistant):
 
     config_entry = MagicMock()
     config_entry.state = ConfigEntryState.SETUP_IN_PROGRESS
+    config_entry.options = {}
     config_entry.runtime_data = MagicMock()
     config_entry.runtime_data.client = client
+    # Settle watchers are not under test here
+    config_entry.async_create_background_task = MagicMock(
+        side_effect=lambda _hass, coro, _name: coro.close()
+    )
 
     with patch("asyncio.sleep", new=AsyncMock()):
         coordinator = GreeVersatiDataUpdateCoordinator(
@@ -153,11 +186,205 @@ async def test_apply_optimistic_device_mode(hass: HomeAssistant):
         assert coordinator.data["fast_heat_water"] is True
 
 
+@pytest.mark.asyncio
+async def test_device_mode_change_settles_then_refreshes_once(hass: HomeAssistant):
+    """After the optimistic publish, settling triggers one full refresh."""
+    client = MagicMock()
+    client.async_wait_until_ready = AsyncMock(return_value=True)
+    client.async_get_data = AsyncMock(
+        side_effect=[
+            {"power": True, "mode": 1},
+            {"power": True, "mode": 4, "hot_water_temp": 48.0},
+        ]
+    )
+    client.async_wait_for_mode = AsyncMock(return_value=True)
+
+    config_entry = MagicMock()
+    config_entry.state = ConfigEntryState.SETUP_IN_PROGRESS
+    config_entry.options = {}
+    config_entry.runtime_data = MagicMock()
+    config_entry.runtime_data.client = client
+    settle_tasks = []
+    config_entry.async_create_background_task = MagicMock(
+        side_effect=lambda _hass, coro, _name: settle_tasks.append(coro)
+    )
+
+    with patch("asyncio.sleep", new=AsyncMock()):
+        coordinator = GreeVersatiDataUpdateCoordinator(
+            hass=hass,
+            name=DOMAIN,
+            logger=LOGGER,
+            update_interval=timedelta(seconds=30),
+            config_entry=config_entry,
+        )
+        await coordinator.async_config_entry_first_refresh()
+
+        coordinator.async_apply_optimistic_device_mode("heat_hot_water")
+        # Optimistic state is visible right away, no poll yet
+        assert coordinator.data["mode"] == 4
+        assert client.async_get_data.call_count == 1
+
+        assert len(settle_tasks) == 1
+        await settle_tasks[0]
+
+    client.async_wait_for_mode.assert_awaited_once_with("heat_hot_water")
+    # Exactly one confirming full poll once the unit settled
+    assert client.async_get_data.call_count == 2
+    assert coordinator.data["hot_water_temp"] == 48.0
+
+
+@pytest.mark.asyncio
+async def test_device_mode_change_that_never_settles_skips_refresh(
+    hass: HomeAssistant,
+):
+    """A settle wait that times out leaves the unit to the regular poll."""
+    client = MagicMock()
+    client.async_wait_until_ready = AsyncMock(return_value=True)
+    client.async_get_data = AsyncMock(return_value={"power": True, "mode": 1})
+    client.async_wait_for_mode = AsyncMock(return_value=False)
+
+    config_entry = MagicMock()
+    config_entry.state = ConfigEntryState.SETUP_IN_PROGRESS
+    config_entry.options = {}
+    config_entry.runtime_data = MagicMock()
+    config_entry.runtime_data.client = client
+    settle_tasks = []
+    config_entry.async_create_background_task = MagicMock(
+        side_effect=lambda _hass, coro, _name: settle_tasks.append(coro)
+    )
+
+    with patch("asyncio.sleep", new=AsyncMock()):
+        coordinator = GreeVersatiDataUpdateCoordinator(
+            hass=hass,
+            name=DOMAIN,
+            logger=LOGGER,
+            update_interval=timedelta(seconds=30),
+            config_entry=config_entry,
+        )
+        await coordinator.async_config_entry_first_refresh()
+
+        coordinator.async_apply_optimistic_device_mode("heat_hot_water")
+        await settle_tasks[0]
+
+    # No poll of the transitional state; the optimistic value stands
+    assert client.async_get_data.call_count == 1
+    assert coordinator.data["mode"] == 4
+
+
+@pytest.mark.asyncio
+async def test_poll_does_not_revert_optimistic_values(hass: HomeAssistant):
+    """A poll catching a transitional value keeps the commanded one."""
+    client = MagicMock()
+    client.async_wait_until_ready = AsyncMock(return_value=True)
+    client.async_get_data = AsyncMock(
+        side_effect=[
+            {"power": 1, "heat_temp_set": 40},
+            # Unit has not applied the new setpoint yet
+            {"power": 1, "heat_temp_set": 40},
+            {"power": 1, "heat_temp_set": 45},
+        ]
+    )
+
+    config_entry = MagicMock()
+    config_entry.state = ConfigEntryState.SETUP_IN_PROGRESS
+    config_entry.options = {}
+    config_entry.runtime_data = MagicMock()
+    config_entry.runtime_data.client = client
+
+    with patch("asyncio.sleep", new=AsyncMock()):
+        coordinator = GreeVersatiDataUpdateCoordinator(
+            hass=hass,
+            name=DOMAIN,
+            logger=LOGGER,
+            update_interval=timedelta(seconds=30),
+            config_entry=config_entry,
+        )
+        await coordinator.async_config_entry_first_refresh()
+
+        coordinator.async_apply_optimistic(heat_temp_set=45)
+        await coordinator.async_refresh()
+        assert coordinator.data["heat_temp_set"] == 45
+
+        # Converged: the expectation is dropped and polls flow through
+        await coordinator.async_refresh()
+        assert coordinator.data["heat_temp_set"] == 45
+        assert len(coordinator._expectations) == 0
+
+
+@pytest.mark.asyncio
+async def test_poll_interval_follows_device_activity(hass: HomeAssistant):
+    """Defrost polls at the configured minimum, power off at the maximum."""
+    client = MagicMock()
+    client.async_wait_until_ready = AsyncMock(return_value=True)
+    client.async_get_data = AsyncMock(
+        side_effect=[
+            {"power": 1, "defrosting_status": 1, "water_out_temp": 30.0},
+            {"power": 0, "defrosting_status": 0, "water_out_temp": 30.0},
+        ]
+    )
+
+    config_entry = MagicMock()
+    config_entry.state = ConfigEntryState.SETUP_IN_PROGRESS
+    config_entry.options = {"poll_interval_min": 15, "poll_interval_max": 300}
+    config_entry.runtime_data = MagicMock()
+    config_entry.runtime_data.client = client
+
+    with patch("asyncio.sleep", new=AsyncMock()):
+        coordinator = GreeVersatiDataUpdateCoordinator(
+            hass=hass,
+            name=DOMAIN,
+            logger=LOGGER,
+            update_interval=timedelta(seconds=30),
+            config_entry=config_entry,
+        )
+        await coordinator.async_config_entry_first_refresh()
+        assert coordinator.update_interval == timedelta(seconds=15)
+
+        await coordinator.async_refresh()
+        assert coordinator.update_interval == timedelta(seconds=300)
+
+
+@pytest.mark.asyncio
+async def test_held_setpoint_does_not_force_fast_polling(hass: HomeAssistant):
+    """Only a mode change polls at the minimum; a setpoint write does not."""
+    client = MagicMock()
+    client.async_wait_until_ready = AsyncMock(return_value=True)
+    client.async_get_data = AsyncMock(
+        side_effect=[
+            {"power": 1, "water_out_temp": 30.0, "heat_temp_set": 40},
+            # Not caught up with the write yet: the expectation stays held
+            {"power": 1, "water_out_temp": 32.0, "heat_temp_set": 40},
+        ]
+    )
+
+    config_entry = MagicMock()
+    config_entry.state = ConfigEntryState.SETUP_IN_PROGRESS
+    config_entry.options = {"poll_interval_min": 15, "poll_interval_max": 300}
+    config_entry.runtime_data = MagicMock()
+    config_entry.runtime_data.client = client
+
+    with patch("asyncio.sleep", new=AsyncMock()):
+        coordinator = GreeVersatiDataUpdateCoordinator(
+            hass=hass,
+            name=DOMAIN,
+            logger=LOGGER,
+            update_interval=timedelta(seconds=30),
+            config_entry=config_entry,
+        )
+        await coordinator.async_config_entry_first_refresh()
+        coordinator.async_apply_optimistic(heat_temp_set=45)
+
+        await coordinator.async_refresh()
+        assert coordinator.data["heat_temp_set"] == 45
+        assert coordinator.update_interval == timedelta(seconds=30)
+
+
 @pytest.mark.asyncio
 async def test_coordinator_entity_update(hass: HomeAssistant):
     """Test that entities get updated when the coordinator updates."""
     # Create a mock client with an async_get_data method
     client = MagicMock()
+    client.async_wait_until_ready = AsyncMock(return_value=True)
     client.async_get_data = AsyncMock(
         side_effect=[
             {"water_out_temp": 35.0, "power": True},  # First call
@@ -168,6 +395,7 @@ async def test_coordinator_entity_update(hass: HomeAssistant):
     # Create a mock config entry with proper state
     config_entry = MagicMock()
     config_entry.state = ConfigEntryState.SETUP_IN_PROGRESS
+    config_entry.options = {}
     config_entry.runtime_data = MagicMock()
     config_entry.runtime_data.client = client
 
@@ -207,3 +435,129 @@ async def test_coordinator_entity_update(hass: HomeAssistant):
         assert listener.call_count >= 1, (
             "Listener should not be called after unsubscribing"
         )
+
+
+@pytest.mark.asyncio
+async def test_restore_snapshot_until_first_poll(hass: HomeAssistant, hass_storage):
+    """A persisted snapshot is served as stale data until a poll succeeds."""
+    hass_storage[f"{DOMAIN}.test.snapshot"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.test.snapshot",
+        "data": {"data": {"water_out_temp": 33.0, "power": True}},
+    }
+    client = MagicMock()
+    client.async_wait_until_ready = AsyncMock(return_value=True)
+    client.async_get_data = AsyncMock(
+        return_value={"water_out_temp": 35.0, "power": True}
+    )
+
+    config_entry = MagicMock()
+    config_entry.entry_id = "test"
+    config_entry.options = {}
+    config_entry.runtime_data.client = client
+
+    coordinator = GreeVersatiDataUpdateCoordinator(
+        hass=hass,
+        name=DOMAIN,
+        logger=LOGGER,
+        update_interval=timedelta(seconds=30),
+        config_entry=config_entry,
+    )
+    assert await coordinator.async_restore_snapshot() is True
+    assert coordinator.stale is True
+    assert coordinator.data == {"water_out_temp": 33.0, "power": True}
+    client.async_get_data.assert_not_awaited()
+
+    await coordinator.async_refresh()
+    assert coordinator.stale is False
+    assert coordinator.data == {"water_out_temp": 35.0, "power": True}
+
+
+@pytest.mark.asyncio
+async def test_restore_snapshot_missing(hass: HomeAssistant, hass_storage):
+    """Without a persisted snapshot setup falls back to a blocking refresh."""
+    assert f"{DOMAIN}.never-saved.snapshot" not in hass_storage
+    config_entry = MagicMock()
+    config_entry.entry_id = "never-saved"
+    config_entry.options = {}
+
+    coordinator = GreeVersatiDataUpdateCoordinator(
+        hass=hass,
+        name=DOMAIN,
+        logger=LOGGER,
+        update_interval=timedelta(seconds=30),
+        config_entry=config_entry,
+    )
+    assert await coordinator.async_restore_snapshot() is False
+    assert coordinator.data is None
+    assert coordinator.stale is False
+
+
+@pytest.mark.asyncio
+async def test_failing_polls_back_off_until_a_command_succeeds(hass: HomeAssistant):
+    """Failures stretch the interval; a successful command polls at once."""
+    client = MagicMock()
+    client.async_wait_until_ready = AsyncMock(return_value=True)
+    client.async_get_data = AsyncMock(side_effect=TimeoutError("no answer"))
+    client.async_probe = AsyncMock(side_effect=TimeoutError("no answer"))
+
+    config_entry = MagicMock()
+    config_entry.options = {}
+    config_entry.runtime_data.client = client
+
+    coordinator = GreeVersatiDataUpdateCoordinator(
+        hass=hass,
+        name=DOMAIN,
+        logger=LOGGER,
+        update_interval=timedelta(seconds=30),
+        config_entry=config_entry,
+    )
+    await coordinator.async_refresh()
+    first = coordinator.update_interval
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success is False
+    # The retry only cost a liveness probe, not another full poll
+    client.async_probe.assert_awaited_once()
+    client.async_get_data.assert_awaited_once()
+    assert timedelta(seconds=30) <= first <= timedelta(seconds=60)
+    assert timedelta(seconds=60) <= coordinator.update_interval
+    assert coordinator.update_interval <= timedelta(seconds=120)
+
+    # A command got through: the unit is back, so poll without waiting
+    coordinator.async_apply_optimistic(heat_temp_set=40)
+    config_entry.async_create_background_task.assert_called_once()
+    config_entry.async_create_background_task.call_args.args[1].close()
+
+
+@pytest.mark.asyncio
+async def test_grace_window_keeps_last_good_data(hass: HomeAssistant):
+    """A few failed polls serve the last good data before going unavailable."""
+    good = {"water_out_temp": 35.0, "power": True, "data_age": 0.5}
+    client = MagicMock()
+    client.async_wait_until_ready = AsyncMock(return_value=True)
+    client.async_probe = AsyncMock(return_value=0.01)
+    client.async_get_data = AsyncMock(
+        side_effect=[good, TimeoutError("lost"), TimeoutError("lost"), TimeoutError]
+    )
+
+    config_entry = MagicMock()
+    config_entry.options = {"grace_failures": 2, "grace_period": 300}
+    config_entry.runtime_data.client = client
+
+    coordinator = GreeVersatiDataUpdateCoordinator(
+        hass=hass,
+        name=DOMAIN,
+        logger=LOGGER,
+        update_interval=timedelta(seconds=30),
+        config_entry=config_entry,
+    )
+    await coordinator.async_refresh()
+
+    for _ in range(2):
+        await coordinator.async_refresh()
+        assert coordinator.last_update_success is True
+        assert coordinator.data["water_out_temp"] == 35.0
+        assert coordinator.data["data_age"] >= 0.5
+
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success is False
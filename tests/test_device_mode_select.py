@@ -43,7 +43,9 @@ async def test_select_calls_client_on_choose():
     coordinator = MagicMock()
     coordinator.config_entry.entry_id = "test_entry_id"
     coordinator.config_entry.runtime_data.client = MagicMock()
-    coordinator.config_entry.runtime_data.client.set_device_mode = AsyncMock()
+    coordinator.config_entry.runtime_data.client.set_device_mode = AsyncMock(
+        return_value=True
+    )
     coordinator.async_request_refresh = AsyncMock()
 
     select = GreeVersatiDeviceModeSelect(coordinator)
@@ -57,6 +59,26 @@ async def test_select_calls_client_on_choose():
     coordinator.async_apply_optimistic_device_mode.assert_called_once_with("hot_water")
 
 
+@pytest.mark.asyncio
+async def test_select_held_command_publishes_nothing():
+    """A mode change held for replay leaves the coordinator alone."""
+    from custom_components.gree_versati.select import GreeVersatiDeviceModeSelect
+
+    coordinator = MagicMock()
+    coordinator.config_entry.entry_id = "test_entry_id"
+    client = coordinator.config_entry.runtime_data.client
+    client.set_device_mode = AsyncMock(return_value=False)
+
+    select = GreeVersatiDeviceModeSelect(coordinator)
+
+    await select.async_select_option("hot_water")
+
+    client.set_device_mode.assert_awaited_once_with("hot_water")
+    # No optimistic state, backoff reset, recover refresh or settle
+    coordinator.async_apply_optimistic_device_mode.assert_not_called()
+    coordinator.async_apply_optimistic.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_async_setup_entry_adds_entity():
     """Platform setup should add the select entity."""
@@ -0,0 +1,53 @@
+"""Tests for the Gree Versati diagnostics download."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.gree_versati.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.gree_versati.protocol import DeviceMetrics
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_redact_key_and_carry_history():
+    """The key is redacted; raw, decoded and timing data are included."""
+    metrics = DeviceMetrics()
+    with metrics.timing("poll") as cycle:
+        cycle.add("network", 0.05)
+        cycle.batches.extend([23, 23, 19])
+
+    client = MagicMock()
+    client.ip = "192.168.1.100"
+    client.port = 7000
+    client.cipher_type = "gcm"
+    client.metrics = metrics
+    client.device.rtt = 0.05
+    client.device.raw_properties = {"Pow": 1, "Mod": 4}
+    coordinator = MagicMock()
+    coordinator.data = {"power": 1}
+    coordinator.last_update_success = True
+    coordinator.update_interval = timedelta(seconds=30)
+    coordinator.stale = False
+    entry = MagicMock()
+    entry.data = {"ip": "192.168.1.100", "key": "0123456789abcdef"}
+    entry.options = {}
+    entry.runtime_data.client = client
+    entry.runtime_data.coordinator = coordinator
+
+    result = await async_get_config_entry_diagnostics(MagicMock(), entry)
+
+    assert result["entry"]["data"]["key"] == "**REDACTED**"
+    assert result["device"]["raw_properties"] == {"Pow": 1, "Mod": 4}
+    assert result["coordinator"]["data"] == {"power": 1}
+    assert result["coordinator"]["update_interval"] == 30
+    (timing,) = result["timings"]
+    assert timing["kind"] == "poll"
+    assert timing["phases"] == {"network": 0.05}
+    assert timing["batches"] == [23, 23, 19]
+    assert result["errors"] == []
+    assert result["loop_stalls"] is None
@@ -0,0 +1,45 @@
+"""Tests for reconciling optimistic values with polled state."""
+
+from custom_components.gree_versati.expectations import PendingExpectations
+
+
+def test_no_expectations_returns_poll_unchanged():
+    """Without pending keys the poll is passed through as-is."""
+    expectations = PendingExpectations()
+    polled = {"power": 1, "mode": 4}
+    assert expectations.reconcile(polled, now=0.0) is polled
+
+
+def test_contradicting_poll_is_held_until_convergence():
+    """A transitional value is masked; agreement drops the expectation."""
+    expectations = PendingExpectations(hold=60.0)
+    expectations.expect({"power": True, "mode": 4}, now=0.0)
+
+    # Unit caught mid power-cycle: keep showing the commanded state
+    data = expectations.reconcile({"power": 0, "mode": 4, "temp": 40.0}, now=5.0)
+    assert data == {"power": True, "mode": 4, "temp": 40.0}
+    # mode already agreed and was dropped; power is still pending
+    assert len(expectations) == 1
+
+    data = expectations.reconcile({"power": 1, "mode": 4, "temp": 41.0}, now=10.0)
+    assert data == {"power": 1, "mode": 4, "temp": 41.0}
+    assert len(expectations) == 0
+
+
+def test_expired_expectation_lets_poll_win():
+    """After the deadline the device's report is accepted."""
+    expectations = PendingExpectations(hold=60.0)
+    expectations.expect({"heat_temp_set": 45}, now=0.0)
+
+    data = expectations.reconcile({"heat_temp_set": 40}, now=61.0)
+    assert data == {"heat_temp_set": 40}
+    assert len(expectations) == 0
+
+
+def test_newer_expectation_replaces_older():
+    """A later command for the same key restarts its deadline."""
+    expectations = PendingExpectations(hold=60.0)
+    expectations.expect({"mode": 1}, now=0.0)
+    expectations.expect({"mode": 4}, now=50.0)
+
+    assert expectations.reconcile({"mode": 1}, now=100.0) == {"mode": 4}
@@ -0,0 +1,72 @@
+"""Tests for the integration-wide poll fleet."""
+
+import asyncio
+
+import pytest
+
+from custom_components.gree_versati.fleet import PollFleet
+
+
+def test_members_get_evenly_spread_slots():
+    """Each unit's polls land on its own share of the interval."""
+    fleet = PollFleet()
+    for member in ("a", "b", "c"):
+        fleet.join(member)
+
+    slots = {
+        member: (1000.0 + fleet.next_delay(member, 30.0, now=1000.0)) % 30.0
+        for member in ("a", "b", "c")
+    }
+    assert slots == pytest.approx({"a": 0.0, "b": 10.0, "c": 20.0})
+    # The cadence stays close to the interval
+    for member in ("a", "b", "c"):
+        assert 15.0 <= fleet.next_delay(member, 30.0, now=1000.0) < 45.0
+
+
+def test_slots_never_undercut_the_minimum_interval():
+    """Aligning to a slot never polls faster than the minimum interval."""
+    fleet = PollFleet()
+    for member in ("a", "b", "c"):
+        fleet.join(member)
+
+    for now in range(1000, 1030):
+        for member in ("a", "b", "c"):
+            assert fleet.next_delay(member, 30.0, now=now, minimum=20.0) >= 20.0
+    # At the minimum already, alignment would only slow the unit down
+    assert fleet.next_delay("b", 10.0, now=1003.0, minimum=10.0) == 10.0
+
+
+def test_lone_unit_and_leaving_members():
+    """A single unit polls at its plain interval; leaving rebalances."""
+    fleet = PollFleet()
+    fleet.join("a")
+    assert fleet.next_delay("a", 30.0, now=1234.5) == 30.0
+
+    fleet.join("b")
+    assert "b" in fleet
+    fleet.leave("b")
+    assert "b" not in fleet
+    assert fleet.next_delay("a", 30.0, now=1234.5) == 30.0
+
+
+@pytest.mark.asyncio
+async def test_healthy_polls_go_before_retries():
+    """With the fleet at its limit, healthy units are served first."""
+    fleet = PollFleet(max_in_flight=1)
+    order: list[str] = []
+    gate = asyncio.Event()
+
+    async def poll(name: str) -> None:
+        if name == "first":
+            await gate.wait()
+        order.append(name)
+
+    first = asyncio.create_task(fleet.run(lambda: poll("first")))
+    await asyncio.sleep(0)
+    retry = asyncio.create_task(fleet.run(lambda: poll("retry"), healthy=False))
+    healthy = asyncio.create_task(fleet.run(lambda: poll("healthy")))
+    await asyncio.sleep(0)
+    gate.set()
+    await asyncio.gather(first, retry, healthy)
+
+    assert order == ["first", "healthy", "retry"]
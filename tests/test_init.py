@@ -1,8 +1,9 @@
 """Test gree_versati integration."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
@@ -64,3 +65,33 @@ async def test_setup_entry_fails_cannot_connect(
         # Setup should fail
         result = await hass.config_entries.async_setup(mock_config_entry.entry_id)
         assert not result
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("other_state", "shut_down"),
+    [
+        (None, True),
+        (ConfigEntryState.NOT_LOADED, True),
+        (ConfigEntryState.LOADED, False),
+        (ConfigEntryState.SETUP_IN_PROGRESS, False),
+    ],
+)
+async def test_unload_stops_codec_pool_after_last_entry(other_state, shut_down):
+    """The shared codec pool stops only when no other entry may use it."""
+    from custom_components.gree_versati import async_unload_entry
+
+    entry = MagicMock(entry_id="unloading")
+    entries = [entry]
+    if other_state is not None:
+        entries.append(MagicMock(entry_id="other", state=other_state))
+    hass = MagicMock()
+    hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
+    hass.config_entries.async_entries.return_value = entries
+
+    with patch(
+        "custom_components.gree_versati.shutdown_codec_executor"
+    ) as shutdown_codec_executor:
+        assert await async_unload_entry(hass, entry)
+
+    assert shutdown_codec_executor.called is shut_down
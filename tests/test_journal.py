@@ -0,0 +1,35 @@
+"""Tests for the offline command journal."""
+
+from custom_components.gree_versati.journal import DEVICE_MODE, CommandJournal
+
+
+def test_records_merge_by_key():
+    """Only the latest desired value per key is kept."""
+    journal = CommandJournal(ttl=300)
+    journal.record({"HeWatOutTemSet": 40, DEVICE_MODE: "heat"}, now=0.0)
+    journal.record({"HeWatOutTemSet": 45}, now=10.0)
+
+    assert journal.pending(now=20.0) == {"HeWatOutTemSet": 45, DEVICE_MODE: "heat"}
+
+
+def test_entries_expire_after_ttl():
+    """Stale intents are dropped, each by its own recording time."""
+    journal = CommandJournal(ttl=60)
+    journal.record({DEVICE_MODE: "heat"}, now=0.0)
+    journal.record({"WatBoxTemSet": 50}, now=30.0)
+
+    assert journal.pending(now=70.0) == {"WatBoxTemSet": 50}
+    assert journal.pending(now=100.0) == {}
+    assert len(journal) == 0
+
+
+def test_discard_keeps_newer_values():
+    """A value recorded during replay survives the replay's discard."""
+    journal = CommandJournal(ttl=300)
+    journal.record({"HeWatOutTemSet": 40, "FastHtWter": True}, now=0.0)
+    sent = journal.pending(now=1.0)
+    journal.record({"HeWatOutTemSet": 42}, now=2.0)
+
+    journal.discard(sent)
+
+    assert journal.pending(now=3.0) == {"HeWatOutTemSet": 42}
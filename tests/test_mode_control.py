@@ -14,6 +14,11 @@ from custom_components.gree_versati.const import (
 from custom_components.gree_versati.protocol import AwhpProps
 
 
+def _device_state(*, power: bool, mode: int | None) -> dict[str, int | None]:
+    """Raw Pow/Mod values as the unit's fresh status read returns them."""
+    return {"Pow": int(power), "Mod": mode}
+
+
 @pytest.mark.asyncio
 async def test_client_has_set_device_mode_api():
     """Client should expose set_device_mode(mode) for 6 modes."""
@@ -39,6 +44,8 @@ async def test_hw_only_mapping_sets_mod_correctly():
 
     # Provide minimal internal data structure for follow-up refresh
     client._data = {}
+    # Unit reports nothing yet: power state unknown
+    device.get_properties = AsyncMock(return_value={})
 
     # Execute: set HW-only mode
     client.async_get_data = AsyncMock(return_value={})
@@ -77,6 +84,9 @@ async def test_set_device_mode_off_before_mode_when_on():
     client.device = device
     # Current state: ON in COOL
     client._data = {"power": True, "mode": MODE_COOL}
+    client.device.get_properties = AsyncMock(
+        return_value=_device_state(power=True, mode=MODE_COOL)
+    )
     client.async_get_data = AsyncMock(return_value={})
 
     await client.set_device_mode("heat")
@@ -120,6 +130,9 @@ async def test_set_device_mode_writes_correct_mod_values():
         device.push_state_update = AsyncMock()
         client.device = device
         client._data = {"power": False, "mode": None}
+        client.device.get_properties = AsyncMock(
+            return_value=_device_state(power=False, mode=None)
+        )
         client.async_get_data = AsyncMock(return_value={})
 
         await client.set_device_mode(mode)
@@ -148,6 +161,9 @@ async def test_set_device_mode_when_off_sets_mode_then_on():
     device.push_state_update = AsyncMock()
     client.device = device
     client._data = {"power": False, "mode": MODE_COOL}
+    client.device.get_properties = AsyncMock(
+        return_value=_device_state(power=False, mode=MODE_COOL)
+    )
     client.async_get_data = AsyncMock(return_value={})
 
     await client.set_device_mode("heat")
@@ -173,6 +189,9 @@ async def test_set_device_mode_updates_cache_optimistically():
     device.push_state_update = AsyncMock()
     client.device = device
     client._data = {"power": True, "mode": MODE_HEAT, "hot_water_temp": 50.0}
+    client.device.get_properties = AsyncMock(
+        return_value=_device_state(power=True, mode=MODE_HEAT)
+    )
     # Polling right after a mode change would read transitional values
     client.async_get_data = AsyncMock(
         side_effect=AssertionError("must not poll mid-transition")
@@ -208,8 +227,254 @@ async def test_set_device_mode_off_always_powers_off():
     device.push_state_update = AsyncMock()
     client.device = device
     client._data = {"power": True, "mode": MODE_HEAT}
+    client.device.get_properties = AsyncMock(
+        return_value=_device_state(power=True, mode=MODE_HEAT)
+    )
     client.async_get_data = AsyncMock(return_value={})
 
     await client.set_device_mode("off")
 
     assert ("POWER", False) in events
+
+
+def _recording_device(events: list[tuple[str, object]]) -> MagicMock:
+    """Fake device recording staged writes and pushes in order."""
+
+    def record(prop: AwhpProps, *args, **kwargs):
+        events.append((prop.name, args[0] if args else kwargs.get("value")))
+
+    async def push():
+        events.append(("PUSH", None))
+
+    device = MagicMock()
+    device.set_property = MagicMock(side_effect=record)
+    device.push_state_update = AsyncMock(side_effect=push)
+    return device
+
+
+@pytest.mark.asyncio
+async def test_transaction_mode_change_carries_writes_in_final_packet():
+    """Mode + boost commit as OFF -> MODE -> (boost + ON): three packets."""
+    from custom_components.gree_versati.client import GreeVersatiClient
+
+    client = GreeVersatiClient()
+    events: list[tuple[str, object]] = []
+    client.device = _recording_device(events)
+    client._data = {"power": True, "mode": MODE_HEAT}
+    client.device.get_properties = AsyncMock(
+        return_value=_device_state(power=True, mode=MODE_HEAT)
+    )
+
+    async with client.transaction() as tx:
+        tx.set_device_mode("heat_hot_water")
+        tx.set_dhw_mode("performance")
+        tx.set_dhw_temperature(55)
+
+    assert events == [
+        ("POWER", False),
+        ("PUSH", None),
+        ("MODE", 4),
+        ("PUSH", None),
+        ("FAST_HEAT_WATER", True),
+        ("HOT_WATER_TEMP_SET", 55),
+        ("POWER", True),
+        ("PUSH", None),
+    ]
+    assert client._data["mode"] == 4
+    assert client._data["fast_heat_water"] is True
+    assert client._data["hot_water_temp_set"] == 55
+
+
+@pytest.mark.asyncio
+async def test_transaction_without_mode_change_is_one_packet():
+    """Plain setting writes from several entities share a single cmd."""
+    from custom_components.gree_versati.client import GreeVersatiClient
+
+    client = GreeVersatiClient()
+    events: list[tuple[str, object]] = []
+    client.device = _recording_device(events)
+    client._data = {"power": True, "mode": MODE_HEAT}
+    client.device.get_properties = AsyncMock(
+        return_value=_device_state(power=True, mode=MODE_HEAT)
+    )
+    client.async_get_data = AsyncMock(side_effect=AssertionError("no poll"))
+
+    async with client.transaction() as tx:
+        tx.set_temperature(45)
+        tx.set_dhw_temperature(50)
+        tx.set_dhw_mode("normal")
+
+    assert [e for e in events if e[0] == "PUSH"] == [("PUSH", None)]
+    assert ("HEAT_TEMP_SET", 45) in events
+    assert ("POWER", True) not in events
+    assert client._data["heat_temp_set"] == 45
+
+
+@pytest.mark.asyncio
+async def test_transaction_commits_as_one_job_and_sends_nothing_on_error():
+    """No poll interleaves a commit; a failing block sends nothing."""
+    import asyncio
+
+    from custom_components.gree_versati.client import GreeVersatiClient
+
+    client = GreeVersatiClient()
+    events: list[tuple[str, object]] = []
+    device = _recording_device(events)
+    device.get_properties = AsyncMock(
+        return_value=_device_state(power=True, mode=MODE_COOL)
+    )
+
+    async def poll():
+        events.append(("POLL", None))
+        return {}
+
+    device.get_all_properties = AsyncMock(side_effect=poll)
+    for name in ("t_water_out_pe", "t_water_in_pe", "hot_water_temp", "t_opt_water"):
+        setattr(device, name, MagicMock(return_value=None))
+    client.device = device
+
+    commit = asyncio.create_task(client.set_device_mode("heat"))
+    await asyncio.sleep(0)
+    await client.async_get_data()
+    await commit
+
+    # The poll queued behind the whole OFF -> MODE -> ON sequence
+    assert [e[0] for e in events if e[0] in ("PUSH", "POLL")] == [
+        "PUSH",
+        "PUSH",
+        "PUSH",
+        "POLL",
+    ]
+
+    async def failing_block():
+        async with client.transaction() as tx:
+            tx.set_dhw_temperature(50)
+            tx.set_device_mode("turbo")
+
+    device.push_state_update.reset_mock()
+    with pytest.raises(ValueError, match="Unsupported device mode"):
+        await failing_block()
+    device.push_state_update.assert_not_awaited()
+
+
+@pytest.mark.parametrize(
+    "power,mod,target,expected",
+    [
+        # Already there: nothing to send
+        (True, MODE_HEAT, MODE_HEAT, []),
+        (False, MODE_HEAT, None, []),
+        # Same Mod, just off: power on only
+        (False, MODE_HEAT, MODE_HEAT, [{AwhpProps.POWER: True}]),
+        # Off in another Mod: no redundant power-off
+        (
+            False,
+            MODE_COOL,
+            MODE_HEAT,
+            [{AwhpProps.MODE: MODE_HEAT}, {AwhpProps.POWER: True}],
+        ),
+        # On in another Mod: full OFF -> MODE -> ON
+        (
+            True,
+            MODE_COOL,
+            MODE_HEAT,
+            [
+                {AwhpProps.POWER: False},
+                {AwhpProps.MODE: MODE_HEAT},
+                {AwhpProps.POWER: True},
+            ],
+        ),
+        # Unknown power: never skip the OFF by guess
+        (
+            None,
+            MODE_COOL,
+            MODE_HEAT,
+            [
+                {AwhpProps.POWER: False},
+                {AwhpProps.MODE: MODE_HEAT},
+                {AwhpProps.POWER: True},
+            ],
+        ),
+        (True, MODE_HEAT, None, [{AwhpProps.POWER: False}]),
+    ],
+)
+def test_plan_device_mode(power, mod, target, expected):
+    """The planner emits only the steps that change something."""
+    from custom_components.gree_versati.client import plan_device_mode
+
+    assert plan_device_mode(power=power, mod=mod, target_mod=target) == expected
+
+
+@pytest.mark.asyncio
+async def test_set_device_mode_plans_from_fresh_state_not_cache():
+    """A stale cache must not cause redundant power-off or Mod writes."""
+    from custom_components.gree_versati.client import GreeVersatiClient
+
+    client = GreeVersatiClient()
+    events: list[tuple[str, object]] = []
+    client.device = _recording_device(events)
+    # Cache says ON in cool, but the unit has since been switched to heat
+    client._data = {"power": True, "mode": MODE_COOL}
+    client.device.get_properties = AsyncMock(
+        return_value=_device_state(power=True, mode=MODE_HEAT)
+    )
+
+    await client.set_device_mode("heat")
+
+    client.device.get_properties.assert_awaited_once_with(
+        (AwhpProps.POWER, AwhpProps.MODE)
+    )
+    assert events == []
+    assert client._data["mode"] == MODE_HEAT
+
+
+@pytest.mark.asyncio
+async def test_wait_for_mode_backs_off_until_settled():
+    """Only Pow/Mod are polled, with growing delays, until they match."""
+    from unittest.mock import patch
+
+    from custom_components.gree_versati.client import GreeVersatiClient
+
+    client = GreeVersatiClient()
+    client.device = MagicMock()
+    client.device.get_properties = AsyncMock(
+        side_effect=[
+            # Mid power-cycle the unit reports itself off
+            _device_state(power=False, mode=4),
+            _device_state(power=True, mode=1),
+            _device_state(power=True, mode=4),
+        ]
+    )
+
+    with patch(
+        "custom_components.gree_versati.client.asyncio.sleep", new=AsyncMock()
+    ) as sleep:
+        assert await client.async_wait_for_mode("heat_hot_water") is True
+
+    assert client.device.get_properties.await_count == 3
+    assert [c.args[0] for c in sleep.await_args_list] == [0.5, 1.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_wait_for_mode_gives_up_at_deadline():
+    """A unit that never settles (or never answers) stops being polled."""
+    from custom_components.gree_versati.client import GreeVersatiClient
+    from custom_components.gree_versati.protocol import GreeTimeoutError
+
+    client = GreeVersatiClient()
+    client.device = MagicMock()
+    client.device.get_properties = AsyncMock(side_effect=GreeTimeoutError("gone"))
+
+    assert await client.async_wait_for_mode("off", timeout=0.05) is False
+    assert client.device.get_properties.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_wait_for_mode_requires_device():
+    """Waiting for a mode before the device is set up fails at once."""
+    from custom_components.gree_versati.client import (
+        DeviceNotInitializedError,
+        GreeVersatiClient,
+    )
+
+    with pytest.raises(DeviceNotInitializedError):
+        await GreeVersatiClient().async_wait_for_mode("heat")
@@ -24,8 +24,16 @@ def _make_coordinator():
     coordinator.last_update_success = True
     coordinator.config_entry.entry_id = "test_entry_id"
     coordinator.config_entry.runtime_data.client = MagicMock()
-    coordinator.config_entry.runtime_data.client.set_device_mode = AsyncMock()
-    coordinator.config_entry.runtime_data.client.set_dhw_mode = AsyncMock()
+    coordinator.config_entry.runtime_data.client.set_device_mode = AsyncMock(
+        return_value=True
+    )
+    coordinator.config_entry.runtime_data.client.set_dhw_mode = AsyncMock(
+        return_value=True
+    )
+    # transaction() is an async context manager yielding a recorder
+    client = coordinator.config_entry.runtime_data.client
+    client.transaction = MagicMock()
+    client.transaction.return_value.__aenter__.return_value = MagicMock(journaled=False)
     coordinator.async_request_refresh = AsyncMock()
     coordinator.data = {}
     return coordinator
@@ -113,12 +121,17 @@ async def test_water_heater_async_set_operation_mode_combines(
     await entity.async_set_operation_mode(op_mode)
 
     client = coordinator.config_entry.runtime_data.client
-    client.set_device_mode.assert_awaited_once_with(expected)
+    transaction = client.transaction.return_value.__aenter__.return_value
+    # Mode and boost flag are committed together in one transaction
+    client.transaction.assert_called_once_with()
+    transaction.set_device_mode.assert_called_once_with(expected)
+    client.set_device_mode.assert_not_awaited()
+    client.set_dhw_mode.assert_not_awaited()
     if expected_boost is None:
-        client.set_dhw_mode.assert_not_awaited()
+        transaction.set_dhw_mode.assert_not_called()
         coordinator.async_apply_optimistic_device_mode.assert_called_once_with(expected)
     else:
-        client.set_dhw_mode.assert_awaited_once_with(expected_boost)
+        transaction.set_dhw_mode.assert_called_once_with(expected_boost)
         coordinator.async_apply_optimistic_device_mode.assert_called_once_with(
             expected, fast_heat_water=expected_boost == "performance"
         )
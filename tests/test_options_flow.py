@@ -10,12 +10,18 @@ from custom_components.gree_versati.config_flow import (
     GreeVersatiOptionsFlow,
 )
 from custom_components.gree_versati.const import (
+    CONF_COMMAND_JOURNAL_TTL,
     CONF_COOL_TEMP_MAX,
     CONF_COOL_TEMP_MIN,
     CONF_DHW_TEMP_MAX,
     CONF_DHW_TEMP_MIN,
+    CONF_GRACE_FAILURES,
+    CONF_GRACE_PERIOD,
     CONF_HEAT_TEMP_MAX,
     CONF_HEAT_TEMP_MIN,
+    CONF_OFFLOAD_CODEC,
+    CONF_POLL_INTERVAL_MAX,
+    CONF_POLL_INTERVAL_MIN,
     DOMAIN,
 )
 
@@ -60,6 +66,12 @@ async def test_options_form_defaults_to_device_limits():
         CONF_COOL_TEMP_MAX: 25,
         CONF_DHW_TEMP_MIN: 40,
         CONF_DHW_TEMP_MAX: 80,
+        CONF_POLL_INTERVAL_MIN: 10,
+        CONF_POLL_INTERVAL_MAX: 120,
+        CONF_GRACE_FAILURES: 3,
+        CONF_GRACE_PERIOD: 300,
+        CONF_COMMAND_JOURNAL_TTL: 0,
+        CONF_OFFLOAD_CODEC: False,
     }
 
 
@@ -92,6 +104,12 @@ async def test_options_saved_as_ints():
             CONF_COOL_TEMP_MAX: 20.0,
             CONF_DHW_TEMP_MIN: 45.0,
             CONF_DHW_TEMP_MAX: 65.0,
+            CONF_POLL_INTERVAL_MIN: 15.0,
+            CONF_POLL_INTERVAL_MAX: 300.0,
+            CONF_GRACE_FAILURES: 0.0,
+            CONF_GRACE_PERIOD: 120.0,
+            CONF_COMMAND_JOURNAL_TTL: 600.0,
+            CONF_OFFLOAD_CODEC: True,
         }
     )
 
@@ -103,6 +121,12 @@ async def test_options_saved_as_ints():
         CONF_COOL_TEMP_MAX: 20,
         CONF_DHW_TEMP_MIN: 45,
         CONF_DHW_TEMP_MAX: 65,
+        CONF_POLL_INTERVAL_MIN: 15,
+        CONF_POLL_INTERVAL_MAX: 300,
+        CONF_GRACE_FAILURES: 0,
+        CONF_GRACE_PERIOD: 120,
+        CONF_COMMAND_JOURNAL_TTL: 600,
+        CONF_OFFLOAD_CODEC: True,
     }
 
 
@@ -113,6 +137,11 @@ async def test_options_saved_as_ints():
         (CONF_HEAT_TEMP_MIN, CONF_HEAT_TEMP_MAX, "heat_min_above_max"),
         (CONF_COOL_TEMP_MIN, CONF_COOL_TEMP_MAX, "cool_min_above_max"),
         (CONF_DHW_TEMP_MIN, CONF_DHW_TEMP_MAX, "dhw_min_above_max"),
+        (
+            CONF_POLL_INTERVAL_MIN,
+            CONF_POLL_INTERVAL_MAX,
+            "poll_interval_min_above_max",
+        ),
     ],
 )
 async def test_options_min_above_max_shows_error(min_key, max_key, error):
@@ -124,6 +153,12 @@ async def test_options_min_above_max_shows_error(min_key, max_key, error):
         CONF_COOL_TEMP_MAX: 25,
         CONF_DHW_TEMP_MIN: 40,
         CONF_DHW_TEMP_MAX: 80,
+        CONF_POLL_INTERVAL_MIN: 10,
+        CONF_POLL_INTERVAL_MAX: 120,
+        CONF_GRACE_FAILURES: 3,
+        CONF_GRACE_PERIOD: 300,
+        CONF_COMMAND_JOURNAL_TTL: 0,
+        CONF_OFFLOAD_CODEC: False,
     }
     user_input = {**valid, min_key: valid[max_key] + 1}
     flow = _make_flow()
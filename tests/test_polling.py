@@ -0,0 +1,61 @@
+"""Tests for the adaptive poll interval policy."""
+
+from custom_components.gree_versati.polling import AdaptiveInterval, FailureBackoff
+
+
+def _running(temp: float, **extra):
+    return {"power": 1, "water_out_temp": temp, "hot_water_temp": 48.0, **extra}
+
+
+def test_active_device_polls_at_minimum():
+    """Defrost, heater stages or a pending transition poll fastest."""
+    policy = AdaptiveInterval(base=30, low=10, high=120)
+    assert (
+        policy.update(_running(35.0, defrosting_status=1), transition_pending=False)
+        == 10
+    )
+    assert (
+        policy.update(_running(35.0, hp_heater_1_status=1), transition_pending=False)
+        == 10
+    )
+    assert policy.update(_running(35.0), transition_pending=True) == 10
+
+
+def test_powered_off_device_polls_at_maximum():
+    """An idle, switched-off unit is polled as rarely as allowed."""
+    policy = AdaptiveInterval(base=30, low=10, high=120)
+    assert (
+        policy.update({"power": 0, "water_out_temp": 20.0}, transition_pending=False)
+        == 120
+    )
+
+
+def test_flat_temperatures_stretch_the_interval():
+    """Unchanged readings grow the interval; a change resets it."""
+    policy = AdaptiveInterval(base=30, low=10, high=120)
+    intervals = [
+        policy.update(_running(35.0), transition_pending=False) for _ in range(8)
+    ]
+    assert intervals[:3] == [30, 30, 30]
+    assert intervals[3] == 45
+    assert intervals[-1] == 120  # capped at the maximum
+
+    assert policy.update(_running(37.0), transition_pending=False) == 30
+
+
+def test_user_bounds_clamp_the_baseline():
+    """Bounds from the options flow win over the built-in baseline."""
+    policy = AdaptiveInterval(base=30, low=60, high=90)
+    assert policy.update(_running(35.0), transition_pending=False) == 60
+
+
+def test_failure_backoff_doubles_with_jitter_up_to_cap():
+    """Each failure doubles the delay; jitter keeps it in the upper half."""
+    backoff = FailureBackoff(base=30, cap=600)
+    for expected in (60, 120, 240, 480, 600, 600):
+        assert expected / 2 <= backoff.failed() <= expected
+    assert backoff.failures == 6
+
+    backoff.reset()
+    assert backoff.failures == 0
+    assert 30 <= backoff.failed() <= 60
@@ -0,0 +1,92 @@
+"""Tests for on-demand profiling of polls and commands."""
+
+from __future__ import annotations
+
+import cProfile
+import pstats
+import tracemalloc
+from unittest.mock import patch
+
+from custom_components.gree_versati.profiling import CycleProfiler
+
+
+def _busy_poll() -> int:
+    return sum(range(10_000))
+
+
+def test_cprofile_covers_the_given_cycles_then_finishes(tmp_path):
+    """Nested cycles count once; after N cycles results are handed over."""
+    finished: list[CycleProfiler] = []
+    profiler = CycleProfiler("cprofile", 2, finished.append)
+
+    with profiler.cycle("poll"), profiler.cycle("command"):
+        _busy_poll()
+    assert finished == []
+    with profiler.cycle("poll"):
+        _busy_poll()
+    assert finished == [profiler]
+    # Further cycles are not profiled
+    with profiler.cycle("poll"):
+        pass
+
+    stats_path, summary = profiler.write(tmp_path / "profile")
+    functions = {name for _, _, name in pstats.Stats(str(stats_path)).stats}
+    assert "_busy_poll" in functions
+    assert "_busy_poll" in summary.read_text()
+
+
+def test_profile_ends_early_when_another_profiler_is_active(tmp_path):
+    """A cycle that cannot enable cProfile still runs; the profile ends."""
+    finished: list[CycleProfiler] = []
+    profiler = CycleProfiler("cprofile", 3, finished.append)
+    with profiler.cycle("poll"):
+        _busy_poll()
+
+    busy = patch.object(
+        cProfile.Profile,
+        "enable",
+        side_effect=ValueError("Another profiling tool is already active"),
+    )
+    with busy, profiler.cycle("poll"), profiler.cycle("command"):
+        ran = _busy_poll()
+
+    assert ran == sum(range(10_000))
+    assert finished == [profiler]
+    assert profiler._depth == 0
+    # Later cycles are left alone
+    with profiler.cycle("poll"):
+        pass
+    _, summary = profiler.write(tmp_path / "profile")
+    text = summary.read_text()
+    assert text.startswith("Stopped after 1 cycles: Another profiling tool")
+    assert "_busy_poll" in text
+
+
+def test_profile_that_never_ran_still_writes(tmp_path):
+    """With no cycle profiled the summary only says why."""
+    profiler = CycleProfiler("cprofile", 1, lambda _: None)
+    with (
+        patch.object(cProfile.Profile, "enable", side_effect=ValueError("busy")),
+        profiler.cycle("poll"),
+    ):
+        pass
+
+    stats_path, summary = profiler.write(tmp_path / "profile")
+    assert stats_path.exists()
+    assert summary.read_text() == "Stopped after 0 cycles: busy\n\n"
+
+
+def test_tracemalloc_reports_growth_per_cycle(tmp_path):
+    """Memory kept by a cycle shows up in its growth."""
+    kept: list[bytes] = []
+    profiler = CycleProfiler("tracemalloc", 1, lambda _: None)
+
+    with profiler.cycle("poll"):
+        kept.append(bytes(256_000))
+
+    assert not tracemalloc.is_tracing()
+    (summary,) = profiler.write(tmp_path / "memory")
+    first_line = summary.read_text().splitlines()[0]
+    growth = int(first_line.split(": ")[1].split()[0])
+    assert first_line.startswith("1. poll:")
+    assert growth >= 256_000
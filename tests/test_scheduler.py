@@ -0,0 +1,139 @@
+"""Tests for the per-device request scheduler."""
+
+import asyncio
+
+import pytest
+
+from custom_components.gree_versati.scheduler import (
+    PRIORITY_COMMAND,
+    PRIORITY_POLL,
+    RequestScheduler,
+)
+
+
+@pytest.mark.asyncio
+async def test_commands_run_before_queued_polls():
+    """Queued jobs run one at a time, highest priority first."""
+    scheduler = RequestScheduler()
+    order: list[str] = []
+    gate = asyncio.Event()
+
+    async def job(name: str) -> str:
+        if name == "first":
+            await gate.wait()
+        order.append(name)
+        return name
+
+    first = asyncio.create_task(scheduler.run(PRIORITY_POLL, lambda: job("first")))
+    await asyncio.sleep(0)
+    poll = asyncio.create_task(scheduler.run(PRIORITY_POLL, lambda: job("poll")))
+    command = asyncio.create_task(
+        scheduler.run(PRIORITY_COMMAND, lambda: job("command"))
+    )
+    await asyncio.sleep(0)
+    gate.set()
+
+    assert await asyncio.gather(first, poll, command) == ["first", "poll", "command"]
+    assert order == ["first", "command", "poll"]
+    assert not scheduler.busy
+
+
+@pytest.mark.asyncio
+async def test_redundant_polls_share_one_exchange():
+    """A keyed job submitted while one is pending joins it."""
+    scheduler = RequestScheduler()
+    calls = 0
+
+    async def poll() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return calls
+
+    results = await asyncio.gather(
+        *(scheduler.run(PRIORITY_POLL, poll, key="poll") for _ in range(3))
+    )
+    assert results == [1, 1, 1]
+    assert calls == 1
+
+    # Once done, the next poll is a fresh exchange
+    assert await scheduler.run(PRIORITY_POLL, poll, key="poll") == 2
+
+
+@pytest.mark.asyncio
+async def test_command_preempts_poll_in_flight():
+    """A stuck poll is cancelled for a command, then retried."""
+    scheduler = RequestScheduler()
+    attempts = 0
+    order: list[str] = []
+    in_flight = asyncio.Event()
+
+    async def poll() -> str:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            in_flight.set()
+            await asyncio.sleep(10)  # waiting on a dead unit's timeout
+        order.append("poll")
+        return "data"
+
+    async def command() -> str:
+        order.append("command")
+        return "ok"
+
+    poll_task = asyncio.create_task(
+        scheduler.run(PRIORITY_POLL, poll, key="poll", preemptible=True)
+    )
+    # Let the poll get in flight (the same-tick case is tested below)
+    await in_flight.wait()
+
+    assert await asyncio.wait_for(scheduler.run(PRIORITY_COMMAND, command), 1) == "ok"
+    assert await poll_task == "data"
+    assert order == ["command", "poll"]
+    assert attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_command_preempts_poll_submitted_in_the_same_tick():
+    """A poll whose job has not started yet is re-queued, not lost."""
+    scheduler = RequestScheduler()
+    order: list[str] = []
+
+    async def poll() -> str:
+        order.append("poll")
+        return "data"
+
+    async def command() -> str:
+        order.append("command")
+        return "ok"
+
+    # Both submitted before the poll's job gets to run
+    poll_task = asyncio.create_task(
+        scheduler.run(PRIORITY_POLL, poll, key="poll", preemptible=True)
+    )
+    command_task = asyncio.create_task(scheduler.run(PRIORITY_COMMAND, command))
+
+    results = await asyncio.wait_for(asyncio.gather(poll_task, command_task), 1)
+    assert results == ["data", "ok"]
+    assert order == ["command", "poll"]
+    assert not scheduler.busy
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_the_submitter_only():
+    """A failing job raises to its caller and the queue keeps going."""
+    scheduler = RequestScheduler()
+
+    async def boom() -> None:
+        msg = "timeout"
+        raise TimeoutError(msg)
+
+    async def fine() -> str:
+        return "ok"
+
+    failing = asyncio.create_task(scheduler.run(PRIORITY_COMMAND, boom))
+    succeeding = asyncio.create_task(scheduler.run(PRIORITY_POLL, fine))
+
+    with pytest.raises(TimeoutError):
+        await failing
+    assert await succeeding == "ok"
@@ -6,8 +6,11 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from custom_components.gree_versati.protocol import DeviceMetrics
 from custom_components.gree_versati.sensor import (
+    METRIC_DESCRIPTIONS,
     SENSOR_DESCRIPTIONS,
+    GreeVersatiMetricSensor,
     GreeVersatiSensor,
     async_setup_entry,
 )
@@ -55,6 +58,34 @@ def test_native_value_missing_is_none():
     assert sensor.native_value is None
 
 
+def test_metric_sensors_are_disabled_diagnostics():
+    """Wire counters stay out of the way until enabled."""
+    assert all(not d.entity_registry_enabled_default for d in METRIC_DESCRIPTIONS)
+    assert all(d.entity_category == "diagnostic" for d in METRIC_DESCRIPTIONS)
+
+
+def test_metric_sensor_reads_client_metrics():
+    """Metric values come from the client's counters, even while unavailable."""
+    coordinator = _make_coordinator()
+    coordinator.last_update_success = False
+    metrics = DeviceMetrics(timeouts=4)
+    metrics.requests.update({"status": 9, "cmd": 1})
+    metrics.rtt.observe(0.0421)
+    coordinator.config_entry.runtime_data.client.metrics = metrics
+
+    def sensor(key: str) -> GreeVersatiMetricSensor:
+        description = next(d for d in METRIC_DESCRIPTIONS if d.key == key)
+        return GreeVersatiMetricSensor(coordinator, description)
+
+    assert sensor("timeouts").available
+    assert sensor("timeouts").native_value == 4
+    assert sensor("rtt_p50").native_value == 42.1
+    assert sensor("poll_duration").native_value is None
+    requests = sensor("requests")
+    assert requests.native_value == 10
+    assert requests.extra_state_attributes == {"status": 9, "cmd": 1}
+
+
 @pytest.mark.asyncio
 async def test_async_setup_entry_adds_all_sensors():
     """Platform setup adds one entity per description."""
@@ -66,5 +97,7 @@ async def test_async_setup_entry_adds_all_sensors():
     await async_setup_entry(hass, entry, async_add_entities)
 
     entities = list(async_add_entities.call_args[0][0])
-    assert len(entities) == len(SENSOR_DESCRIPTIONS)
-    assert all(isinstance(e, GreeVersatiSensor) for e in entities)
+    assert len(entities) == len(SENSOR_DESCRIPTIONS) + len(METRIC_DESCRIPTIONS)
+    assert sum(isinstance(e, GreeVersatiSensor) for e in entities) == len(
+        SENSOR_DESCRIPTIONS
+    )
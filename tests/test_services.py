@@ -0,0 +1,183 @@
+"""Tests for the admin services: trace, profile, watch_loop and capture."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.gree_versati.const import DOMAIN
+from custom_components.gree_versati.profiling import CycleProfiler
+from custom_components.gree_versati.protocol import capture, stalls, tracing
+from custom_components.gree_versati.services import (
+    _async_capture,
+    _async_profile,
+    _async_trace,
+    _async_watch_loop,
+    async_setup_services,
+)
+
+
+@pytest.fixture(autouse=True)
+def _nothing_left_running():
+    yield
+    if (tracer := tracing.stop_tracing()) is not None:
+        tracer.close()
+    if (recorder := capture.stop_capture()) is not None:
+        recorder.close()
+    stalls.stop_watching()
+
+
+def _hass(tmp_path: Path, entries: list[MagicMock] | None = None) -> MagicMock:
+    """Return a hass mock writing into tmp_path and holding ``entries``."""
+    hass = MagicMock()
+    hass.config.path.side_effect = lambda name: str(tmp_path / name)
+    hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *a: func(*a))
+    entries = entries or []
+    hass.config_entries.async_entries.return_value = entries
+    hass.config_entries.async_get_entry.side_effect = lambda entry_id: next(
+        (entry for entry in entries if entry.entry_id == entry_id), None
+    )
+    return hass
+
+
+def _entry(entry_id: str, state: ConfigEntryState = ConfigEntryState.LOADED):
+    entry = MagicMock(entry_id=entry_id, domain=DOMAIN, state=state)
+    entry.title = entry_id
+    entry.runtime_data.client.profiler = None
+    return entry
+
+
+def _call(**data) -> MagicMock:
+    return MagicMock(data=data)
+
+
+def test_services_are_admin_only():
+    """Every service is registered for admin users only."""
+    hass = MagicMock()
+    with patch(
+        "custom_components.gree_versati.services.async_register_admin_service"
+    ) as register:
+        async_setup_services(hass)
+
+    assert {call.args[2] for call in register.call_args_list} == {
+        "trace",
+        "profile",
+        "watch_loop",
+        "capture",
+    }
+    for call in register.call_args_list:
+        assert call.args[:2] == (hass, DOMAIN)
+        assert call.kwargs["supports_response"] is SupportsResponse.OPTIONAL
+    hass.services.async_register.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_trace_runs_once_and_writes_on_finish(tmp_path):
+    """One trace at a time; the timer closes it into the reported file."""
+    hass = _hass(tmp_path)
+    with patch("custom_components.gree_versati.services.async_call_later") as later:
+        result = await _async_trace(hass, _call(duration=5))
+
+        assert tracing.tracing_active()
+        with pytest.raises(ServiceValidationError) as err:
+            await _async_trace(hass, _call(duration=5))
+        assert err.value.translation_key == "trace_running"
+
+    (_, delay, finish), _ = later.call_args
+    assert delay == 5
+    with tracing.span("poll"):
+        pass
+    await finish(None)
+
+    assert not tracing.tracing_active()
+    assert Path(result["path"]).parent == tmp_path
+    assert "poll" in Path(result["path"]).read_text()
+
+
+@pytest.mark.asyncio
+async def test_profile_writes_the_files_it_reports(tmp_path):
+    """After the requested cycles the profile is written in the background."""
+    entry = _entry("unit")
+    hass = _hass(tmp_path, [entry])
+    client = entry.runtime_data.client
+
+    result = await _async_profile(
+        hass, _call(config_entry_id="unit", cycles=1, mode="cprofile")
+    )
+    assert isinstance(client.profiler, CycleProfiler)
+    with client.profiler.cycle("poll"):
+        sum(range(1000))
+
+    assert client.profiler is None
+    (_, write, _), _ = entry.async_create_background_task.call_args
+    await write
+    assert all(Path(path).exists() for path in result["files"])
+
+
+@pytest.mark.asyncio
+async def test_profile_allows_one_unit_at_a_time(tmp_path):
+    """A second unit cannot be profiled while the first one is."""
+    first, second = _entry("first"), _entry("second")
+    hass = _hass(tmp_path, [first, second])
+    await _async_profile(
+        hass, _call(config_entry_id="first", cycles=1, mode="tracemalloc")
+    )
+
+    with pytest.raises(ServiceValidationError) as err:
+        await _async_profile(
+            hass, _call(config_entry_id="second", cycles=1, mode="cprofile")
+        )
+    assert err.value.translation_key == "profile_running"
+    assert second.runtime_data.client.profiler is None
+
+
+@pytest.mark.asyncio
+async def test_profile_needs_a_loaded_entry(tmp_path):
+    """Unknown and unloaded entries are refused."""
+    hass = _hass(tmp_path, [_entry("retrying", ConfigEntryState.SETUP_RETRY)])
+
+    for entry_id in ("retrying", "missing"):
+        with pytest.raises(ServiceValidationError) as err:
+            await _async_profile(
+                hass, _call(config_entry_id=entry_id, cycles=1, mode="cprofile")
+            )
+        assert err.value.translation_key == "entry_not_loaded"
+
+
+@pytest.mark.asyncio
+async def test_watch_loop_returns_counters_and_stops_at_zero(tmp_path):
+    """Each call returns the counters so far; threshold 0 stops watching."""
+    hass = _hass(tmp_path)
+
+    assert await _async_watch_loop(hass, _call(threshold=50)) == {"steps": {}}
+    with stalls.watch("decode"):
+        pass
+    result = await _async_watch_loop(hass, _call(threshold=0))
+
+    assert result["steps"]["decode"]["count"] == 1
+    assert stalls.watch_stats() is None
+
+
+@pytest.mark.asyncio
+async def test_capture_runs_once_and_writes_on_finish(tmp_path):
+    """One capture at a time; the timer closes it into the reported file."""
+    hass = _hass(tmp_path)
+    with patch("custom_components.gree_versati.services.async_call_later") as later:
+        result = await _async_capture(hass, _call(duration=60, include_packs=False))
+
+        with pytest.raises(ServiceValidationError) as err:
+            await _async_capture(hass, _call(duration=60, include_packs=False))
+        assert err.value.translation_key == "capture_running"
+
+    capture.record_datagram("out", ("192.168.1.20", 7000), b"{}")
+    (_, _, finish), _ = later.call_args
+    await finish(None)
+
+    assert not capture.capture_active()
+    (record,) = capture.read_capture(Path(result["path"]))
+    assert record[1:5] == ("out", "192.168.1.20", 7000, "datagram")
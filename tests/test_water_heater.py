@@ -183,7 +183,7 @@ class TestGreeVersatiWaterHeater:
 
         # Create a mock client and wire it via runtime_data
         client = MagicMock()
-        client.set_dhw_temperature = AsyncMock()
+        client.set_dhw_temperature = AsyncMock(return_value=True)
         runtime_data = MagicMock()
         runtime_data.client = client
         coordinator.config_entry.runtime_data = runtime_data
@@ -211,7 +211,7 @@ class TestGreeVersatiWaterHeater:
 
         # Create a mock client and wire it via runtime_data
         client = MagicMock()
-        client.set_dhw_temperature = AsyncMock()
+        client.set_dhw_temperature = AsyncMock(return_value=True)
         runtime_data = MagicMock()
         runtime_data.client = client
         coordinator.config_entry.runtime_data = runtime_data
@@ -236,8 +236,10 @@ class TestGreeVersatiWaterHeater:
 
         # Create a mock client and wire it via runtime_data
         client = MagicMock()
-        client.set_device_mode = AsyncMock()
-        client.set_dhw_mode = AsyncMock()
+        client.transaction = MagicMock()
+        client.transaction.return_value.__aenter__.return_value = MagicMock(
+            journaled=False
+        )
         runtime_data = MagicMock()
         runtime_data.client = client
         coordinator.config_entry.runtime_data = runtime_data
@@ -249,16 +251,37 @@ class TestGreeVersatiWaterHeater:
         await water_heater.async_set_operation_mode("performance")
 
         # Verify combined mode call: power off + performance => hot_water
-        client.set_device_mode.assert_awaited_once_with("hot_water")
+        transaction = client.transaction.return_value.__aenter__.return_value
+        transaction.set_device_mode.assert_called_once_with("hot_water")
 
-        # Performance additionally sets the FastHtWter boost flag
-        client.set_dhw_mode.assert_awaited_once_with("performance")
+        # Performance additionally sets the FastHtWter boost flag, in the
+        # same transaction
+        transaction.set_dhw_mode.assert_called_once_with("performance")
 
         # Expected state is published optimistically instead of polling
         coordinator.async_apply_optimistic_device_mode.assert_called_once_with(
             "hot_water", fast_heat_water=True
         )
 
+    @pytest.mark.asyncio
+    async def test_held_operation_mode_publishes_nothing(self):
+        """A mode change held for replay leaves the coordinator state alone."""
+        coordinator = MagicMock()
+        coordinator.config_entry.entry_id = "test_entry_id"
+        coordinator.data = {"power": False, "mode": 4}
+
+        client = MagicMock()
+        client.transaction.return_value.__aenter__.return_value = MagicMock(
+            journaled=True
+        )
+        coordinator.config_entry.runtime_data.client = client
+
+        water_heater = GreeVersatiWaterHeater(coordinator)
+        await water_heater.async_set_operation_mode("performance")
+
+        # No optimistic state, backoff reset, recover refresh or settle
+        coordinator.async_apply_optimistic_device_mode.assert_not_called()
+
     def test_min_temp(self):
         """Test min_temp property."""
         # Create a mock coordinator
@@ -339,7 +362,7 @@ class TestGreeVersatiWaterHeater:
         coordinator.config_entry.options = {"dhw_temp_max": 65}
 
         client = MagicMock()
-        client.set_dhw_temperature = AsyncMock()
+        client.set_dhw_temperature = AsyncMock(return_value=True)
         runtime_data = MagicMock()
         runtime_data.client = client
         coordinator.config_entry.runtime_data = runtime_data